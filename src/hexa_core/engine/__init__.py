@@ -4,7 +4,20 @@ __all__ = [
     "datatypes",
     "components",
     "world",
+    "storage",
+    "command_buffer",
+    "snapshot",
+    "serialization",
     "event_bus",
+    "events",
+    "event_queue",
+    "async_event_bus",
+    "journal",
     "script_runner",
     "benchmarking",
+    "simulation",
+    "tournament",
+    "replay",
+    "state_hash",
+    "instrumentation",
 ]
@@ -0,0 +1,249 @@
+"""asyncio-aware event bus with coroutine subscribers.
+
+``AsyncEventBus`` is a drop-in ``EventBus``: systems keep calling ``publish``
+synchronously, synchronous subscribers run inline as before, and coroutine
+subscribers registered with ``subscribe_async`` receive events from bounded
+per-subscriber buffers drained by worker tasks on the running loop::
+
+    async with AsyncEventBus() as bus:
+        bus.subscribe_async(TURN_READY, stream_to_observers, concurrency=4)
+        world = GameWorld(event_bus=bus)
+        world.process()
+        tick = bus.advance_tick()
+        await bus.wait_for_tick(tick)  # every event from that tick has been handled
+
+The bus, its publishers and its subscribers must all live on the loop's thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import Self
+
+from hexa_core.engine.event_bus import EventBus, Payload, topic_matches
+from hexa_core.engine.events import EventRecord
+
+AsyncSubscriber = Callable[[str, Payload], Awaitable[None]]
+
+
+class AsyncSubscription:
+    """A coroutine subscriber with its own bounded buffer and worker tasks.
+
+    ``event_type`` may be a wildcard pattern; handlers receive the channel each
+    event was published on.
+    """
+
+    __slots__ = ("event_type", "handler", "concurrency", "capacity", "delivered", "dropped", "_items", "_ready", "_space", "_workers")
+
+    def __init__(self: Self, event_type: str, handler: AsyncSubscriber, concurrency: int, capacity: int) -> None:
+        self.event_type = event_type
+        self.handler = handler
+        self.concurrency = concurrency
+        self.capacity = capacity
+        self.delivered = 0
+        self.dropped = 0
+        self._items: deque[tuple[str, Payload, int]] = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._workers: list[asyncio.Task[None]] = []
+
+    def __len__(self: Self) -> int:
+        return len(self._items)
+
+
+class AsyncEventBus(EventBus):
+    """``EventBus`` whose coroutine subscribers never block ``publish`` or the tick.
+
+    Each async subscriber buffers up to ``capacity`` events; when the buffer is
+    full ``publish`` drops that subscriber's oldest event (counted in
+    ``dropped``), while ``apublish`` waits for room instead. With
+    ``concurrency=1`` a subscriber sees its events in publish order. Exceptions
+    raised by subscribers are collected in ``errors`` rather than propagated.
+    Async subscriptions accept the same wildcard patterns as ``subscribe`` and
+    are resolved into a per-channel dispatch cache the same way.
+    """
+
+    def __init__(self: Self, *, max_errors: int = 100) -> None:
+        super().__init__()
+        self.tick = 0
+        self.errors: deque[BaseException] = deque(maxlen=max_errors)
+        self._async_subscribers: dict[str, list[AsyncSubscription]] = {}
+        self._async_dispatch: dict[str, tuple[AsyncSubscription, ...]] = {}
+        self._outstanding: Counter[int] = Counter()
+        self._tick_waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._started = False
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    async def __aenter__(self: Self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def start(self: Self) -> None:
+        """Spawn worker tasks on the running loop for every async subscriber."""
+        self._started = True
+        for subscriptions in self._async_subscribers.values():
+            for subscription in subscriptions:
+                self._spawn_workers(subscription)
+
+    async def aclose(self: Self) -> None:
+        """Cancel worker tasks and discard undelivered events as dropped.
+
+        Every tick they belonged to is settled, so ``wait_for_tick`` on a closed
+        tick returns instead of waiting for events that will never be handled.
+        """
+        self._started = False
+        workers = [worker for subscriptions in self._async_subscribers.values() for subscription in subscriptions for worker in subscription._workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for subscriptions in self._async_subscribers.values():
+            for subscription in subscriptions:
+                subscription._workers.clear()
+                subscription.dropped += len(subscription._items)
+                subscription._items.clear()
+        self._outstanding.clear()
+        self._wake_waiters()
+
+    def _spawn_workers(self: Self, subscription: AsyncSubscription) -> None:
+        while len(subscription._workers) < subscription.concurrency:
+            subscription._workers.append(asyncio.get_running_loop().create_task(self._work(subscription)))
+
+    # -- Subscription and publication ----------------------------------------
+
+    def subscribe_async(self: Self, event_type: str, handler: AsyncSubscriber, *, concurrency: int = 1, capacity: int = 1024) -> AsyncSubscription:
+        """Register a coroutine subscriber served by ``concurrency`` worker tasks."""
+        if concurrency < 1 or capacity < 1:
+            raise ValueError("Async subscribers need a positive concurrency and capacity")
+        subscription = AsyncSubscription(event_type, handler, concurrency, capacity)
+        self._async_subscribers.setdefault(event_type, []).append(subscription)
+        self._subscriptions_changed(event_type)
+        if self._started:
+            self._spawn_workers(subscription)
+        return subscription
+
+    def async_subscribers(self: Self, event_type: str) -> tuple[AsyncSubscription, ...]:
+        """Return async subscriptions registered for ``event_type`` (a channel or pattern)."""
+        return tuple(self._async_subscribers.get(event_type, ()))
+
+    def async_dispatch_for(self: Self, channel: str) -> tuple[AsyncSubscription, ...]:
+        """Return every async subscription a publish on ``channel`` reaches, including pattern matches."""
+        subscriptions = self._async_dispatch.get(channel)
+        return self._resolve_async(channel) if subscriptions is None else subscriptions
+
+    def _subscriptions_changed(self: Self, event_type: str) -> None:
+        super()._subscriptions_changed(event_type)
+        self._async_dispatch.clear()
+
+    def _resolve_async(self: Self, channel: str) -> tuple[AsyncSubscription, ...]:
+        subscriptions = [*self._async_subscribers.get(channel, ())]
+        for pattern in self._patterns:
+            if topic_matches(pattern, channel):
+                subscriptions.extend(self._async_subscribers.get(pattern, ()))
+        entry = self._async_dispatch[channel] = tuple(subscriptions)
+        return entry
+
+    def publish(self: Self, event_type: str, payload: Payload) -> None:
+        """Notify synchronous subscribers and buffer the event for async ones."""
+        super().publish(event_type, payload)
+        subscriptions = self._async_dispatch.get(event_type)
+        if subscriptions is None:
+            subscriptions = self._resolve_async(event_type)
+        if not subscriptions:
+            return
+        if isinstance(payload, EventRecord):
+            # Pooled records are reused on the publisher's next pass.
+            payload = payload.copy()
+        tick = self.tick
+        for subscription in subscriptions:
+            items = subscription._items
+            if len(items) >= subscription.capacity:
+                _, _, dropped_tick = items.popleft()
+                subscription.dropped += 1
+                self._settle(dropped_tick)
+            items.append((event_type, payload, tick))
+            self._outstanding[tick] += 1
+            subscription._ready.set()
+
+    async def apublish(self: Self, event_type: str, payload: Payload) -> None:
+        """Publish once every async subscriber of ``event_type`` has buffer room."""
+        for subscription in self.async_dispatch_for(event_type):
+            while len(subscription._items) >= subscription.capacity:
+                subscription._space.clear()
+                await subscription._space.wait()
+        self.publish(event_type, payload)
+
+    async def _work(self: Self, subscription: AsyncSubscription) -> None:
+        items = subscription._items
+        while True:
+            if not items:
+                subscription._ready.clear()
+                await subscription._ready.wait()
+                continue
+            channel, payload, tick = items.popleft()
+            subscription._space.set()
+            try:
+                await subscription.handler(channel, payload)
+            except asyncio.CancelledError:
+                # A cancelled handler did not deliver its event.
+                subscription.dropped += 1
+                self._settle(tick)
+                if asyncio.current_task().cancelling():  # type: ignore[union-attr]
+                    raise
+                continue
+            except Exception as exc:  # noqa: BLE001 - subscriber failures must not stop delivery
+                self.errors.append(exc)
+            subscription.delivered += 1
+            self._settle(tick)
+
+    # -- Tick tracking -------------------------------------------------------
+
+    def advance_tick(self: Self) -> int:
+        """Close the current tick and return its number; later events belong to the next tick."""
+        closed = self.tick
+        self.tick += 1
+        self._wake_waiters()
+        return closed
+
+    async def wait_for_tick(self: Self, tick: int) -> None:
+        """Wait until ``tick`` is closed and every event published up to it has been handled or dropped."""
+        if self._tick_settled(tick):
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._tick_waiters.append((tick, waiter))
+        await waiter
+
+    def _tick_settled(self: Self, tick: int) -> bool:
+        return self.tick > tick and not any(pending <= tick for pending in self._outstanding)
+
+    def _settle(self: Self, tick: int) -> None:
+        remaining = self._outstanding[tick] - 1
+        if remaining:
+            self._outstanding[tick] = remaining
+            return
+        del self._outstanding[tick]
+        self._wake_waiters()
+
+    def _wake_waiters(self: Self) -> None:
+        if not self._tick_waiters:
+            return
+        waiting = []
+        for tick, waiter in self._tick_waiters:
+            if waiter.done():
+                continue
+            if self._tick_settled(tick):
+                waiter.set_result(None)
+            else:
+                waiting.append((tick, waiter))
+        self._tick_waiters = waiting
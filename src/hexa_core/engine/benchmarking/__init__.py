@@ -0,0 +1,229 @@
+"""Utilities for registering and executing engine benchmarks."""
+
+from __future__ import annotations
+
+import itertools
+import statistics
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Self, overload
+
+BenchmarkCallable = Callable[[], object]
+BenchmarkRunner = Callable[[BenchmarkCallable], object]
+Timer = Callable[[], float]
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkSpec:
+    """A registered benchmark and its metadata.
+
+    ``func`` takes no arguments; for parameter sweeps it is the registered
+    callable bound to ``params``. ``budget`` is the allowed wall time per call in
+    seconds and ``memory_budget`` the bytes its result may keep allocated.
+    """
+
+    name: str
+    func: BenchmarkCallable
+    tags: frozenset[str] = frozenset()
+    budget: float | None = None
+    params: Mapping[str, object] = field(default_factory=dict)
+    warmup: int = 0
+    rounds: int = 1
+    memory_budget: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetResult:
+    name: str
+    budget: float
+    seconds: float
+
+    @property
+    def exceeded(self: Self) -> bool:
+        return self.seconds > self.budget
+
+    def describe(self: Self) -> str:
+        verdict = "OVER" if self.exceeded else "ok"
+        return f"{verdict:>4}  {self.name}: {self.seconds * 1000:.1f} ms / {self.budget * 1000:.1f} ms budget ({self.seconds / self.budget:.2f}x)"
+
+
+class BudgetExceededError(AssertionError):
+    """Raised by ``BenchmarkRegistry.check_budgets`` when a benchmark runs over budget."""
+
+    def __init__(self: Self, results: Sequence[BudgetResult]) -> None:
+        over = [result for result in results if result.exceeded]
+        lines = [f"{len(over)} of {len(results)} benchmarks exceeded their budget on this machine:"]
+        lines.extend(f"  {result.describe()}" for result in results)
+        super().__init__("\n".join(lines))
+        self.results = tuple(results)
+
+
+def measure(spec: BenchmarkSpec, timer: Timer = time.perf_counter) -> list[float]:
+    """Run ``spec.warmup`` untimed calls, then return the duration of each of ``spec.rounds`` calls."""
+    for _ in range(spec.warmup):
+        spec.func()
+    durations: list[float] = []
+    for _ in range(spec.rounds):
+        start = timer()
+        spec.func()
+        durations.append(timer() - start)
+    return durations
+
+
+def _sweep(name: str, params: Mapping[str, Sequence[object]] | None) -> list[tuple[str, dict[str, object]]]:
+    """Expand a parameter sweep into ``(variant name, kwargs)`` pairs, one per combination."""
+    if not params:
+        return [(name, {})]
+    keys = list(params)
+    variants = []
+    for values in itertools.product(*(params[key] for key in keys)):
+        bound = dict(zip(keys, values, strict=True))
+        variants.append((f"{name}[{','.join(f'{key}={value}' for key, value in bound.items())}]", bound))
+    return variants
+
+
+def _check_options(budget: float | None, warmup: int, rounds: int, memory_budget: int | None) -> None:
+    if budget is not None and budget <= 0:
+        raise ValueError("Benchmark budget must be positive.")
+    if memory_budget is not None and memory_budget <= 0:
+        raise ValueError("Benchmark memory budget must be positive.")
+    if warmup < 0 or rounds < 1:
+        raise ValueError("Benchmarks need a non-negative warmup and at least one round.")
+
+
+class BenchmarkRegistry:
+    """Registry of named benchmark callables and their metadata."""
+
+    def __init__(self: Self) -> None:
+        self._benchmarks: dict[str, BenchmarkSpec] = {}
+
+    @overload
+    def register(
+        self: Self,
+        name: str,
+        func: Callable[..., object],
+        *,
+        tags: Iterable[str] = (),
+        budget: float | None = None,
+        params: Mapping[str, Sequence[object]] | None = None,
+        warmup: int = 0,
+        rounds: int = 1,
+        memory_budget: int | None = None,
+    ) -> Callable[..., object]: ...
+
+    @overload
+    def register(
+        self: Self,
+        name: str,
+        *,
+        tags: Iterable[str] = (),
+        budget: float | None = None,
+        params: Mapping[str, Sequence[object]] | None = None,
+        warmup: int = 0,
+        rounds: int = 1,
+        memory_budget: int | None = None,
+    ) -> Callable[[Callable[..., object]], Callable[..., object]]: ...
+
+    def register(
+        self: Self,
+        name: str | None = None,
+        func: Callable[..., object] | None = None,
+        *,
+        tags: Iterable[str] = (),
+        budget: float | None = None,
+        params: Mapping[str, Sequence[object]] | None = None,
+        warmup: int = 0,
+        rounds: int = 1,
+        memory_budget: int | None = None,
+    ) -> Callable[..., object] | Callable[[Callable[..., object]], Callable[..., object]]:
+        """Register ``func`` under ``name``.
+
+        Can be used either as ``register("name", func)`` or ``@register("name")``.
+        ``params`` maps keyword arguments to the values to sweep: every combination
+        is registered as ``name[key=value,...]`` with ``func`` bound to it.
+        """
+        _check_options(budget, warmup, rounds, memory_budget)
+        tag_set = frozenset(tags)
+
+        def _perform_registration(target_name: str, target_func: Callable[..., object]) -> Callable[..., object]:
+            variants = _sweep(target_name, params)
+            for variant_name, _ in variants:
+                if variant_name in self._benchmarks:
+                    raise ValueError(f"Benchmark '{variant_name}' is already registered.")
+            for variant_name, bound in variants:
+                bound_func: BenchmarkCallable = target_func
+                if bound:
+                    bound_func = partial(target_func, **bound)
+                self._benchmarks[variant_name] = BenchmarkSpec(variant_name, bound_func, tag_set, budget, bound, warmup, rounds, memory_budget)
+            return target_func
+
+        if func is not None:
+            if name is None:
+                raise ValueError("Benchmark name must be provided when registering directly.")
+            return _perform_registration(name, func)
+
+        if name is None:
+            raise ValueError("Benchmark name must be provided for decorator usage.")
+
+        def decorator(target: Callable[..., object]) -> Callable[..., object]:
+            return _perform_registration(name, target)
+
+        return decorator
+
+    def get(self: Self, name: str) -> BenchmarkCallable:
+        """Return the function associated with ``name``."""
+        return self._benchmarks[name].func
+
+    def spec(self: Self, name: str) -> BenchmarkSpec:
+        """Return ``name``'s callable together with its metadata."""
+        return self._benchmarks[name]
+
+    @property
+    def names(self: Self) -> tuple[str, ...]:
+        """Expose registered benchmark names in insertion order."""
+        return tuple(self._benchmarks.keys())
+
+    def select(self: Self, tags: Iterable[str] | None = None) -> tuple[str, ...]:
+        """Return the names of benchmarks carrying any of ``tags`` (all when ``None``)."""
+        if tags is None:
+            return self.names
+        wanted = frozenset(tags)
+        return tuple(name for name, spec in self._benchmarks.items() if spec.tags & wanted)
+
+    def run_all(self: Self, runner: BenchmarkRunner | None = None, *, tags: Iterable[str] | None = None) -> dict[str, object]:
+        """Execute every registered benchmark (or those carrying any of ``tags``) via ``runner``.
+
+        Without a runner each benchmark is called ``warmup`` times and then
+        ``rounds`` times, returning the last result.
+        """
+        results: dict[str, object] = {}
+        for name in self.select(tags):
+            spec = self._benchmarks[name]
+            if runner is not None:
+                results[name] = runner(spec.func)
+                continue
+            for _ in range(spec.warmup + spec.rounds - 1):
+                spec.func()
+            results[name] = spec.func()
+        return results
+
+    def run_with_pytest_codspeed(self: Self, benchmark: BenchmarkRunner, *, tags: Iterable[str] | None = None) -> dict[str, object]:
+        """Execute benchmarks using a ``pytest-codspeed`` style callable."""
+        return self.run_all(benchmark, tags=tags)
+
+    def check_budgets(self: Self, *, tags: Iterable[str] | None = None, timer: Timer = time.perf_counter) -> list[BudgetResult]:
+        """Time every selected benchmark that has a budget and return the results.
+
+        Each benchmark's median round is compared to its budget; if any runs over,
+        ``BudgetExceededError`` is raised with a report of all of them.
+        """
+        results = []
+        for name in self.select(tags):
+            spec = self._benchmarks[name]
+            if spec.budget is not None:
+                results.append(BudgetResult(name, spec.budget, statistics.median(measure(spec, timer))))
+        if any(result.exceeded for result in results):
+            raise BudgetExceededError(results)
+        return results
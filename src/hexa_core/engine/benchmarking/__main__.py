@@ -0,0 +1,98 @@
+"""Command-line benchmark runner: ``python -m hexa_core.engine.benchmarking``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from hexa_core.engine.benchmarking import BudgetExceededError, BudgetResult
+from hexa_core.engine.benchmarking.history import DEFAULT_STORE, ResultStore
+from hexa_core.engine.benchmarking.memory import MemoryBudgetExceededError, check_memory_budgets, run_memory_benchmarks, write_memory
+from hexa_core.engine.benchmarking.profiling import PROFILERS, run_profiles, save_profiles
+from hexa_core.engine.benchmarking.runner import BenchmarkReport, discover, run_benchmarks
+from hexa_core.engine.benchmarking.scaling import scaling_fits, write_scaling
+
+DEFAULT_TARGET = "tests/benchmarks"
+DEFAULT_PROFILE_DIR = DEFAULT_STORE / "profiles"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m hexa_core.engine.benchmarking", description="Time registered benchmark scenarios on this machine.")
+    parser.add_argument("targets", nargs="*", default=[DEFAULT_TARGET], help="Benchmark modules, files or directories (default: %(default)s).")
+    parser.add_argument("--tag", action="append", dest="tags", help="Only run benchmarks carrying this tag; repeatable.")
+    parser.add_argument("-k", "--match", help="Only run benchmarks whose name contains this substring.")
+    parser.add_argument("--warmup", type=int, help="Untimed calls before measuring (default: registered value, at least 1).")
+    parser.add_argument("--rounds", type=int, help="Timed calls per benchmark (default: registered value, at least 10).")
+    parser.add_argument("--memory", action="store_true", help="Also measure peak and retained bytes and peak RSS of each selected benchmark.")
+    parser.add_argument("--profile", choices=PROFILERS, help="Also profile each selected benchmark and write collapsed stacks next to the results.")
+    parser.add_argument("--profile-dir", type=Path, help="Directory for collapsed-stack profiles (default: next to --output or the saved results).")
+    parser.add_argument("--no-calibration", action="store_true", help="Skip the machine calibration baseline.")
+    parser.add_argument("--format", choices=("table", "json", "csv"), default="table")
+    parser.add_argument("--output", type=Path, help="Write results here instead of stdout.")
+    parser.add_argument("--save", action="store_true", help="Also keep the results in the result store for later comparisons.")
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE, help="Result store directory (default: %(default)s).")
+    parser.add_argument("--commit", help="Key to save the results under (default: the current git commit).")
+    parser.add_argument("--max-slope", type=float, help="Fail when a parameter sweep grows faster than this log-log slope.")
+    args = parser.parse_args(argv)
+
+    registries = discover(args.targets)
+    report = run_benchmarks(
+        registries,
+        tags=args.tags,
+        match=args.match,
+        warmup=args.warmup,
+        rounds=args.rounds,
+        calibrated=not args.no_calibration,
+    )
+    if args.memory:
+        report.memory = run_memory_benchmarks(registries, tags=args.tags, match=args.match, rss=True)
+    saved = ResultStore(args.store).save(report, args.commit) if args.save else None
+    if saved is not None:
+        sys.stderr.write(f"Saved results for {report.commit} to {saved}\n")
+    if args.profile:
+        directory = _profile_dir(args.profile_dir, saved, args.output)
+        profiles = run_profiles(registries, tags=args.tags, match=args.match, mode=args.profile, rounds=args.rounds)
+        sys.stderr.write(f"Wrote {len(save_profiles(profiles, directory))} {args.profile} profile(s) to {directory}\n")
+    writer = {"table": report.write_table, "json": report.write_json, "csv": report.write_csv}[args.format]
+    fits = scaling_fits(report.results)
+    if args.output is None:
+        writer(sys.stdout)
+    else:
+        with args.output.open("w", encoding="utf-8", newline="") as stream:
+            writer(stream)
+    if args.format == "table" or args.output is not None:
+        write_scaling(fits, sys.stdout)
+        write_memory(report.memory, sys.stdout)
+
+    steep = [fit for fit in fits if args.max_slope is not None and fit.slope > args.max_slope]
+    for fit in steep:
+        sys.stderr.write(f"{fit.benchmark} grows with {fit.param} at slope {fit.slope:.2f} > {args.max_slope}\n")
+    violations = _budget_violations(report)
+    for violation in violations:
+        sys.stderr.write(f"{violation}\n")
+    return 1 if steep or violations else 0
+
+
+def _budget_violations(report: BenchmarkReport) -> list[str]:
+    """Report every time budget the median round and every memory budget the retained bytes went over."""
+    timed = [BudgetResult(result.name, result.budget, result.median) for result in report.results if result.budget is not None]
+    violations = [str(BudgetExceededError(timed))] if any(result.exceeded for result in timed) else []
+    try:
+        check_memory_budgets(report.memory)
+    except MemoryBudgetExceededError as error:
+        violations.append(str(error))
+    return violations
+
+
+def _profile_dir(requested: Path | None, saved: Path | None, output: Path | None) -> Path:
+    """``--profile-dir``, else a directory named after the saved results or ``--output`` file."""
+    if requested is not None:
+        return requested
+    results = saved or output
+    return DEFAULT_PROFILE_DIR if results is None else results.with_name(f"{results.stem}.profiles")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
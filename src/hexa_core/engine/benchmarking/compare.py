@@ -0,0 +1,164 @@
+"""Flag statistically significant changes between two benchmark runs.
+
+``python -m hexa_core.engine.benchmarking.compare BASELINE [CANDIDATE]`` exits
+with status 1 when any benchmark regressed. Runs are commits saved in the
+result store for this machine, or paths to JSON reports.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Final, Self
+
+from hexa_core.engine.benchmarking.history import DEFAULT_STORE, ResultStore, resolve_commit
+from hexa_core.engine.benchmarking.runner import BenchmarkReport, machine_info
+
+DEFAULT_ALPHA: Final = 0.05
+DEFAULT_THRESHOLD: Final = 0.05  # relative change of the median that counts as a regression
+
+REGRESSION: Final = "regression"
+IMPROVEMENT: Final = "improvement"
+UNCHANGED: Final = "unchanged"
+
+
+def mann_whitney_u(first: Sequence[float], second: Sequence[float]) -> tuple[float, float]:
+    """Two-sided Mann-Whitney U test of ``first`` against ``second``.
+
+    Returns ``(U of first, p-value)`` from the normal approximation with tie and
+    continuity corrections, which holds up from about eight samples per side.
+    """
+    sizes = len(first), len(second)
+    total = sum(sizes)
+    if min(sizes) == 0:
+        return 0.0, 1.0
+    pooled = sorted([(value, 0) for value in first] + [(value, 1) for value in second])
+
+    rank_sum = 0.0
+    ties = 0.0
+    start = 0
+    while start < total:
+        end = start
+        while end + 1 < total and pooled[end + 1][0] == pooled[start][0]:
+            end += 1
+        # Tied values share the average of the ranks they span.
+        rank = (start + end) / 2 + 1
+        count = end - start + 1
+        rank_sum += rank * sum(1 for _, group in pooled[start : end + 1] if group == 0)
+        ties += count**3 - count
+        start = end + 1
+
+    u_first = rank_sum - sizes[0] * (sizes[0] + 1) / 2
+    mean = sizes[0] * sizes[1] / 2
+    variance = sizes[0] * sizes[1] / 12 * ((total + 1) - ties / (total * (total - 1)))
+    if variance <= 0:
+        return u_first, 1.0
+    z = max(abs(u_first - mean) - 0.5, 0.0) / math.sqrt(variance)
+    return u_first, math.erfc(z / math.sqrt(2))
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    name: str
+    baseline_median: float
+    candidate_median: float
+    p_value: float | None
+    verdict: str
+    unit: str = "s"
+
+    @property
+    def ratio(self: Self) -> float:
+        return self.candidate_median / self.baseline_median if self.baseline_median else math.inf
+
+
+def compare_reports(baseline: BenchmarkReport, candidate: BenchmarkReport, *, alpha: float = DEFAULT_ALPHA, threshold: float = DEFAULT_THRESHOLD) -> list[Comparison]:
+    """Compare every benchmark present in both reports.
+
+    A benchmark regressed when its round timings differ significantly (``p <
+    alpha``) and its median grew by more than ``threshold``; improvements are
+    the mirror image. Retained bytes are deterministic, so memory results are
+    compared against ``threshold`` alone and reported with unit ``"B"``.
+    """
+    comparisons = []
+    for result in candidate.results:
+        previous = baseline.result(result.name)
+        if previous is None:
+            continue
+        _, p_value = mann_whitney_u(previous.samples, result.samples)
+        verdict = UNCHANGED
+        if p_value < alpha and result.median > previous.median * (1 + threshold):
+            verdict = REGRESSION
+        elif p_value < alpha and result.median < previous.median * (1 - threshold):
+            verdict = IMPROVEMENT
+        comparisons.append(Comparison(result.name, previous.median, result.median, p_value, verdict))
+    for memory in candidate.memory:
+        previous_memory = baseline.memory_result(memory.name)
+        if previous_memory is not None:
+            comparisons.append(_compare_bytes(memory.name, previous_memory.retained_bytes, memory.retained_bytes, threshold))
+    return comparisons
+
+
+def _compare_bytes(name: str, baseline: int, candidate: int, threshold: float) -> Comparison:
+    verdict = UNCHANGED
+    if candidate > baseline * (1 + threshold):
+        verdict = REGRESSION
+    elif candidate < baseline * (1 - threshold):
+        verdict = IMPROVEMENT
+    return Comparison(name, baseline, candidate, None, verdict, unit="B")
+
+
+def write_comparisons(comparisons: Sequence[Comparison], stream: IO[str]) -> None:
+    width = max((len(comparison.name) for comparison in comparisons), default=4)
+    stream.write(f"{'name':<{width}}  {'base':>12}  {'new':>12}  {'change':>8}  {'p':>7}  verdict\n")
+    for comparison in comparisons:
+        base, new = (_format_amount(value, comparison.unit) for value in (comparison.baseline_median, comparison.candidate_median))
+        p_value = "-" if comparison.p_value is None else f"{comparison.p_value:.4f}"
+        stream.write(f"{comparison.name:<{width}}  {base:>12}  {new:>12}  {comparison.ratio - 1:>+8.1%}  {p_value:>7}  {comparison.verdict}\n")
+
+
+def _format_amount(value: float, unit: str) -> str:
+    return f"{value / 1024:.1f} KiB" if unit == "B" else f"{value * 1000:.3f} ms"
+
+
+def load_run(run: str, store: ResultStore) -> BenchmarkReport:
+    """Load a JSON report path, or the stored results of a commit (or git revision) on this machine."""
+    path = Path(run)
+    if path.suffix == ".json" and path.is_file():
+        return BenchmarkReport.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    machine = machine_info()
+    if run in store.commits(machine):
+        return store.load(run, machine)
+    return store.load(resolve_commit(run) or run, machine)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m hexa_core.engine.benchmarking.compare", description="Flag benchmark regressions between two runs.")
+    parser.add_argument("baseline", help="Commit (or git revision) with stored results, or a JSON report.")
+    parser.add_argument("candidate", nargs="?", default="HEAD", help="Run to check against the baseline (default: %(default)s).")
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE, help="Result store directory (default: %(default)s).")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="Significance level of the Mann-Whitney U test.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative median slowdown that fails the comparison.")
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.store)
+    try:
+        baseline, candidate = load_run(args.baseline, store), load_run(args.candidate, store)
+    except FileNotFoundError as error:
+        sys.stderr.write(f"{error}\n")
+        return 2
+    comparisons = compare_reports(baseline, candidate, alpha=args.alpha, threshold=args.threshold)
+    write_comparisons(comparisons, sys.stdout)
+    regressions = [comparison.name for comparison in comparisons if comparison.verdict == REGRESSION]
+    if regressions:
+        sys.stdout.write(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
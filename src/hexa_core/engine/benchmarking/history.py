@@ -0,0 +1,83 @@
+"""Local store of benchmark reports keyed by machine, Python version and commit.
+
+Layout::
+
+    <root>/<machine fingerprint>/<python tag>/<commit>.json
+
+so runs are only ever looked up next to results from the same hardware and
+interpreter. Saving the same commit twice replaces the earlier report.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+import re
+import subprocess
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Final, Self
+
+from hexa_core.engine.benchmarking.runner import BenchmarkReport
+
+DEFAULT_STORE: Final = Path(".benchmarks")
+UNKNOWN_COMMIT: Final = "unknown"
+
+# Machine details that identify the hardware; the OS release and Python are keyed separately.
+_FINGERPRINT_KEYS: Final = ("node", "system", "machine", "processor", "cpu_count")
+_UNSAFE_KEY: Final = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def machine_fingerprint(machine: Mapping[str, Any]) -> str:
+    """Short stable digest of the hardware described by ``machine_info()``."""
+    identity = json.dumps({key: machine.get(key) for key in _FINGERPRINT_KEYS}, sort_keys=True)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:12]
+
+
+def python_tag(machine: Mapping[str, Any]) -> str:
+    return _UNSAFE_KEY.sub("-", str(machine.get("python", platform.python_version())).lower())
+
+
+def resolve_commit(revision: str = "HEAD", cwd: Path | str | None = None) -> str | None:
+    """Return the short hash git resolves ``revision`` to, or ``None`` outside a repository."""
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", revision], cwd=cwd, capture_output=True, text=True, check=False)  # noqa: S603, S607 - fixed git invocation
+    except OSError:
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip() or None
+
+
+class ResultStore:
+    """Directory of saved ``BenchmarkReport`` JSON files."""
+
+    def __init__(self: Self, root: Path | str = DEFAULT_STORE) -> None:
+        self.root = Path(root)
+
+    def path_for(self: Self, commit: str, machine: Mapping[str, Any]) -> Path:
+        return self.root / machine_fingerprint(machine) / python_tag(machine) / f"{_UNSAFE_KEY.sub('-', commit)}.json"
+
+    def save(self: Self, report: BenchmarkReport, commit: str | None = None) -> Path:
+        """Write ``report`` under ``commit`` (default: its own, else the current git HEAD)."""
+        report.commit = commit or report.commit or resolve_commit() or UNKNOWN_COMMIT
+        path = self.path_for(report.commit, report.machine)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as stream:
+            report.write_json(stream)
+        return path
+
+    def load(self: Self, commit: str, machine: Mapping[str, Any]) -> BenchmarkReport:
+        """Return the report saved for ``commit`` on ``machine`` and its Python version."""
+        path = self.path_for(commit, machine)
+        if not path.is_file():
+            raise FileNotFoundError(f"No benchmark results for commit {commit!r} on this machine in {self.root}")
+        return BenchmarkReport.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+    def commits(self: Self, machine: Mapping[str, Any]) -> list[str]:
+        """Commits with saved results for ``machine``, oldest first."""
+        directory = self.path_for(UNKNOWN_COMMIT, machine).parent
+        if not directory.is_dir():
+            return []
+        return [path.stem for path in sorted(directory.glob("*.json"), key=lambda path: path.stat().st_mtime)]
@@ -0,0 +1,212 @@
+"""Memory-footprint benchmarks and per-component byte accounting.
+
+A memory benchmark is any registered callable: ``measure_memory`` traces its
+allocations with ``tracemalloc`` and reports the peak reached during the call
+and the steady-state bytes still allocated afterwards while its return value is
+alive. Benchmarks that build a world, a level or a buffer should return it.
+With ``rss=True`` the call is repeated in a forked child to measure how far it
+raises the process's peak resident set size, which includes memory that
+``tracemalloc`` cannot see.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import tracemalloc
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import IO, Any, Self
+
+from hexa_core.engine import storage
+from hexa_core.engine.benchmarking import BenchmarkRegistry, BenchmarkSpec
+from hexa_core.engine.world import GameWorld
+
+if sys.platform != "win32":
+    import resource
+
+# Pseudo-components for esper's own bookkeeping in ``component_footprint``.
+ENTITY_TABLE = "<entity table>"
+COMPONENT_INDEX = "<component index>"
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryStats:
+    """Bytes allocated by one benchmark call: its peak and what its result retains."""
+
+    name: str
+    peak_bytes: int
+    retained_bytes: int
+    budget: int | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+    peak_rss_bytes: int | None = None
+
+    @property
+    def exceeded(self: Self) -> bool:
+        return self.budget is not None and self.retained_bytes > self.budget
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentFootprint:
+    component: str
+    count: int
+    bytes: int
+
+    @property
+    def per_instance(self: Self) -> float:
+        return self.bytes / self.count if self.count else 0.0
+
+
+class MemoryBudgetExceededError(AssertionError):
+    """Raised when retained bytes or per-component footprints exceed their budgets."""
+
+    def __init__(self: Self, lines: Sequence[str], over: int) -> None:
+        super().__init__("\n".join([f"{over} of {len(lines)} memory budgets exceeded on this machine:", *(f"  {line}" for line in lines)]))
+        self.over = over
+
+
+def measure_memory(spec: BenchmarkSpec, *, rss: bool = False) -> MemoryStats:
+    """Trace one call of ``spec.func`` and report its peak and retained bytes."""
+    tracing = tracemalloc.is_tracing()
+    gc.collect()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        result = spec.func()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return MemoryStats(spec.name, peak - before, retained - before, spec.memory_budget, dict(spec.params), peak_rss(spec) if rss else None)
+
+
+def _max_rss() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def peak_rss(spec: BenchmarkSpec) -> int | None:
+    """Bytes by which one call of ``spec.func`` raises peak RSS, measured in a forked child.
+
+    A forked child starts with its peak at its current RSS, so the rise is not
+    hidden by earlier benchmarks. Returns ``None`` where ``os.fork`` is
+    unavailable or the call fails.
+    """
+    if sys.platform == "win32" or not hasattr(os, "fork"):
+        return None
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        try:
+            os.close(read_end)
+            gc.collect()
+            before = _max_rss()
+            spec.func()
+            os.write(write_end, str(_max_rss() - before).encode())
+        finally:
+            os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end, "rb") as pipe:
+        reported = pipe.read()
+    os.waitpid(pid, 0)
+    return int(reported) if reported else None
+
+
+def run_memory_benchmarks(registries: Iterable[BenchmarkRegistry], *, tags: Iterable[str] | None = None, match: str | None = None, rss: bool = False) -> list[MemoryStats]:
+    tag_filter = None if tags is None else tuple(tags)
+    return [measure_memory(registry.spec(name), rss=rss) for registry in registries for name in registry.select(tag_filter) if match is None or match in name]
+
+
+def check_memory_budgets(results: Sequence[MemoryStats]) -> list[MemoryStats]:
+    """Raise ``MemoryBudgetExceededError`` if any result retains more than its budget."""
+    budgeted = [result for result in results if result.budget is not None]
+    over = sum(result.exceeded for result in budgeted)
+    if over:
+        lines = [f"{'OVER' if result.exceeded else 'ok':>4}  {result.name}: {result.retained_bytes:,} B retained / {result.budget:,} B budget" for result in budgeted]
+        raise MemoryBudgetExceededError(lines, over)
+    return budgeted
+
+
+def deep_sizeof(value: object, seen: set[int]) -> int:
+    """Bytes owned by ``value`` and the objects it references, counting each object once.
+
+    Objects the interpreter shares (``None``, booleans, small ints, types) and
+    anything already in ``seen`` count as zero.
+    """
+    # CPython caches ints in [-5, 256]; like None, booleans and types they are shared.
+    if value is None or isinstance(value, bool | type) or (isinstance(value, int) and -5 <= value <= 256) or id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(item, seen) for key, item in value.items())
+    elif isinstance(value, list | tuple | set | frozenset):
+        size += sum(deep_sizeof(item, seen) for item in value)
+    elif not isinstance(value, str | bytes | int | float | memoryview):
+        for slot in _slots(type(value)):
+            size += deep_sizeof(getattr(value, slot, None), seen)
+        if hasattr(value, "__dict__"):
+            size += deep_sizeof(vars(value), seen)
+    return size
+
+
+def _slots(cls: type) -> tuple[str, ...]:
+    return tuple(slot for klass in cls.__mro__ for slot in getattr(klass, "__slots__", ()) if slot not in ("__dict__", "__weakref__"))
+
+
+def component_footprint(world: GameWorld) -> list[ComponentFootprint]:
+    """Count instances and deep bytes per component type, largest first.
+
+    esper's entity table and component index are reported as the
+    ``ENTITY_TABLE`` and ``COMPONENT_INDEX`` rows.
+    """
+    seen: set[int] = set()
+    counts: dict[str, int] = {}
+    sizes: dict[str, int] = {}
+    with world._activate_context():
+        entities = storage.entity_table()
+        index = storage.component_index()
+        table_bytes = sys.getsizeof(entities)
+        for components in entities.values():
+            table_bytes += sys.getsizeof(components)
+            for component_type, component in components.items():
+                name = component_type.__name__
+                counts[name] = counts.get(name, 0) + 1
+                sizes[name] = sizes.get(name, 0) + deep_sizeof(component, seen)
+        index_bytes = sys.getsizeof(index) + sum(sys.getsizeof(members) for members in index.values())
+        entity_count = len(entities)
+    rows = [ComponentFootprint(name, counts[name], sizes[name]) for name in counts]
+    rows.append(ComponentFootprint(ENTITY_TABLE, entity_count, table_bytes))
+    rows.append(ComponentFootprint(COMPONENT_INDEX, len(rows) - 1, index_bytes))
+    return sorted(rows, key=lambda row: row.bytes, reverse=True)
+
+
+def check_component_budgets(footprint: Sequence[ComponentFootprint], budgets: Mapping[str, float]) -> None:
+    """Raise ``MemoryBudgetExceededError`` if a component's bytes per instance exceed ``budgets``."""
+    rows = [row for row in footprint if row.component in budgets]
+    over = sum(row.per_instance > budgets[row.component] for row in rows)
+    if over:
+        lines = [f"{'OVER' if row.per_instance > budgets[row.component] else 'ok':>4}  {row.component}: {row.per_instance:.1f} B per instance / {budgets[row.component]:.1f} B budget" for row in rows]
+        raise MemoryBudgetExceededError(lines, over)
+
+
+def write_memory(results: Sequence[MemoryStats], stream: IO[str]) -> None:
+    if not results:
+        return
+    width = max(len(result.name) for result in results)
+    stream.write(f"\n{'memory':<{width}}  {'peak KiB':>12}  {'retained KiB':>12}  {'peak RSS KiB':>12}\n")
+    for result in results:
+        rss = "-" if result.peak_rss_bytes is None else f"{result.peak_rss_bytes / 1024:.1f}"
+        stream.write(f"{result.name:<{width}}  {result.peak_bytes / 1024:>12.1f}  {result.retained_bytes / 1024:>12.1f}  {rss:>12}\n")
+
+
+def write_footprint(footprint: Sequence[ComponentFootprint], stream: IO[str]) -> None:
+    width = max((len(row.component) for row in footprint), default=9)
+    stream.write(f"{'component':<{width}}  {'count':>8}  {'KiB':>10}  {'B each':>8}\n")
+    for row in footprint:
+        stream.write(f"{row.component:<{width}}  {row.count:>8}  {row.bytes / 1024:>10.1f}  {row.per_instance:>8.1f}\n")
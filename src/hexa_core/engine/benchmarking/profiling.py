@@ -0,0 +1,252 @@
+"""Profile registered benchmark scenarios into collapsed stacks.
+
+Each profile is written in the collapsed-stack format used by ``flamegraph.pl``,
+``inferno`` and speedscope: one line per call stack, with frames joined by ``;``
+and followed by a weight. ``cprofile`` mode traces every call deterministically;
+its weights are microseconds of self time. ``sample`` mode reads the
+benchmarking thread's stack every ``interval`` seconds; its weights are sample
+counts.
+
+``python -m hexa_core.engine.benchmarking.profiling BASELINE CANDIDATE`` diffs
+the hot frames of two collapsed profiles of the same scenario.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import pstats
+import re
+import sys
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import IO, Any, Final, Self
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry, BenchmarkSpec
+
+CPROFILE: Final = "cprofile"
+SAMPLE: Final = "sample"
+PROFILERS: Final = (CPROFILE, SAMPLE)
+DEFAULT_INTERVAL: Final = 0.001
+DEFAULT_LIMIT: Final = 20
+SUFFIX: Final = ".folded"
+
+# Stacks whose share of one cProfile call path falls below this many seconds are dropped.
+_MIN_SECONDS = 1e-6
+# cProfile records its own disable() call as a root.
+_PROFILER_FRAME = "_lsprof.Profiler"
+
+
+@dataclass(slots=True)
+class Profile:
+    """Collapsed call stacks of one benchmark scenario."""
+
+    name: str
+    mode: str
+    stacks: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self: Self) -> int:
+        return sum(self.stacks.values())
+
+    def self_weights(self: Self) -> dict[str, int]:
+        """Weight of each frame while it was the innermost one on the stack."""
+        weights: dict[str, int] = {}
+        for stack, weight in self.stacks.items():
+            frame = stack.rsplit(";", 1)[-1]
+            weights[frame] = weights.get(frame, 0) + weight
+        return weights
+
+    def filename(self: Self) -> str:
+        safe_name = re.sub(r"[^\w.=,-]+", "_", self.name).strip("_")
+        return f"{safe_name}.{self.mode}{SUFFIX}"
+
+    def write_collapsed(self: Self, stream: IO[str]) -> None:
+        for stack, weight in sorted(self.stacks.items()):
+            stream.write(f"{stack} {weight}\n")
+
+    @classmethod
+    def read_collapsed(cls: type[Self], path: Path) -> Self:
+        """Load a profile written by ``write_collapsed``; the name and mode come from ``path``."""
+        stem = path.name.removesuffix(SUFFIX)
+        name, _, mode = stem.rpartition(".") if "." in stem else (stem, "", "")
+        stacks: dict[str, int] = {}
+        for line in path.read_text(encoding="utf-8").splitlines():
+            stack, _, weight = line.rpartition(" ")
+            if stack:
+                stacks[stack] = stacks.get(stack, 0) + int(weight)
+        return cls(name, mode, stacks)
+
+
+@dataclass(frozen=True, slots=True)
+class FrameDelta:
+    """One frame's share of self time in a baseline and a candidate profile."""
+
+    frame: str
+    baseline_share: float
+    candidate_share: float
+
+    @property
+    def change(self: Self) -> float:
+        return self.candidate_share - self.baseline_share
+
+
+def _label(filename: str, function: str) -> str:
+    frame = function if filename == "~" else f"{Path(filename).name}:{function}"
+    return frame.replace(";", ",")
+
+
+def _collapse_cprofile(stats: dict[Any, Any]) -> dict[str, int]:
+    """Expand cProfile's caller edges into full stacks.
+
+    cProfile keeps one level of callers, so a function's time is split across
+    the paths leading to it in proportion to each caller edge's cumulative time.
+    """
+    callees: dict[Any, list[Any]] = {}
+    for function, (*_, callers) in stats.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(function)
+
+    stacks: dict[str, float] = {}
+    # (function, path of functions leading to it, fraction of its time spent on that path)
+    pending: list[tuple[Any, tuple[Any, ...], float]] = [(root, (root,), 1.0) for root, (*_, callers) in stats.items() if not callers and _PROFILER_FRAME not in root[2]]
+    while pending:
+        function, path, share = pending.pop()
+        _, _, own, _, _ = stats[function]
+        if own * share >= _MIN_SECONDS:
+            stack = ";".join(_label(filename, name) for filename, _, name in path)
+            stacks[stack] = stacks.get(stack, 0.0) + own * share * 1e6
+        for callee in callees.get(function, ()):
+            *_, callee_total, callee_callers = stats[callee]
+            through = share * callee_callers[function][3]
+            if callee not in path and callee_total > 0 and through >= _MIN_SECONDS:
+                pending.append((callee, (*path, callee), through / callee_total))
+    return {stack: round(weight) for stack, weight in stacks.items() if round(weight) > 0}
+
+
+def _call_rounds(func: Callable[[], object], rounds: int) -> None:
+    # The sampler trims every stack at this frame so only the scenario is recorded.
+    for _ in range(rounds):
+        func()
+
+
+class _Sampler(threading.Thread):
+    def __init__(self: Self, thread_id: int, boundary: CodeType, interval: float) -> None:
+        super().__init__(name="hexa-benchmark-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.boundary = boundary
+        self.interval = interval
+        self.stacks: dict[str, int] = {}
+        self.stopped = threading.Event()
+
+    def run(self: Self) -> None:
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            frames = self._frames(frame)
+            if frames:
+                stack = ";".join(reversed(frames))
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+    def _frames(self: Self, frame: FrameType | None) -> list[str]:
+        frames = []
+        while frame is not None and frame.f_code is not self.boundary:
+            frames.append(_label(frame.f_code.co_filename, frame.f_code.co_name))
+            frame = frame.f_back
+        return frames if frame is not None else []
+
+
+def profile_benchmark(spec: BenchmarkSpec, *, mode: str = CPROFILE, rounds: int | None = None, interval: float = DEFAULT_INTERVAL) -> Profile:
+    """Profile ``rounds`` calls of ``spec.func`` (default: its registered rounds)."""
+    if mode not in PROFILERS:
+        raise ValueError(f"Unknown profiler {mode!r}; expected one of {', '.join(PROFILERS)}")
+    rounds = spec.rounds if rounds is None else rounds
+    if mode == CPROFILE:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            for _ in range(rounds):
+                spec.func()
+        finally:
+            profiler.disable()
+        return Profile(spec.name, mode, _collapse_cprofile(pstats.Stats(profiler).stats))  # type: ignore[attr-defined]
+
+    sampler = _Sampler(threading.get_ident(), _call_rounds.__code__, interval)
+    switch_interval = sys.getswitchinterval()
+    # The sampler only runs when the benchmarking thread releases the GIL, at least once per switch interval.
+    sys.setswitchinterval(min(switch_interval, interval))
+    sampler.start()
+    try:
+        _call_rounds(spec.func, rounds)
+    finally:
+        sampler.stopped.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+    return Profile(spec.name, mode, sampler.stacks)
+
+
+def run_profiles(
+    registries: Iterable[BenchmarkRegistry],
+    *,
+    tags: Iterable[str] | None = None,
+    match: str | None = None,
+    mode: str = CPROFILE,
+    rounds: int | None = None,
+    interval: float = DEFAULT_INTERVAL,
+) -> list[Profile]:
+    tag_filter = None if tags is None else tuple(tags)
+    return [profile_benchmark(registry.spec(name), mode=mode, rounds=rounds, interval=interval) for registry in registries for name in registry.select(tag_filter) if match is None or match in name]
+
+
+def save_profiles(profiles: Iterable[Profile], directory: Path) -> list[Path]:
+    """Write each profile to ``directory/<name>.<mode>.folded``."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for profile in profiles:
+        path = directory / profile.filename()
+        with path.open("w", encoding="utf-8") as stream:
+            profile.write_collapsed(stream)
+        paths.append(path)
+    return paths
+
+
+def diff_profiles(baseline: Profile, candidate: Profile) -> list[FrameDelta]:
+    """Compare each frame's share of total self time, largest shift first.
+
+    Shares rather than raw weights keep profiles of different lengths, round
+    counts or modes comparable.
+    """
+    before, after = baseline.self_weights(), candidate.self_weights()
+    before_total, after_total = baseline.total or 1, candidate.total or 1
+    deltas = [FrameDelta(frame, before.get(frame, 0) / before_total, after.get(frame, 0) / after_total) for frame in before.keys() | after.keys()]
+    return sorted(deltas, key=lambda delta: (-abs(delta.change), delta.frame))
+
+
+def write_frame_deltas(deltas: Sequence[FrameDelta], stream: IO[str], limit: int = DEFAULT_LIMIT) -> None:
+    shown = deltas[:limit]
+    width = max((len(delta.frame) for delta in shown), default=5)
+    stream.write(f"{'frame':<{width}}  {'base':>7}  {'new':>7}  {'change':>8}\n")
+    for delta in shown:
+        stream.write(f"{delta.frame:<{width}}  {delta.baseline_share:>7.1%}  {delta.candidate_share:>7.1%}  {delta.change:>+8.1%}\n")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m hexa_core.engine.benchmarking.profiling", description="Diff the hot frames of two collapsed-stack profiles.")
+    parser.add_argument("baseline", type=Path, help=f"Baseline profile ({SUFFIX}).")
+    parser.add_argument("candidate", type=Path, help=f"Candidate profile ({SUFFIX}).")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Frames to show (default: %(default)s).")
+    args = parser.parse_args(argv)
+
+    try:
+        baseline, candidate = Profile.read_collapsed(args.baseline), Profile.read_collapsed(args.candidate)
+    except FileNotFoundError as error:
+        sys.stderr.write(f"{error}\n")
+        return 2
+    write_frame_deltas(diff_profiles(baseline, candidate), sys.stdout, args.limit)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,248 @@
+"""Standalone statistical benchmark runner, independent of pytest-codspeed.
+
+Each scenario is warmed up, timed over repeated rounds and summarised after
+Tukey outlier rejection. A fixed pure-Python calibration workload is timed on the
+same machine so results can also be compared in machine-independent units.
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass, field, fields, replace
+from pathlib import Path
+from typing import IO, Any, Final, Self
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry, Timer, measure
+from hexa_core.engine.benchmarking.memory import MemoryStats
+
+DEFAULT_ROUNDS: Final = 10
+DEFAULT_WARMUP: Final = 1
+OUTLIER_FENCE: Final = 1.5  # Tukey's fences: samples beyond 1.5 IQR of the quartiles
+CALIBRATION_SIZE: Final = 20_000
+
+
+def reject_outliers(samples: Sequence[float], fence: float = OUTLIER_FENCE) -> tuple[list[float], int]:
+    """Drop samples outside ``fence`` interquartile ranges and return ``(kept, rejected count)``.
+
+    Fewer than four samples are returned unchanged.
+    """
+    if len(samples) < 4:
+        return list(samples), 0
+    lower_quartile, _, upper_quartile = statistics.quantiles(samples, n=4)
+    spread = (upper_quartile - lower_quartile) * fence
+    kept = [sample for sample in samples if lower_quartile - spread <= sample <= upper_quartile + spread]
+    return kept, len(samples) - len(kept)
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Linearly interpolated percentile of ``samples`` (``fraction`` in ``[0, 1]``)."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkStats:
+    """Summary of one benchmark's timed rounds, in seconds.
+
+    ``normalized`` is the median divided by the machine's calibration time, or
+    ``None`` when the run was not calibrated. ``samples`` keeps every round,
+    outliers included, for later comparisons; ``params`` are the sweep values
+    the benchmark was registered with.
+    """
+
+    name: str
+    rounds: int
+    outliers: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+    stddev: float
+    normalized: float | None = None
+    budget: float | None = None
+    samples: tuple[float, ...] = ()
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(cls: type[BenchmarkStats], name: str, samples: Sequence[float], *, calibration: float | None = None, budget: float | None = None, params: Mapping[str, Any] | None = None) -> BenchmarkStats:
+        if not samples:
+            raise ValueError(f"Benchmark {name!r} produced no samples")
+        kept, outliers = reject_outliers(samples)
+        median = statistics.median(kept)
+        return cls(
+            name=name,
+            rounds=len(samples),
+            outliers=outliers,
+            min=min(kept),
+            median=median,
+            p95=percentile(kept, 0.95),
+            mean=statistics.fmean(kept),
+            stddev=statistics.stdev(kept) if len(kept) > 1 else 0.0,
+            normalized=None if not calibration else median / calibration,
+            budget=budget,
+            samples=tuple(samples),
+            params=dict(params or {}),
+        )
+
+
+# Columns of the CSV report; raw samples and params only go into JSON.
+STATS_FIELDS: Final = tuple(stats_field.name for stats_field in fields(BenchmarkStats) if stats_field.name not in ("samples", "params"))
+
+
+def _calibration_workload() -> int:
+    """Fixed mix of the dict, list and integer work typical of the engine's hot loops."""
+    table = {index: index * 7 for index in range(CALIBRATION_SIZE)}
+    ordered = sorted(table.values(), reverse=True)
+    return sum(value for value in ordered if value % 3) + len(table)
+
+
+def calibrate(rounds: int = DEFAULT_ROUNDS, timer: Timer = time.perf_counter) -> float:
+    """Return the median duration of the calibration workload on this machine."""
+    durations = []
+    _calibration_workload()
+    for _ in range(rounds):
+        start = timer()
+        _calibration_workload()
+        durations.append(timer() - start)
+    return statistics.median(durations)
+
+
+def machine_info() -> dict[str, Any]:
+    return {
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "node": platform.node(),
+        "system": platform.system(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+@dataclass(slots=True)
+class BenchmarkReport:
+    """Results of one runner invocation plus the machine they were measured on."""
+
+    machine: dict[str, Any] = field(default_factory=machine_info)
+    calibration_seconds: float | None = None
+    results: list[BenchmarkStats] = field(default_factory=list)
+    commit: str | None = None
+    memory: list[MemoryStats] = field(default_factory=list)
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        return {
+            "commit": self.commit,
+            "machine": self.machine,
+            "calibration_seconds": self.calibration_seconds,
+            "results": [asdict(result) for result in self.results],
+            "memory": [asdict(result) for result in self.memory],
+        }
+
+    @classmethod
+    def from_dict(cls: type[BenchmarkReport], data: Mapping[str, Any]) -> BenchmarkReport:
+        return cls(
+            machine=dict(data["machine"]),
+            calibration_seconds=data.get("calibration_seconds"),
+            results=[BenchmarkStats(**{**result, "samples": tuple(result.get("samples", ()))}) for result in data["results"]],
+            commit=data.get("commit"),
+            memory=[MemoryStats(**result) for result in data.get("memory", ())],
+        )
+
+    def result(self: Self, name: str) -> BenchmarkStats | None:
+        return next((result for result in self.results if result.name == name), None)
+
+    def memory_result(self: Self, name: str) -> MemoryStats | None:
+        return next((result for result in self.memory if result.name == name), None)
+
+    def write_json(self: Self, stream: IO[str]) -> None:
+        json.dump(self.to_dict(), stream, indent=2)
+        stream.write("\n")
+
+    def write_csv(self: Self, stream: IO[str]) -> None:
+        writer = csv.DictWriter(stream, fieldnames=STATS_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        for result in self.results:
+            writer.writerow({name: getattr(result, name) for name in STATS_FIELDS})
+
+    def write_table(self: Self, stream: IO[str]) -> None:
+        width = max((len(result.name) for result in self.results), default=4)
+        stream.write(f"{'name':<{width}}  {'rounds':>6}  {'min ms':>10}  {'median ms':>10}  {'p95 ms':>10}  {'stddev ms':>10}  {'norm':>8}\n")
+        for result in self.results:
+            normalized = "-" if result.normalized is None else f"{result.normalized:.2f}"
+            stream.write(f"{result.name:<{width}}  {result.rounds:>6}  {result.min * 1000:>10.3f}  {result.median * 1000:>10.3f}  {result.p95 * 1000:>10.3f}  {result.stddev * 1000:>10.3f}  {normalized:>8}\n")
+        if self.calibration_seconds is not None:
+            stream.write(f"calibration: {self.calibration_seconds * 1000:.3f} ms on {self.machine['platform']}\n")
+
+
+def run_benchmarks(
+    registries: Iterable[BenchmarkRegistry],
+    *,
+    tags: Iterable[str] | None = None,
+    match: str | None = None,
+    warmup: int | None = None,
+    rounds: int | None = None,
+    calibrated: bool = True,
+    timer: Timer = time.perf_counter,
+) -> BenchmarkReport:
+    """Time every selected benchmark and summarise it.
+
+    ``warmup`` and ``rounds`` override the registered values; by default each
+    benchmark gets at least ``DEFAULT_WARMUP`` warmup calls and ``DEFAULT_ROUNDS``
+    rounds. ``match`` keeps only names containing that substring.
+    """
+    tag_filter = None if tags is None else tuple(tags)
+    report = BenchmarkReport(calibration_seconds=calibrate(timer=timer) if calibrated else None)
+    for registry in registries:
+        for name in registry.select(tag_filter):
+            if match is not None and match not in name:
+                continue
+            spec = registry.spec(name)
+            spec = replace(
+                spec,
+                warmup=max(spec.warmup, DEFAULT_WARMUP) if warmup is None else warmup,
+                rounds=max(spec.rounds, DEFAULT_ROUNDS) if rounds is None else rounds,
+            )
+            report.results.append(BenchmarkStats.from_samples(name, measure(spec, timer), calibration=report.calibration_seconds, budget=spec.budget, params=spec.params))
+    return report
+
+
+def _import_target(target: str) -> object:
+    path = Path(target)
+    if path.suffix != ".py":
+        return importlib.import_module(target)
+    module_name = f"_hexa_benchmarks_{path.stem}"
+    module_spec = importlib.util.spec_from_file_location(module_name, path)
+    if module_spec is None or module_spec.loader is None:
+        raise ImportError(f"Cannot load benchmarks from {target}")
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[module_name] = module
+    module_spec.loader.exec_module(module)
+    return module
+
+
+def discover(targets: Sequence[str]) -> list[BenchmarkRegistry]:
+    """Collect the module-level registries of benchmark modules.
+
+    Targets are dotted module names, ``.py`` files or directories of
+    ``test_*_codspeed.py`` files.
+    """
+    registries: list[BenchmarkRegistry] = []
+    for target in targets:
+        path = Path(target)
+        files = sorted(str(module) for module in path.glob("test_*_codspeed.py")) if path.is_dir() else [target]
+        for file in files:
+            module = _import_target(file)
+            registries.extend(value for value in vars(module).values() if isinstance(value, BenchmarkRegistry))
+    return registries
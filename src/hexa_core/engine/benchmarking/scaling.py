@@ -0,0 +1,87 @@
+"""Empirical complexity of benchmark parameter sweeps.
+
+A sweep registered as ``register("tick", func, params={"entities": (10, 100, 1000)})``
+produces one result per size. Fitting ``log(median) = slope * log(size) + c``
+over those results gives the observed growth exponent: about 1 for linear
+work, about 2 for quadratic work.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from numbers import Real
+from typing import IO, Final
+
+from hexa_core.engine.benchmarking.runner import BenchmarkStats
+
+MIN_POINTS: Final = 3
+
+
+@dataclass(frozen=True, slots=True)
+class ScalingFit:
+    """Log-log least-squares fit of one benchmark's median time against one parameter."""
+
+    benchmark: str
+    param: str
+    points: tuple[tuple[float, float], ...]
+    slope: float
+    intercept: float
+    r_squared: float
+
+
+def fit_loglog(points: Sequence[tuple[float, float]]) -> tuple[float, float, float]:
+    """Return ``(slope, intercept, r_squared)`` of ``log(y)`` against ``log(x)``."""
+    if len(points) < 2:
+        raise ValueError("A scaling fit needs at least two points")
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread_x = sum((x - mean_x) ** 2 for x in xs)
+    if spread_x == 0:
+        raise ValueError("A scaling fit needs at least two distinct sizes")
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True)) / spread_x
+    intercept = mean_y - slope * mean_x
+    total = sum((y - mean_y) ** 2 for y in ys)
+    residual = sum((y - (intercept + slope * x)) ** 2 for x, y in zip(xs, ys, strict=True))
+    return slope, intercept, 1.0 if total == 0 else 1 - residual / total
+
+
+def _varying_param(group: Sequence[BenchmarkStats]) -> str | None:
+    """The single numeric parameter that differs across ``group``, if there is exactly one."""
+    keys = set(group[0].params)
+    varying = [key for key in sorted(keys) if len({repr(result.params.get(key)) for result in group}) > 1]
+    if len(varying) != 1 or any(not isinstance(result.params.get(varying[0]), Real) for result in group):
+        return None
+    return varying[0]
+
+
+def scaling_fits(results: Iterable[BenchmarkStats]) -> list[ScalingFit]:
+    """Fit every sweep of at least ``MIN_POINTS`` results that varies one numeric parameter."""
+    groups: dict[str, list[BenchmarkStats]] = {}
+    for result in results:
+        if result.params:
+            groups.setdefault(result.name.split("[", 1)[0], []).append(result)
+
+    fits = []
+    for benchmark, group in groups.items():
+        param = _varying_param(group) if len(group) >= MIN_POINTS else None
+        if param is None:
+            continue
+        points = tuple(sorted((float(result.params[param]), result.median) for result in group))
+        if any(y <= 0 for _, y in points):
+            continue
+        slope, intercept, r_squared = fit_loglog(points)
+        fits.append(ScalingFit(benchmark, param, points, slope, intercept, r_squared))
+    return fits
+
+
+def write_scaling(fits: Sequence[ScalingFit], stream: IO[str]) -> None:
+    if not fits:
+        return
+    width = max(len(f"{fit.benchmark}/{fit.param}") for fit in fits)
+    stream.write(f"\n{'scaling':<{width}}  {'points':>6}  {'slope':>6}  {'r^2':>5}\n")
+    for fit in fits:
+        stream.write(f"{f'{fit.benchmark}/{fit.param}':<{width}}  {len(fit.points):>6}  {fit.slope:>6.2f}  {fit.r_squared:>5.2f}\n")
@@ -0,0 +1,115 @@
+"""Deferred structural changes for ECS systems."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, Self
+
+from hexa_core.engine import storage
+
+if TYPE_CHECKING:
+    from hexa_core.engine.state_hash import StateHash
+
+_CREATE: Final = 0
+_DELETE: Final = 1
+_ADD: Final = 2
+_REMOVE: Final = 3
+
+Command = tuple[int, int, Any]
+
+
+class CommandBuffer:
+    """Queue of entity creations, deletions and component changes.
+
+    Systems record structural intents while iterating queries and the owner applies
+    them in one batch, so esper's query cache is invalidated once per flush rather
+    than once per change. Commands are applied strictly in enqueue order. Commands
+    that target an entity deleted earlier in the same batch are skipped.
+
+    When ``state_hash`` is set, tracked components entering or leaving the world
+    are folded into it as the commands are applied.
+    """
+
+    __slots__ = ("_commands", "state_hash")
+
+    def __init__(self: Self) -> None:
+        self._commands: list[Command] = []
+        self.state_hash: StateHash | None = None
+
+    def __len__(self: Self) -> int:
+        return len(self._commands)
+
+    def create_entity(self: Self, *components: object) -> None:
+        """Queue creation of a new entity with ``components``."""
+        self._commands.append((_CREATE, 0, components))
+
+    def delete_entity(self: Self, entity: int) -> None:
+        """Queue immediate deletion of ``entity`` and all of its components."""
+        self._commands.append((_DELETE, entity, None))
+
+    def add_component(self: Self, entity: int, component: object) -> None:
+        """Queue adding (or replacing) ``component`` on ``entity``."""
+        self._commands.append((_ADD, entity, component))
+
+    def remove_component(self: Self, entity: int, component_type: type[Any]) -> None:
+        """Queue removal of ``component_type`` from ``entity``."""
+        self._commands.append((_REMOVE, entity, component_type))
+
+    def clear(self: Self) -> None:
+        """Drop all queued commands without applying them."""
+        self._commands.clear()
+
+    def apply(self: Self) -> list[int]:
+        """Apply queued commands to the active esper context.
+
+        Returns the ids of entities created by this flush, in enqueue order.
+        """
+        if not self._commands:
+            return []
+
+        commands = self._commands
+        self._commands = []
+        if self.state_hash is not None:
+            return self._apply_hashed(commands, self.state_hash)
+        entities = storage.entity_table()
+        created: list[int] = []
+        for opcode, entity, payload in commands:
+            if opcode == _REMOVE:
+                storage.detach_component(entity, payload)
+            elif opcode == _ADD:
+                if entity in entities:
+                    storage.attach_component(entity, payload)
+            elif opcode == _DELETE:
+                storage.discard_entity(entity)
+            else:
+                new_entity = storage.allocate_entity()
+                for component in payload:
+                    storage.attach_component(new_entity, component)
+                created.append(new_entity)
+        storage.invalidate_queries()
+        return created
+
+    def _apply_hashed(self: Self, commands: list[Command], state_hash: StateHash) -> list[int]:
+        entities = storage.entity_table()
+        created: list[int] = []
+        for opcode, entity, payload in commands:
+            if opcode == _REMOVE:
+                state_hash.toggle(entity, storage.detach_component(entity, payload))
+            elif opcode == _ADD:
+                components = entities.get(entity)
+                if components is not None:
+                    state_hash.toggle(entity, components.get(type(payload)))
+                    storage.attach_component(entity, payload)
+                    state_hash.toggle(entity, payload)
+            elif opcode == _DELETE:
+                components = entities.get(entity)
+                if components is not None:
+                    state_hash.toggle_all(entity, components)
+                    storage.discard_entity(entity)
+            else:
+                new_entity = storage.allocate_entity()
+                for component in payload:
+                    storage.attach_component(new_entity, component)
+                    state_hash.toggle(new_entity, component)
+                created.append(new_entity)
+        storage.invalidate_queries()
+        return created
@@ -0,0 +1,212 @@
+"""Compiled binary map format with memory-mapped loading.
+
+Layout (little-endian)::
+
+    magic (6s) | version (H) | header length (I) | header (JSON, UTF-8) | padding | tile layer
+
+The header holds the map name, grid size, the tile-type palette and the entity
+table. The tile layer is a dense ``width * height`` array in row-major order
+(``r * width + q``). Each cell stores its palette index plus one, and zero means
+no tile. Cells are one byte wide, or two bytes for palettes of more than 255
+types. ``CompiledMapReader`` memory-maps the file and exposes the layer and its
+rows as zero-copy memoryviews.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Final, Self
+
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize, MapLoader
+
+MAGIC: Final = b"HXMAPC"
+VERSION: Final = 1
+SUFFIX: Final = ".hxmap"
+_PREAMBLE: Final = struct.Struct("<6sHI")
+_ALIGNMENT: Final = 8
+
+# Tile layer cell encodings recorded in the header.
+UINT8: Final = "B"
+UINT16: Final = "H"
+_MAX_PALETTE: Final = {UINT8: 0xFF, UINT16: 0xFFFF}
+
+
+class CompiledMapError(ValueError):
+    """Raised when a map cannot be compiled or a compiled map cannot be read."""
+
+
+def _layer_bytes(level: LevelData, palette: Sequence[str], encoding: str) -> bytes:
+    width, height = level.grid_size.width, level.grid_size.height
+    cells = array(encoding, [0]) * (width * height)
+    indices = {kind: index + 1 for index, kind in enumerate(palette)}
+    for kind, q, r in level.tiles:
+        if not (0 <= q < width and 0 <= r < height):
+            raise CompiledMapError(f"Tile ({q}, {r}) lies outside the {width}x{height} grid")
+        cell = r * width + q
+        if cells[cell]:
+            raise CompiledMapError(f"Tile ({q}, {r}) is defined more than once")
+        cells[cell] = indices[kind]
+    if sys.byteorder != "little" and encoding != UINT8:  # pragma: no cover - big-endian hosts
+        cells.byteswap()
+    return cells.tobytes()
+
+
+def dumps(level: LevelData) -> bytes:
+    """Encode ``level`` in the compiled map format.
+
+    Every tile must lie inside the grid and no cell may be defined twice.
+    """
+    palette = sorted({kind for kind, _, _ in level.tiles})
+    encoding = UINT8 if len(palette) <= _MAX_PALETTE[UINT8] else UINT16
+    if len(palette) > _MAX_PALETTE[encoding]:
+        raise CompiledMapError(f"Maps support at most {_MAX_PALETTE[UINT16]} tile types, got {len(palette)}")
+    header = json.dumps(
+        {
+            "name": level.name,
+            "width": level.grid_size.width,
+            "height": level.grid_size.height,
+            "palette": palette,
+            "encoding": encoding,
+            "tiles": len(level.tiles),
+            "entities": [{"name": entity.name, "components": entity.components} for entity in level.entities],
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    preamble = _PREAMBLE.pack(MAGIC, VERSION, len(header))
+    padding = bytes(-(len(preamble) + len(header)) % _ALIGNMENT)
+    return b"".join((preamble, header, padding, _layer_bytes(level, palette, encoding)))
+
+
+class MapCompiler:
+    """Compile JSON map definitions into the binary format."""
+
+    def compile(self: Self, source: Path | str, target: Path | str | None = None) -> Path:
+        """Compile the JSON map at ``source``; ``target`` defaults to ``source`` with the ``.hxmap`` suffix."""
+        output = Path(source).with_suffix(SUFFIX) if target is None else Path(target)
+        output.write_bytes(dumps(MapLoader().load(source)))
+        return output
+
+
+def _parse(view: memoryview) -> tuple[dict[str, Any], memoryview]:
+    """Validate the preamble and header of ``view`` and return the header and tile layer."""
+    if len(view) < _PREAMBLE.size:
+        raise CompiledMapError("Compiled map is truncated")
+    magic, version, header_length = _PREAMBLE.unpack_from(view)
+    if magic != MAGIC:
+        raise CompiledMapError("Not a Hexa-Core compiled map")
+    if version != VERSION:
+        raise CompiledMapError(f"Unsupported compiled map version {version}")
+    header_end = _PREAMBLE.size + header_length
+    try:
+        header: dict[str, Any] = json.loads(bytes(view[_PREAMBLE.size : header_end]))
+        encoding, cells = header["encoding"], header["width"] * header["height"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise CompiledMapError("Compiled map header is corrupt") from exc
+    if encoding not in _MAX_PALETTE:
+        raise CompiledMapError(f"Unknown tile layer encoding {encoding!r}")
+    layer_start = header_end + (-header_end % _ALIGNMENT)
+    if len(view) - layer_start != cells * array(encoding).itemsize:
+        raise CompiledMapError("Compiled map is truncated")
+    return header, view[layer_start:].cast(encoding)
+
+
+class CompiledMapReader:
+    """Reads a compiled map from bytes or a memory-mapped file.
+
+    ``layer`` and ``row`` return zero-copy memoryviews into the buffer; call
+    ``close()`` (or use the reader as a context manager) once they are released.
+    """
+
+    def __init__(self: Self, buffer: bytes | mmap.mmap, *, owned: mmap.mmap | None = None) -> None:
+        self._view = memoryview(buffer)
+        self._mmap = owned
+        try:
+            self.header, self._layer = _parse(self._view)
+        except CompiledMapError:
+            self._view.release()
+            raise
+        self.palette: tuple[str, ...] = tuple(self.header["palette"])
+        self.grid_size = LevelGridSize(width=self.header["width"], height=self.header["height"])
+
+    @classmethod
+    def open(cls: type[CompiledMapReader], path: Path | str) -> CompiledMapReader:
+        """Memory-map ``path`` read-only."""
+        with Path(path).open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped, owned=mapped)
+        except CompiledMapError:
+            mapped.close()
+            raise
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self: Self) -> None:
+        self._layer.release()
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    @property
+    def name(self: Self) -> str:
+        return str(self.header["name"])
+
+    @property
+    def tile_count(self: Self) -> int:
+        return int(self.header["tiles"])
+
+    @property
+    def layer(self: Self) -> memoryview:
+        """The dense tile layer: palette index plus one per cell, zero for no tile."""
+        return self._layer
+
+    def row(self: Self, r: int) -> memoryview:
+        """Cells ``q = 0 .. width - 1`` of row ``r``."""
+        if not 0 <= r < self.grid_size.height:
+            raise IndexError(f"Row {r} lies outside the grid")
+        width = self.grid_size.width
+        return self._layer[r * width : (r + 1) * width]
+
+    def tile_at(self: Self, q: int, r: int) -> str | None:
+        """The tile type at ``(q, r)``, or ``None`` for an empty or off-grid cell."""
+        width, height = self.grid_size.width, self.grid_size.height
+        if not (0 <= q < width and 0 <= r < height):
+            return None
+        cell = self._layer[r * width + q]
+        return self.palette[cell - 1] if cell else None
+
+    def entities(self: Self) -> list[LevelEntity]:
+        return [LevelEntity(name=entity["name"], components=entity["components"]) for entity in self.header["entities"]]
+
+    def to_level(self: Self) -> LevelData:
+        """Decode the whole map into ``LevelData``; tiles come back in row-major order."""
+        palette, width = self.palette, self.grid_size.width
+        tiles = []
+        for r in range(self.grid_size.height):
+            for q, cell in enumerate(self.row(r)):
+                if cell:
+                    tiles.append((palette[cell - 1], q, r))
+        return LevelData(name=self.name, grid_size=LevelGridSize(width=width, height=self.grid_size.height), tiles=tiles, entities=self.entities())
+
+
+def load_compiled_map(path: Path | str) -> LevelData:
+    """Load a map written by ``MapCompiler`` as ``LevelData``."""
+    with CompiledMapReader.open(path) as reader:
+        return reader.to_level()
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Self
 
 from hexa_core.engine.datatypes import HexCoord
 
@@ -46,6 +49,36 @@ class MovementIntentComponent:
     target: HexCoord
 
 
+@dataclass(slots=True)
+class PathComponent:
+    """Hexes to walk through, one hop each, packed as ``q, r`` pairs.
+
+    ``cursor`` indexes the next hex and ``speed`` is how many hops
+    ``MovementSystem`` attempts per tick. ``steps`` is never mutated once built,
+    so snapshots can share it.
+    """
+
+    steps: array[int]
+    cursor: int = 0
+    speed: int = 1
+
+    @classmethod
+    def through(cls: type[PathComponent], hexes: Iterable[HexCoord], speed: int = 1) -> PathComponent:
+        steps = array("i")
+        for coord in hexes:
+            steps.append(coord.q)
+            steps.append(coord.r)
+        return cls(steps, speed=speed)
+
+    @property
+    def remaining(self: Self) -> int:
+        return len(self.steps) // 2 - self.cursor
+
+    def next_hex(self: Self) -> tuple[int, int]:
+        index = self.cursor * 2
+        return self.steps[index], self.steps[index + 1]
+
+
 @dataclass(slots=True)
 class CombatIntentComponent:
     """Pending combat action against a specified target."""
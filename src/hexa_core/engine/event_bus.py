@@ -3,27 +3,161 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable
-from typing import Any, Self
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import Any, Final, Self
 
-Subscriber = Callable[[str, dict[str, Any]], None]
+Payload = Mapping[str, Any]
+Subscriber = Callable[[str, Payload], None]
+BatchSubscriber = Callable[[str, list[Payload]], None]
+Dispatch = tuple[tuple[Subscriber, ...], tuple[BatchSubscriber, ...]]
+
+SINGLE_SEGMENT: Final = "*"
+ANY_SEGMENTS: Final = "#"
+
+
+def is_pattern(topic: str) -> bool:
+    """Return whether ``topic`` contains a ``*`` or ``#`` wildcard segment."""
+    return any(segment in (SINGLE_SEGMENT, ANY_SEGMENTS) for segment in topic.split("."))
+
+
+def topic_matches(pattern: str, channel: str) -> bool:
+    """Match a dotted ``channel`` against ``pattern``.
+
+    ``*`` matches exactly one segment and ``#`` matches zero or more, so
+    ``engine.*`` matches ``engine.tick`` and ``engine.#`` also matches
+    ``engine`` and ``engine.movement.completed``.
+    """
+    return _segments_match(pattern.split("."), channel.split("."))
+
+
+def _segments_match(pattern: Sequence[str], channel: Sequence[str]) -> bool:
+    if not pattern:
+        return not channel
+    head, rest = pattern[0], pattern[1:]
+    if head == ANY_SEGMENTS:
+        return any(_segments_match(rest, channel[skip:]) for skip in range(len(channel) + 1))
+    if not channel:
+        return False
+    return (head in (SINGLE_SEGMENT, channel[0])) and _segments_match(rest, channel[1:])
 
 
 class EventBus:
-    """Minimal event bus for engine-to-renderer communication."""
+    """Minimal event bus for engine-to-renderer communication.
+
+    Subscriptions may name an exact channel or a wildcard pattern (see
+    ``topic_matches``). The subscribers for each published channel are resolved
+    once into a cached dispatch entry, exact subscribers first and then pattern
+    subscribers in registration order, so publishing costs one dict lookup; the
+    cache is cleared whenever a subscription is added.
+
+    Inside ``batch()`` published payloads are queued per channel and delivered when
+    the outermost batch exits: per-event subscribers receive each payload in
+    publish order, batch subscribers receive the channel's payloads as one list.
+    """
 
     def __init__(self: Self) -> None:
         self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+        self._batch_subscribers: dict[str, list[BatchSubscriber]] = defaultdict(list)
+        self._patterns: dict[str, None] = {}
+        self._dispatch: dict[str, Dispatch] = {}
+        self._pending: dict[str, list[Payload]] = {}
+        self._batch_depth = 0
 
     def subscribe(self: Self, event_type: str, subscriber: Subscriber) -> None:
-        """Register a subscriber for a specific event type."""
+        """Register a subscriber for an event type or wildcard pattern."""
         self._subscribers[event_type].append(subscriber)
+        self._subscriptions_changed(event_type)
+
+    def subscribe_batch(self: Self, event_type: str, subscriber: BatchSubscriber) -> None:
+        """Register a subscriber that receives a channel's payloads as a list.
+
+        Outside a batch the list holds the single payload being published.
+        """
+        self._batch_subscribers[event_type].append(subscriber)
+        self._subscriptions_changed(event_type)
 
-    def publish(self: Self, event_type: str, payload: dict[str, Any]) -> None:
-        """Notify all subscribers of an event."""
-        for subscriber in self._subscribers[event_type]:
+    def subscribe_coalesced(self: Self, event_type: str, key: str, subscriber: BatchSubscriber) -> None:
+        """Register a batch subscriber that only sees the last payload per ``payload[key]``."""
+
+        def coalesce(channel: str, payloads: list[Payload]) -> None:
+            latest: dict[Hashable, Payload] = {payload[key]: payload for payload in payloads}
+            subscriber(channel, list(latest.values()))
+
+        self.subscribe_batch(event_type, coalesce)
+
+    def _subscriptions_changed(self: Self, event_type: str) -> None:
+        if is_pattern(event_type):
+            self._patterns[event_type] = None
+        self._dispatch.clear()
+
+    def _resolve(self: Self, channel: str) -> Dispatch:
+        patterns = [pattern for pattern in self._patterns if topic_matches(pattern, channel)]
+        subscribers = [*self._subscribers.get(channel, ())]
+        batch_subscribers = [*self._batch_subscribers.get(channel, ())]
+        for pattern in patterns:
+            subscribers.extend(self._subscribers.get(pattern, ()))
+            batch_subscribers.extend(self._batch_subscribers.get(pattern, ()))
+        entry = self._dispatch[channel] = (tuple(subscribers), tuple(batch_subscribers))
+        return entry
+
+    def has_pending(self: Self, event_type: str) -> bool:
+        """Return whether payloads for ``event_type`` are queued awaiting ``flush``."""
+        return event_type in self._pending
+
+    def publish(self: Self, event_type: str, payload: Payload) -> None:
+        """Notify all subscribers of an event, or queue it while batching."""
+        subscribers, batch_subscribers = self._dispatch.get(event_type) or self._resolve(event_type)
+        if self._batch_depth:
+            if subscribers or batch_subscribers:
+                pending = self._pending.get(event_type)
+                if pending is None:
+                    pending = self._pending[event_type] = []
+                pending.append(payload)
+            return
+
+        for subscriber in subscribers:
             subscriber(event_type, payload)
+        if batch_subscribers:
+            payloads = [payload]
+            for batch_subscriber in batch_subscribers:
+                batch_subscriber(event_type, payloads)
+
+    @property
+    def batching(self: Self) -> bool:
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self: Self) -> Iterator[None]:
+        """Queue publications until the outermost batch exits, then flush them.
+
+        If the body raises, queued payloads are kept for the next ``flush``.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self: Self) -> None:
+        """Deliver queued payloads channel by channel, in first-publish order."""
+        while self._pending:
+            pending, self._pending = self._pending, {}
+            for event_type, payloads in pending.items():
+                subscribers, batch_subscribers = self._dispatch.get(event_type) or self._resolve(event_type)
+                for subscriber in subscribers:
+                    for payload in payloads:
+                        subscriber(event_type, payload)
+                for batch_subscriber in batch_subscribers:
+                    batch_subscriber(event_type, payloads)
 
     def subscribers(self: Self, event_type: str) -> tuple[Subscriber, ...]:
-        """Return subscribers for inspection/testing."""
-        return tuple(self._subscribers[event_type])
+        """Return subscribers registered for ``event_type`` (a channel or pattern) for inspection/testing."""
+        return tuple(self._subscribers.get(event_type, ()))
+
+    def dispatch_for(self: Self, channel: str) -> tuple[Subscriber, ...]:
+        """Return every per-event subscriber a publish on ``channel`` reaches, including pattern matches."""
+        subscribers, _ = self._dispatch.get(channel) or self._resolve(channel)
+        return subscribers
@@ -0,0 +1,188 @@
+"""Bounded cross-thread event delivery from the engine to a consumer such as the renderer.
+
+The engine thread forwards selected ``EventBus`` channels into an ``EventQueue``;
+the consumer drains it once per frame and republishes onto its own bus::
+
+    queue = EventQueue(capacity=4096, policy=DROP_OLDEST)
+    queue.connect(world.event_bus, [MOVEMENT_COMPLETED, COMBAT_RESOLVED])
+    engine = EngineThread(world, tick_rate=30)
+    engine.start()
+    ...
+    queue.drain_into(renderer_bus)  # once per frame, on the render thread
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+from time import perf_counter, perf_counter_ns
+from typing import Any, Final, Literal, Self
+
+from hexa_core.engine.event_bus import EventBus, Payload
+from hexa_core.engine.events import EventRecord
+from hexa_core.engine.instrumentation import RollingHistogram
+from hexa_core.engine.world import GameWorld
+
+BLOCK: Final = "block"
+DROP_OLDEST: Final = "drop_oldest"
+OverflowPolicy = Literal["block", "drop_oldest"]
+
+QueuedEvent = tuple[str, Payload, int]
+
+
+class EventQueueFull(RuntimeError):
+    """Raised when a blocking ``put`` times out waiting for the consumer."""
+
+
+class EventQueue:
+    """Bounded single-producer/single-consumer queue of ``(event_type, payload)`` pairs.
+
+    ``deque.append`` and ``deque.popleft`` are atomic, so the drop-oldest path
+    takes no locks. The blocking policy applies backpressure: ``put`` waits until
+    the consumer drains space (or ``timeout`` elapses). Pooled event records are
+    copied on ``put`` because the engine reuses them on its next tick.
+    """
+
+    def __init__(
+        self: Self,
+        capacity: int = 4096,
+        *,
+        policy: OverflowPolicy = DROP_OLDEST,
+        timeout: float | None = None,
+        window: int = 256,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("EventQueue capacity must be positive")
+        if policy not in (BLOCK, DROP_OLDEST):
+            raise ValueError(f"Unknown overflow policy {policy!r}")
+        self.capacity = capacity
+        self.policy = policy
+        self.timeout = timeout
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.max_depth = 0
+        self.latency_ns = RollingHistogram(window)
+        self.depth_at_drain = RollingHistogram(window)
+        self._items: deque[QueuedEvent] = deque(maxlen=capacity if policy == DROP_OLDEST else None)
+        self._not_full = threading.Condition()
+        self._closed = False
+
+    def __len__(self: Self) -> int:
+        return len(self._items)
+
+    # -- Producer ------------------------------------------------------------
+
+    def put(self: Self, event_type: str, payload: Payload) -> None:
+        if isinstance(payload, EventRecord):
+            payload = payload.copy()
+        items = self._items
+        if self.policy == DROP_OLDEST:
+            if len(items) == self.capacity:
+                self.dropped += 1
+        elif len(items) >= self.capacity:
+            self._wait_for_space()
+        items.append((event_type, payload, perf_counter_ns()))
+        self.enqueued += 1
+        depth = len(items)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def _wait_for_space(self: Self) -> None:
+        self.blocked += 1
+        deadline = None if self.timeout is None else perf_counter() + self.timeout
+        with self._not_full:
+            while len(self._items) >= self.capacity and not self._closed:
+                remaining = None if deadline is None else deadline - perf_counter()
+                if remaining is not None and remaining <= 0:
+                    raise EventQueueFull(f"EventQueue stayed full for {self.timeout}s")
+                self._not_full.wait(remaining)
+
+    def connect(self: Self, event_bus: EventBus, channels: Iterable[str]) -> None:
+        """Forward ``channels`` published on ``event_bus`` into this queue."""
+        for channel in channels:
+            event_bus.subscribe(channel, self.put)
+
+    def close(self: Self) -> None:
+        """Release a producer blocked on a full queue; later puts no longer wait."""
+        with self._not_full:
+            self._closed = True
+            self._not_full.notify_all()
+
+    # -- Consumer ------------------------------------------------------------
+
+    def drain(self: Self, max_items: int | None = None) -> list[tuple[str, Payload]]:
+        """Remove and return up to ``max_items`` queued events, oldest first."""
+        items = self._items
+        self.depth_at_drain.add(len(items))
+        limit = len(items) if max_items is None else min(max_items, len(items))
+        now = perf_counter_ns()
+        drained: list[tuple[str, Payload]] = []
+        for _ in range(limit):
+            event_type, payload, enqueued_at = items.popleft()
+            self.latency_ns.add(now - enqueued_at)
+            drained.append((event_type, payload))
+        self.delivered += limit
+        if self.policy == BLOCK and limit:
+            with self._not_full:
+                self._not_full.notify()
+        return drained
+
+    def drain_into(self: Self, event_bus: EventBus, max_items: int | None = None) -> int:
+        """Drain queued events and publish them on ``event_bus``; return how many were delivered."""
+        drained = self.drain(max_items)
+        for event_type, payload in drained:
+            event_bus.publish(event_type, payload)
+        return len(drained)
+
+    def metrics(self: Self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "policy": self.policy,
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "blocked": self.blocked,
+            "latency_ns": self.latency_ns.summary(),
+            "depth_at_drain": self.depth_at_drain.summary(),
+        }
+
+
+class EngineThread(threading.Thread):
+    """Runs ``world.process()`` on a background thread until ``stop`` is called.
+
+    ``tick_rate`` caps ticks per second; ``None`` runs as fast as possible. The
+    world must not be touched from other threads while the engine is running.
+    """
+
+    def __init__(self: Self, world: GameWorld, *, tick_rate: float | None = None, max_ticks: int | None = None) -> None:
+        super().__init__(name=f"{world.context_name}-engine", daemon=True)
+        self.world = world
+        self.interval = 0.0 if tick_rate is None else 1.0 / tick_rate
+        self.max_ticks = max_ticks
+        self.ticks = 0
+        self._stopping = threading.Event()
+
+    def run(self: Self) -> None:
+        next_tick = perf_counter()
+        while not self._stopping.is_set():
+            if self.max_ticks is not None and self.ticks >= self.max_ticks:
+                return
+            self.world.process()
+            self.ticks += 1
+            if self.interval:
+                next_tick += self.interval
+                delay = next_tick - perf_counter()
+                if delay > 0:
+                    self._stopping.wait(delay)
+                else:
+                    next_tick = perf_counter()
+
+    def stop(self: Self, timeout: float | None = None) -> None:
+        self._stopping.set()
+        if self.is_alive():
+            self.join(timeout)
@@ -0,0 +1,170 @@
+"""Engine event channel definitions and typed payload records.
+
+Records are slotted, read-only mappings: subscribers written against the old
+``dict`` payloads keep working (``payload["entity_id"]``, ``dict(payload)`` and
+equality with dicts all behave the same), while publishers skip building a dict
+and hashing string keys per event.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, ClassVar, Generic, Self, TypeVar
+
+from hexa_core.engine.datatypes import HexCoord
+
+MOVEMENT_COMPLETED = "engine.movement.completed"
+MOVEMENT_BLOCKED = "engine.movement.blocked"
+TURN_READY = "engine.turn.ready"
+COMBAT_RESOLVED = "engine.combat.resolved"
+
+
+class EventRecord(Mapping[str, Any]):
+    """Base class for typed event payloads.
+
+    ``_attributes`` maps each payload key to the slot holding its value, so keys
+    that are not valid identifiers (``"from"``) can still be exposed.
+    """
+
+    __slots__ = ()
+    _attributes: ClassVar[dict[str, str]] = {}
+
+    def __getitem__(self: Self, key: str) -> Any:  # noqa: ANN401 - payload values are heterogeneous
+        try:
+            attribute = self._attributes[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return getattr(self, attribute)
+
+    def __iter__(self: Self) -> Iterator[str]:
+        return iter(self._attributes)
+
+    def __len__(self: Self) -> int:
+        return len(self._attributes)
+
+    def __repr__(self: Self) -> str:
+        fields = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute in self._attributes.values())
+        return f"{type(self).__name__}({fields})"
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        """Return an independent ``dict`` payload with the same keys and values."""
+        return {key: getattr(self, attribute) for key, attribute in self._attributes.items()}
+
+    def copy(self: Self) -> Self:
+        """Return a detached copy, e.g. to keep a pooled record beyond its tick."""
+        duplicate = object.__new__(type(self))
+        for attribute in self._attributes.values():
+            object.__setattr__(duplicate, attribute, getattr(self, attribute))
+        return duplicate
+
+
+class MovementCompleted(EventRecord):
+    __slots__ = ("entity_id", "origin", "destination")
+    _attributes: ClassVar[dict[str, str]] = {"entity_id": "entity_id", "from": "origin", "to": "destination"}
+
+    def __init__(self: Self, entity_id: int, origin: HexCoord, destination: HexCoord) -> None:
+        self.entity_id = entity_id
+        self.origin = origin
+        self.destination = destination
+
+
+class MovementBlocked(EventRecord):
+    """A move that did not happen; ``reason`` is one of the ``BLOCKED_*`` constants in ``movement_system``."""
+
+    __slots__ = ("entity_id", "origin", "destination", "reason")
+    _attributes: ClassVar[dict[str, str]] = {"entity_id": "entity_id", "from": "origin", "to": "destination", "reason": "reason"}
+
+    def __init__(self: Self, entity_id: int, origin: HexCoord, destination: HexCoord, reason: str) -> None:
+        self.entity_id = entity_id
+        self.origin = origin
+        self.destination = destination
+        self.reason = reason
+
+
+class TurnReady(EventRecord):
+    __slots__ = ("entity_id", "turn_counter")
+    _attributes: ClassVar[dict[str, str]] = {"entity_id": "entity_id", "turn_counter": "turn_counter"}
+
+    def __init__(self: Self, entity_id: int, turn_counter: int) -> None:
+        self.entity_id = entity_id
+        self.turn_counter = turn_counter
+
+
+class CombatResolved(EventRecord):
+    """Total damage dealt to one target in a tick.
+
+    ``attacker_ids`` lists every attacker in ascending id order; ``attacker_id`` is
+    the first of them, for subscribers that only track a single attacker.
+    """
+
+    __slots__ = ("attacker_id", "target_id", "damage", "remaining_health", "defeated", "attacker_ids")
+    _attributes: ClassVar[dict[str, str]] = {name: name for name in __slots__}
+
+    def __init__(
+        self: Self,
+        attacker_id: int,
+        target_id: int,
+        damage: int,
+        remaining_health: int,
+        defeated: bool,
+        attacker_ids: tuple[int, ...] | None = None,
+    ) -> None:
+        self.attacker_id = attacker_id
+        self.target_id = target_id
+        self.damage = damage
+        self.remaining_health = remaining_health
+        self.defeated = defeated
+        self.attacker_ids = (attacker_id,) if attacker_ids is None else attacker_ids
+
+
+R = TypeVar("R", bound=EventRecord)
+
+
+class RecordPool(Generic[R]):
+    """Arena of reusable records for the hottest channels.
+
+    ``acquire`` hands out records in order, allocating only when the arena is
+    exhausted; the caller overwrites every field before publishing. ``rewind``
+    makes every record reusable, so a record stays valid until the publishing
+    system rewinds its pool at the start of its next pass. Subscribers that keep
+    payloads longer must ``copy()`` them or subscribe through ``dict_payloads``.
+
+    Filling a pooled record is cheaper than building a dict payload, whereas
+    constructing a fresh record through a Python ``__init__`` is not.
+    """
+
+    __slots__ = ("_record_type", "_records", "_cursor")
+
+    def __init__(self: Self, record_type: type[R]) -> None:
+        self._record_type = record_type
+        self._records: list[R] = []
+        self._cursor = 0
+
+    def __len__(self: Self) -> int:
+        return len(self._records)
+
+    def acquire(self: Self) -> R:
+        cursor = self._cursor
+        self._cursor = cursor + 1
+        try:
+            return self._records[cursor]
+        except IndexError:
+            record = object.__new__(self._record_type)
+            self._records.append(record)
+            return record
+
+    def rewind(self: Self) -> None:
+        self._cursor = 0
+
+
+def dict_payloads(subscriber: Callable[[str, dict[str, Any]], None]) -> Callable[[str, Mapping[str, Any]], None]:
+    """Adapt a subscriber that mutates or retains payloads to receive plain dicts.
+
+    Use it for any subscriber that keeps payloads from the pooled movement,
+    turn-ready or combat channels, whose records are reused on the next tick.
+    """
+
+    def deliver(event_type: str, payload: Mapping[str, Any]) -> None:
+        subscriber(event_type, payload if isinstance(payload, dict) else dict(payload))
+
+    return deliver
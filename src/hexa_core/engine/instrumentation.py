@@ -0,0 +1,218 @@
+"""Opt-in per-processor timing, allocation and event instrumentation."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from statistics import fmean
+from time import perf_counter_ns
+from typing import Any, Self
+
+import esper
+
+from hexa_core.engine.event_bus import EventBus
+
+DEFAULT_BUDGET_MS = 100.0
+"""ADR-0005 budget for a full turn (50 entities, 10 script executions)."""
+
+_NS_PER_MS = 1_000_000
+
+
+class RollingHistogram:
+    """Keeps the most recent ``window`` samples and summarizes them on demand."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self: Self, window: int) -> None:
+        self._samples: deque[int] = deque(maxlen=window)
+
+    def add(self: Self, value: int) -> None:
+        self._samples.append(value)
+
+    def __len__(self: Self) -> int:
+        return len(self._samples)
+
+    def summary(self: Self) -> dict[str, float]:
+        """Return min/mean/percentile/max statistics for the current window."""
+        if not self._samples:
+            return {"count": 0}
+        ordered = sorted(self._samples)
+        last = len(ordered) - 1
+        return {
+            "count": len(ordered),
+            "min": ordered[0],
+            "mean": fmean(ordered),
+            "p50": ordered[last // 2],
+            "p95": ordered[(last * 95) // 100],
+            "p99": ordered[(last * 99) // 100],
+            "max": ordered[-1],
+        }
+
+    def buckets(self: Self) -> dict[str, int]:
+        """Return power-of-two bucket counts keyed by the bucket's upper bound."""
+        counts: Counter[int] = Counter(max(sample, 0).bit_length() for sample in self._samples)
+        return {str(1 << bits): counts[bits] for bits in sorted(counts)}
+
+
+@dataclass(slots=True)
+class TickProfile:
+    """Measurements captured during a single ``GameWorld.process`` call."""
+
+    tick: int
+    wall_ns: dict[str, int] = field(default_factory=dict)
+    allocated_bytes: dict[str, int] = field(default_factory=dict)
+    events: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total_ms(self: Self) -> float:
+        return sum(self.wall_ns.values()) / _NS_PER_MS
+
+    def slowest(self: Self) -> str | None:
+        """Return the name of the processor that consumed the most wall time."""
+        if not self.wall_ns:
+            return None
+        return max(self.wall_ns, key=self.wall_ns.__getitem__)
+
+
+class ProcessInstrumentation:
+    """Records wall time, call counts and allocation deltas per processor per tick.
+
+    Instances are installed through ``GameWorld.enable_instrumentation``. When no
+    instrumentation is installed ``GameWorld.process`` calls ``esper.process``
+    directly, so the disabled path costs a single attribute check.
+    """
+
+    def __init__(
+        self: Self,
+        *,
+        window: int = 256,
+        trace_allocations: bool = False,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+    ) -> None:
+        self.window = window
+        self.trace_allocations = trace_allocations
+        self.budget_ms = budget_ms
+        self.ticks = 0
+        self.calls: Counter[str] = Counter()
+        self.last_tick: TickProfile | None = None
+        self.over_budget: deque[TickProfile] = deque(maxlen=window)
+        self._wall: dict[str, RollingHistogram] = {}
+        self._allocations: dict[str, RollingHistogram] = {}
+        self._events: dict[str, RollingHistogram] = {}
+        self._event_totals: Counter[str] = Counter()
+        self._tick_events: Counter[str] = Counter()
+        self._bus: EventBus | None = None
+        self._started_tracemalloc = False
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    def attach(self: Self, event_bus: EventBus) -> None:
+        """Start counting events published on ``event_bus``."""
+        if self._bus is not None:
+            raise RuntimeError("Instrumentation is already attached to an event bus")
+
+        publish = event_bus.publish
+        tick_events = self._tick_events
+
+        def counting_publish(event_type: str, payload: Any) -> None:  # noqa: ANN401 - mirrors EventBus.publish
+            tick_events[event_type] += 1
+            publish(event_type, payload)
+
+        # Shadow the bound method on the instance so detaching restores the original lookup.
+        setattr(event_bus, "publish", counting_publish)  # noqa: B010
+        self._bus = event_bus
+
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def detach(self: Self) -> None:
+        """Stop counting events and release tracemalloc if this instance started it."""
+        if self._bus is not None:
+            delattr(self._bus, "publish")
+            self._bus = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # -- Measurement -------------------------------------------------------
+
+    def process(self: Self, processors: Iterable[esper.Processor], *args: object, **kwargs: object) -> TickProfile:
+        """Replicate ``esper.process`` while measuring each processor.
+
+        The returned profile stays open so callers can measure follow-up work
+        (e.g. command buffer flushes) before handing it to ``finish_tick``.
+        """
+        profile = TickProfile(tick=self.ticks)
+        self.measure(profile, "esper.clear_dead_entities", esper.clear_dead_entities)
+        for processor in processors:
+            self.measure(profile, type(processor).__name__, processor.process, *args, **kwargs)
+        return profile
+
+    def measure(self: Self, profile: TickProfile, name: str, func: Callable[..., object], *args: object, **kwargs: object) -> None:
+        """Run ``func`` and record its wall time (and allocations) under ``name``."""
+        if self.trace_allocations:
+            before, _ = tracemalloc.get_traced_memory()
+            start = perf_counter_ns()
+            func(*args, **kwargs)
+            elapsed = perf_counter_ns() - start
+            after, _ = tracemalloc.get_traced_memory()
+            profile.allocated_bytes[name] = profile.allocated_bytes.get(name, 0) + after - before
+        else:
+            start = perf_counter_ns()
+            func(*args, **kwargs)
+            elapsed = perf_counter_ns() - start
+        profile.wall_ns[name] = profile.wall_ns.get(name, 0) + elapsed
+        self.calls[name] += 1
+
+    def finish_tick(self: Self, profile: TickProfile) -> None:
+        """Fold a completed tick into the rolling histograms."""
+        profile.events.update(self._tick_events)
+        self._event_totals.update(self._tick_events)
+        for channel, published in self._tick_events.items():
+            self._histogram(self._events, channel).add(published)
+        self._tick_events.clear()
+
+        for name, elapsed in profile.wall_ns.items():
+            self._histogram(self._wall, name).add(elapsed)
+        for name, allocated in profile.allocated_bytes.items():
+            self._histogram(self._allocations, name).add(allocated)
+
+        if profile.total_ms > self.budget_ms:
+            self.over_budget.append(profile)
+        self.last_tick = profile
+        self.ticks += 1
+
+    def _histogram(self: Self, table: dict[str, RollingHistogram], name: str) -> RollingHistogram:
+        histogram = table.get(name)
+        if histogram is None:
+            histogram = table[name] = RollingHistogram(self.window)
+        return histogram
+
+    # -- Reporting -----------------------------------------------------------
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        """Return a JSON-serializable report of the rolling window."""
+        return {
+            "ticks": self.ticks,
+            "window": self.window,
+            "budget_ms": self.budget_ms,
+            "ticks_over_budget": [{"tick": profile.tick, "total_ms": profile.total_ms, "slowest": profile.slowest()} for profile in self.over_budget],
+            "processors": {
+                name: {
+                    "calls": self.calls[name],
+                    "wall_ns": histogram.summary(),
+                    "wall_ns_buckets": histogram.buckets(),
+                    **({"allocated_bytes": self._allocations[name].summary()} if name in self._allocations else {}),
+                }
+                for name, histogram in self._wall.items()
+            },
+            "events": {channel: {"total": self._event_totals[channel], "per_tick": histogram.summary()} for channel, histogram in self._events.items()},
+        }
+
+    def to_json(self: Self, **kwargs: Any) -> str:  # noqa: ANN401 - forwarded to json.dumps
+        """Serialize ``to_dict()`` as JSON."""
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,347 @@
+"""Append-only binary event journal for replay and analytics.
+
+Layout (little-endian)::
+
+    magic (6s) | version (H) | record*
+    record := length (I) | body
+    body   := SHAPE  (B=0) | shape id (I) | channel | key count (I) | key*
+            | EVENT  (B=1) | tick (Q) | shape id (I) | value*
+
+A shape is declared the first time a channel is published with a given set of
+payload keys, so events only carry their tick, a shape id and tagged values.
+Strings are ``count (I) | UTF-8``; values are a one-byte tag followed by data.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Final, Self
+
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.event_bus import ANY_SEGMENTS, EventBus, Payload
+from hexa_core.engine.events import EventRecord
+
+MAGIC: Final = b"HXJRNL"
+VERSION: Final = 1
+DEFAULT_FLUSH_BYTES: Final = 64 * 1024
+
+_HEADER: Final = struct.Struct("<6sH")
+_COUNT: Final = struct.Struct("<I")
+_SHAPE: Final = struct.Struct("<BI")
+_EVENT: Final = struct.Struct("<BQI")
+_INT: Final = struct.Struct("<q")
+_FLOAT: Final = struct.Struct("<d")
+_HEX: Final = struct.Struct("<qq")
+
+KIND_SHAPE: Final = 0
+KIND_EVENT: Final = 1
+
+
+class JournalError(ValueError):
+    """Raised when an event cannot be journaled or a journal cannot be read."""
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    tick: int
+    event_type: str
+    payload: dict[str, Any]
+
+
+# -- Value codec ---------------------------------------------------------------
+
+
+def _encode_str(out: bytearray, text: str) -> None:
+    encoded = text.encode("utf-8")
+    out += _COUNT.pack(len(encoded))
+    out += encoded
+
+
+def _encode_value(out: bytearray, value: object) -> None:  # noqa: C901 - one branch per tag
+    kind = type(value)
+    if kind is int:
+        try:
+            packed = _INT.pack(value)
+        except struct.error:
+            out += b"I"
+            _encode_str(out, str(value))
+        else:
+            out += b"i"
+            out += packed
+    elif kind is HexCoord:
+        out += b"h"
+        out += _HEX.pack(value.q, value.r)  # type: ignore[attr-defined]
+    elif kind is bool:
+        out += b"T" if value else b"F"
+    elif value is None:
+        out += b"N"
+    elif kind is float:
+        out += b"d"
+        out += _FLOAT.pack(value)
+    elif kind is str:
+        out += b"s"
+        _encode_str(out, value)  # type: ignore[arg-type]
+    elif isinstance(value, list | tuple):
+        out += b"l" if isinstance(value, list) else b"t"
+        out += _COUNT.pack(len(value))
+        for item in value:
+            _encode_value(out, item)
+    elif isinstance(value, Mapping):
+        out += b"m"
+        out += _COUNT.pack(len(value))
+        for key, item in value.items():
+            _encode_str(out, str(key))
+            _encode_value(out, item)
+    else:
+        raise JournalError(f"Cannot journal value of type {kind.__name__}")
+
+
+def _decode_str(view: memoryview, offset: int) -> tuple[str, int]:
+    (length,) = _COUNT.unpack_from(view, offset)
+    start = offset + _COUNT.size
+    return str(view[start : start + length], "utf-8"), start + length
+
+
+def _decode_value(view: memoryview, offset: int) -> tuple[Any, int]:  # noqa: C901 - one branch per tag
+    tag = view[offset]
+    offset += 1
+    if tag == ord("i"):
+        return _INT.unpack_from(view, offset)[0], offset + _INT.size
+    if tag == ord("h"):
+        return HexCoord(*_HEX.unpack_from(view, offset)), offset + _HEX.size
+    if tag == ord("T"):
+        return True, offset
+    if tag == ord("F"):
+        return False, offset
+    if tag == ord("N"):
+        return None, offset
+    if tag == ord("d"):
+        return _FLOAT.unpack_from(view, offset)[0], offset + _FLOAT.size
+    if tag == ord("s"):
+        return _decode_str(view, offset)
+    if tag == ord("I"):
+        text, offset = _decode_str(view, offset)
+        return int(text), offset
+    if tag in (ord("l"), ord("t")):
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        items = []
+        for _ in range(count):
+            item, offset = _decode_value(view, offset)
+            items.append(item)
+        return (items if tag == ord("l") else tuple(items)), offset
+    if tag == ord("m"):
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        mapping = {}
+        for _ in range(count):
+            key, offset = _decode_str(view, offset)
+            mapping[key], offset = _decode_value(view, offset)
+        return mapping, offset
+    raise JournalError(f"Unknown value tag {tag!r}")
+
+
+# -- Writer ------------------------------------------------------------------------
+
+
+class EventJournal:
+    """``EventBus`` sink that appends every received event to a binary log.
+
+    Encoded records accumulate in memory and are written once ``flush_bytes``
+    have built up (and on ``flush``/``close``), so recording costs one buffer
+    append per event. Each event is stamped with ``tick_source()`` when given,
+    otherwise with the journal's own counter advanced by ``advance_tick``.
+    """
+
+    def __init__(
+        self: Self,
+        stream: IO[bytes],
+        *,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        tick_source: Callable[[], int] | None = None,
+    ) -> None:
+        self._stream = stream
+        self.flush_bytes = flush_bytes
+        self.tick_source = tick_source
+        self.tick = 0
+        self.events = 0
+        self._buffer = bytearray(_HEADER.pack(MAGIC, VERSION))
+        self._shapes: dict[tuple[str, object], tuple[int, tuple[str, ...]]] = {}
+
+    @classmethod
+    def open(cls: type[EventJournal], path: Path | str, **kwargs: Any) -> EventJournal:  # noqa: ANN401 - forwarded to __init__
+        """Create (or truncate) ``path`` and journal into it."""
+        return cls(Path(path).open("wb"), **kwargs)  # noqa: SIM115 - closed by EventJournal.close
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def attach(self: Self, event_bus: EventBus, pattern: str = ANY_SEGMENTS) -> None:
+        """Record every event on ``event_bus`` matching ``pattern`` (all channels by default)."""
+        event_bus.subscribe(pattern, self.record)
+
+    def advance_tick(self: Self) -> None:
+        self.tick += 1
+
+    def record(self: Self, event_type: str, payload: Payload) -> None:
+        shape_key = (event_type, type(payload) if isinstance(payload, EventRecord) else tuple(payload))
+        shape = self._shapes.get(shape_key)
+        if shape is None:
+            shape = self._declare_shape(event_type, tuple(payload))
+            self._shapes[shape_key] = shape
+        shape_id, keys = shape
+
+        body = bytearray(_EVENT.pack(KIND_EVENT, self.tick if self.tick_source is None else self.tick_source(), shape_id))
+        for key in keys:
+            _encode_value(body, payload[key])
+        self._append(body)
+        self.events += 1
+
+    def _declare_shape(self: Self, event_type: str, keys: tuple[str, ...]) -> tuple[int, tuple[str, ...]]:
+        shape_id = len(self._shapes)
+        body = bytearray(_SHAPE.pack(KIND_SHAPE, shape_id))
+        _encode_str(body, event_type)
+        body += _COUNT.pack(len(keys))
+        for key in keys:
+            _encode_str(body, key)
+        self._append(body)
+        return shape_id, keys
+
+    def _append(self: Self, body: bytearray) -> None:
+        buffer = self._buffer
+        buffer += _COUNT.pack(len(body))
+        buffer += body
+        if len(buffer) >= self.flush_bytes:
+            self.flush()
+
+    def flush(self: Self) -> None:
+        """Write buffered records to the underlying stream."""
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer.clear()
+        self._stream.flush()
+
+    def close(self: Self) -> None:
+        self.flush()
+        self._stream.close()
+
+
+# -- Reader ------------------------------------------------------------------------
+
+
+class JournalReader:
+    """Streams entries from a journal held in bytes or a memory-mapped file.
+
+    A record cut short at the end of the buffer (e.g. by a crash mid-write) ends
+    iteration instead of raising.
+    """
+
+    def __init__(self: Self, buffer: bytes | mmap.mmap, *, owned: mmap.mmap | None = None) -> None:
+        self._view = memoryview(buffer)
+        self._mmap = owned
+        if len(self._view) < _HEADER.size:
+            raise JournalError("Journal is truncated")
+        magic, version = _HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            raise JournalError("Not a Hexa-Core event journal")
+        if version != VERSION:
+            raise JournalError(f"Unsupported journal version {version}")
+
+    @classmethod
+    def open(cls: type[JournalReader], path: Path | str) -> JournalReader:
+        """Memory-map ``path`` read-only."""
+        with Path(path).open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, owned=mapped)
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self: Self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __iter__(self: Self) -> Iterator[JournalEntry]:
+        view = self._view
+        end = len(view)
+        offset = _HEADER.size
+        shapes: dict[int, tuple[str, tuple[str, ...]]] = {}
+        while offset + _COUNT.size <= end:
+            (length,) = _COUNT.unpack_from(view, offset)
+            start = offset + _COUNT.size
+            offset = start + length
+            if offset > end:
+                return
+            kind = view[start]
+            if kind == KIND_EVENT:
+                _, tick, shape_id = _EVENT.unpack_from(view, start)
+                event_type, keys = shapes[shape_id]
+                cursor = start + _EVENT.size
+                payload = {}
+                for key in keys:
+                    payload[key], cursor = _decode_value(view, cursor)
+                yield JournalEntry(tick, event_type, payload)
+            elif kind == KIND_SHAPE:
+                _, shape_id = _SHAPE.unpack_from(view, start)
+                event_type, cursor = _decode_str(view, start + _SHAPE.size)
+                (count,) = _COUNT.unpack_from(view, cursor)
+                cursor += _COUNT.size
+                names = []
+                for _ in range(count):
+                    name, cursor = _decode_str(view, cursor)
+                    names.append(name)
+                shapes[shape_id] = (event_type, tuple(names))
+            else:
+                raise JournalError(f"Unknown record kind {kind}")
+
+    def replay(
+        self: Self,
+        event_bus: EventBus,
+        *,
+        tick_rate: float | None = None,
+        start_tick: int = 0,
+        end_tick: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> int:
+        """Publish journaled events on ``event_bus`` and return how many were replayed.
+
+        ``tick_rate`` paces playback in ticks per second; ``None`` replays as fast
+        as possible. Events outside ``[start_tick, end_tick]`` are skipped.
+        """
+        replayed = 0
+        previous_tick: int | None = None
+        for entry in self:
+            if entry.tick < start_tick:
+                continue
+            if end_tick is not None and entry.tick > end_tick:
+                break
+            if tick_rate is not None and previous_tick is not None and entry.tick > previous_tick:
+                sleep((entry.tick - previous_tick) / tick_rate)
+            previous_tick = entry.tick
+            event_bus.publish(entry.event_type, entry.payload)
+            replayed += 1
+        return replayed
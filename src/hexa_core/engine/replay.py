@@ -0,0 +1,252 @@
+"""Deterministic replays: initial level, script hashes and per-tick actions.
+
+A replay re-simulates a ``HeadlessMatch`` from its level, feeding the recorded
+actions back in place of the scripts, and checks the world against the
+incremental state hash of every tick plus full checksums taken periodically
+while recording. Keyframe snapshots let ``Replayer.seek`` start from the
+nearest earlier tick instead of tick zero.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Final, Self
+
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.script_runner import ActionRecord, ScriptRunner
+from hexa_core.engine.serialization import dumps
+from hexa_core.engine.simulation import DEFAULT_MAX_TICKS, HeadlessMatch, script_paths
+from hexa_core.engine.snapshot import WorldSnapshot
+from hexa_core.engine.world import GameWorld
+
+REPLAY_VERSION: Final = 1
+DEFAULT_CHECKSUM_INTERVAL: Final = 100
+
+
+class ReplayDesyncError(RuntimeError):
+    """Raised when a re-simulated world diverges from the recorded checksums."""
+
+    def __init__(self: Self, tick: int, expected: str, actual: str) -> None:
+        super().__init__(f"Replay diverged at tick {tick}: expected {expected}, got {actual}")
+        self.tick = tick
+        self.expected = expected
+        self.actual = actual
+
+
+def world_checksum(world: GameWorld) -> str:
+    """Digest every live entity and component of ``world``."""
+    return hashlib.blake2b(dumps(world.snapshot()), digest_size=16).hexdigest()
+
+
+def script_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class ReplayRecord:
+    """Everything needed to re-simulate a match.
+
+    ``actions`` holds ``(tick, entity, actions)`` for every entity that acted and
+    ``tick_hashes[n]`` the match's ``StateHash`` value at the end of tick ``n + 1``.
+    ``keyframes`` are kept in memory only; ``Replayer.build_keyframes`` recreates
+    them for a loaded replay.
+    """
+
+    level: LevelData
+    seed: int
+    max_ticks: int
+    action_threshold: int
+    script_hashes: dict[str, str]
+    actions: list[tuple[int, int, tuple[ActionRecord, ...]]] = field(default_factory=list)
+    checksums: dict[int, str] = field(default_factory=dict)
+    tick_hashes: list[int] = field(default_factory=list)
+    final_tick: int = 0
+    keyframes: dict[int, WorldSnapshot] = field(default_factory=dict)
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        return {
+            "version": REPLAY_VERSION,
+            "level": asdict(self.level),
+            "seed": self.seed,
+            "max_ticks": self.max_ticks,
+            "action_threshold": self.action_threshold,
+            "script_hashes": self.script_hashes,
+            "actions": [[tick, entity, [[name, list(arguments)] for name, arguments in actions]] for tick, entity, actions in self.actions],
+            "checksums": {str(tick): digest for tick, digest in self.checksums.items()},
+            "tick_hashes": self.tick_hashes,
+            "final_tick": self.final_tick,
+        }
+
+    @classmethod
+    def from_dict(cls: type[ReplayRecord], data: Mapping[str, Any]) -> ReplayRecord:
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {data.get('version')!r}")
+        level = data["level"]
+        return cls(
+            level=LevelData(
+                name=level["name"],
+                grid_size=LevelGridSize(**level["grid_size"]),
+                tiles=[(str(kind), int(q), int(r)) for kind, q, r in level["tiles"]],
+                entities=[LevelEntity(name=entity["name"], components=entity["components"]) for entity in level["entities"]],
+            ),
+            seed=data["seed"],
+            max_ticks=data["max_ticks"],
+            action_threshold=data["action_threshold"],
+            script_hashes=dict(data["script_hashes"]),
+            actions=[(tick, entity, tuple((name, tuple(arguments)) for name, arguments in actions)) for tick, entity, actions in data["actions"]],
+            checksums={int(tick): digest for tick, digest in data["checksums"].items()},
+            tick_hashes=list(data.get("tick_hashes", ())),
+            final_tick=data["final_tick"],
+        )
+
+    def save(self: Self, path: Path | str) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls: type[ReplayRecord], path: Path | str) -> ReplayRecord:
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class ReplayRecorder:
+    """Observes a match's actions and captures periodic checksums and keyframes."""
+
+    def __init__(
+        self: Self,
+        match: HeadlessMatch,
+        *,
+        script_hashes: Mapping[str, str] | None = None,
+        checksum_interval: int = DEFAULT_CHECKSUM_INTERVAL,
+        keyframe_interval: int = 0,
+    ) -> None:
+        self.match = match
+        self.checksum_interval = checksum_interval
+        self.keyframe_interval = keyframe_interval
+        self.record = ReplayRecord(
+            level=match.level,
+            seed=match.seed,
+            max_ticks=match.max_ticks,
+            action_threshold=match.action_threshold,
+            script_hashes=dict(script_hashes or {}),
+        )
+        match.action_observer = self._observe
+
+    def _observe(self: Self, tick: int, entity: int, actions: Sequence[ActionRecord]) -> None:
+        self.record.actions.append((tick, entity, tuple(actions)))
+
+    def run(self: Self) -> ReplayRecord:
+        """Play the match to completion and return the finished record."""
+        match = self.match
+        record = self.record
+        while not match.finished:
+            match.step()
+            record.tick_hashes.append(match.state_hash.value)
+            _capture(match, record, self.checksum_interval, self.keyframe_interval)
+        record.checksums[match.tick] = world_checksum(match.world)
+        record.final_tick = match.tick
+        return record
+
+
+def _capture(match: HeadlessMatch, record: ReplayRecord, checksum_interval: int, keyframe_interval: int) -> None:
+    tick = match.tick
+    if checksum_interval and tick % checksum_interval == 0:
+        record.checksums[tick] = world_checksum(match.world)
+    if keyframe_interval and tick % keyframe_interval == 0:
+        record.keyframes[tick] = match.world.snapshot()
+
+
+def record_match(
+    level: LevelData,
+    *,
+    script_root: Path | str = ".",
+    seed: int = 0,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    checksum_interval: int = DEFAULT_CHECKSUM_INTERVAL,
+    keyframe_interval: int = 0,
+) -> ReplayRecord:
+    """Run ``level`` with its scripts and record a replay of it."""
+    sources = {path: (Path(script_root) / path).read_text(encoding="utf-8") for path in script_paths(level)}
+    compiler = ScriptRunner()
+    programs = {path: compiler.compile(source) for path, source in sources.items()}
+    match = HeadlessMatch(level, programs=programs, seed=seed, max_ticks=max_ticks)
+    recorder = ReplayRecorder(
+        match,
+        script_hashes={path: script_hash(source) for path, source in sources.items()},
+        checksum_interval=checksum_interval,
+        keyframe_interval=keyframe_interval,
+    )
+    return recorder.run()
+
+
+class Replayer:
+    """Re-simulates a ``ReplayRecord`` from its recorded actions."""
+
+    def __init__(self: Self, record: ReplayRecord) -> None:
+        self.record = record
+        self._actions: dict[tuple[int, int], tuple[ActionRecord, ...]] = {(tick, entity): actions for tick, entity, actions in record.actions}
+
+    def _actions_at(self: Self, tick: int, entity: int) -> Sequence[ActionRecord]:
+        return self._actions.get((tick, entity), ())
+
+    def new_match(self: Self) -> HeadlessMatch:
+        record = self.record
+        return HeadlessMatch(
+            record.level,
+            seed=record.seed,
+            max_ticks=record.max_ticks,
+            action_threshold=record.action_threshold,
+            action_source=self._actions_at,
+        )
+
+    def stale_scripts(self: Self, script_root: Path | str = ".") -> list[str]:
+        """Return script paths whose current source no longer matches the recorded hash."""
+        root = Path(script_root)
+        return sorted(path for path, digest in self.record.script_hashes.items() if not (root / path).is_file() or script_hash((root / path).read_text(encoding="utf-8")) != digest)
+
+    def verify(self: Self) -> HeadlessMatch:
+        """Re-simulate the whole match, raising ``ReplayDesyncError`` at the first diverging tick.
+
+        The state hash is compared on every recorded tick and the full world
+        checksum on every tick that has one.
+        """
+        match = self.new_match()
+        while match.tick < self.record.final_tick and not match.finished:
+            match.step()
+            self._check(match)
+        return match
+
+    def _check(self: Self, match: HeadlessMatch) -> None:
+        tick = match.tick
+        tick_hashes = self.record.tick_hashes
+        if tick <= len(tick_hashes) and tick_hashes[tick - 1] != match.state_hash.value:
+            raise ReplayDesyncError(tick, f"{tick_hashes[tick - 1]:016x}", f"{match.state_hash.value:016x}")
+        expected = self.record.checksums.get(tick)
+        if expected is not None:
+            actual = world_checksum(match.world)
+            if actual != expected:
+                raise ReplayDesyncError(tick, expected, actual)
+
+    def build_keyframes(self: Self, interval: int) -> None:
+        """Simulate once, storing a keyframe every ``interval`` ticks for later seeking."""
+        match = self.new_match()
+        while match.tick < self.record.final_tick and not match.finished:
+            match.step()
+            _capture(match, self.record, 0, interval)
+
+    def seek(self: Self, tick: int) -> HeadlessMatch:
+        """Return a match positioned at the end of ``tick``, starting from the nearest keyframe."""
+        if not 0 <= tick <= self.record.final_tick:
+            raise ValueError(f"Tick {tick} is outside the replay (0..{self.record.final_tick})")
+        match = self.new_match()
+        keyframe_ticks = sorted(self.record.keyframes)
+        index = bisect_right(keyframe_ticks, tick)
+        if index:
+            start = keyframe_ticks[index - 1]
+            match.restore(self.record.keyframes[start], start)
+        while match.tick < tick and match.step():
+            pass
+        return match
@@ -115,8 +115,17 @@ class ScriptRunner:
     def load(self: Self, source: str) -> None:
         """Compile Hexa-Script source into an internal instruction list."""
 
-        tokens = self._tokenize(source)
-        self._program = self._compile(tokens)
+        self._program = self.compile(source)
+
+    def compile(self: Self, source: str) -> ScriptProgram:
+        """Compile Hexa-Script source without loading it, for sharing across runners."""
+
+        return self._compile(self._tokenize(source))
+
+    def load_program(self: Self, program: ScriptProgram) -> None:
+        """Load a program previously produced by `compile`."""
+
+        self._program = program
 
     def execute(self: Self, context: dict[str, object]) -> None:
         """Execute the loaded program against the provided context."""
@@ -353,6 +362,7 @@ class ScriptRunner:
             "IF": self._compile_if,
             "ACTION": self._compile_action,
             "END": self._compile_end,
+            "END_TURN": self._compile_end,
         }
         handler = dispatch.get(keyword)
         if handler is None:
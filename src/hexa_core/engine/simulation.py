@@ -0,0 +1,366 @@
+"""Headless match driver for batch evaluation and fast-forward simulation.
+
+Usable as a library (``HeadlessMatch`` / ``run_match``) or from the command line::
+
+    python -m hexa_core.engine.simulation assets/maps/level_01.json --max-ticks 5000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from itertools import pairwise
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Final, Self, cast
+
+from hexa_core.engine.components import (
+    CombatIntentComponent,
+    MovementIntentComponent,
+    PathComponent,
+    PositionComponent,
+    ScriptComponent,
+    StatsComponent,
+    TurnComponent,
+)
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.events import TURN_READY
+from hexa_core.engine.maps import LevelData, MapLoader
+from hexa_core.engine.script_runner import ActionRecord, ScriptProgram, ScriptRunner, VariableValue
+from hexa_core.engine.snapshot import WorldSnapshot
+from hexa_core.engine.systems.combat_system import CombatSystem
+from hexa_core.engine.systems.movement_system import MovementSystem
+from hexa_core.engine.systems.turn_system import ACTION_THRESHOLD, TurnManager
+from hexa_core.engine.world import GameWorld
+
+DEFAULT_MAX_TICKS: Final = 10_000
+ATTACK_DAMAGE: Final = 10
+ATTACK_RANGE: Final = 1
+# Upper bound on the hops a single multi-waypoint move may expand into.
+MAX_PATH_HOPS: Final = 256
+
+# Level JSON component names mapped to engine component constructors.
+LEVEL_COMPONENTS: Final[dict[str, Callable[..., object]]] = {
+    "Position": PositionComponent,
+    "Stats": StatsComponent,
+    "Script": ScriptComponent,
+    "Turn": TurnComponent,
+}
+
+# (tick, entity) -> actions to use instead of running the entity's script.
+ActionSource = Callable[[int, int], Sequence[ActionRecord]]
+# (tick, entity, actions) called for every entity that acted on a tick.
+ActionObserver = Callable[[int, int, Sequence[ActionRecord]], None]
+
+
+@dataclass(frozen=True, slots=True)
+class MatchResult:
+    """Outcome of a headless match."""
+
+    map_name: str
+    seed: int
+    ticks: int
+    elapsed_seconds: float
+    winner: str | None
+    survivors: tuple[str, ...]
+    # Final ``StateHash`` value: equal results from a deterministic engine agree on it.
+    state_hash: int = 0
+
+    @property
+    def ticks_per_second(self: Self) -> float:
+        return self.ticks / self.elapsed_seconds if self.elapsed_seconds > 0 else float("inf")
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        return {**asdict(self), "ticks_per_second": self.ticks_per_second}
+
+
+def load_programs(paths: Sequence[Path | str], root: Path | str = ".") -> dict[str, ScriptProgram]:
+    """Compile each script once, keyed by the path string used in level files."""
+    compiler = ScriptRunner()
+    base = Path(root)
+    return {str(path): compiler.compile((base / path).read_text(encoding="utf-8")) for path in paths}
+
+
+def script_paths(level: LevelData) -> tuple[str, ...]:
+    """Return the distinct script paths referenced by ``level``'s entities."""
+    found: dict[str, None] = {}
+    for entity in level.entities:
+        script = entity.components.get("Script")
+        if script is not None:
+            found[script["path"]] = None
+    return tuple(found)
+
+
+class HeadlessMatch:
+    """Runs a level to completion without a renderer.
+
+    Each tick processes ``TurnManager``, ``MovementSystem`` and ``CombatSystem``, then
+    executes the script of every entity that became ready, in entity order. Scripts
+    read their situation from variables and emit ``move`` (axial target) and
+    ``attack`` (entity id) actions, which become intents resolved on the next tick.
+    ``move`` with several ``q r`` waypoints becomes a ``PathComponent`` that is
+    walked one hex per tick without re-running the script.
+    ``CombatSystem`` removes defeated entities; the match ends when at most one
+    combatant remains or ``max_ticks`` is reached.
+
+    With ``action_source`` no scripts are compiled or run; each ready entity's
+    actions come from the source instead, which is how replays re-simulate.
+    ``action_observer`` sees every non-empty action list before it is queued.
+    ``state_hash`` is kept current by the systems, giving an O(1) checksum per tick.
+    """
+
+    def __init__(
+        self: Self,
+        level: LevelData,
+        *,
+        programs: Mapping[str, ScriptProgram] | None = None,
+        script_root: Path | str = ".",
+        seed: int = 0,
+        max_ticks: int = DEFAULT_MAX_TICKS,
+        action_threshold: int = ACTION_THRESHOLD,
+        action_source: ActionSource | None = None,
+    ) -> None:
+        self.level = level
+        self.action_source = action_source
+        self.action_observer: ActionObserver | None = None
+        self.seed = seed
+        self.max_ticks = max_ticks
+        self.action_threshold = action_threshold
+        self.tick = 0
+        self.world = GameWorld()
+        self.names: dict[int, str] = {}
+        self._ready: list[int] = []
+        self._runners: dict[int, ScriptRunner] = {}
+
+        bus = self.world.event_bus
+        commands = self.world.command_buffer
+        self.state_hash = self.world.enable_state_hash()
+        self.turn_manager = TurnManager(bus, action_threshold, state_hash=self.state_hash)
+        self.world.add_processor(self.turn_manager, priority=3)
+        self.world.add_processor(MovementSystem(bus, commands, state_hash=self.state_hash), priority=2)
+        self.world.add_processor(CombatSystem(bus, commands, state_hash=self.state_hash), priority=1)
+        bus.subscribe(TURN_READY, self._on_turn_ready)
+
+        if action_source is not None:
+            compiled: dict[str, ScriptProgram] = {}
+        else:
+            compiled = dict(programs) if programs is not None else load_programs(script_paths(level), script_root)
+        self._spawn_entities(compiled)
+        self.world.rehash()
+        self.finished = False
+        self._update_finished()
+
+    def _spawn_entities(self: Self, programs: Mapping[str, ScriptProgram]) -> None:
+        for entity_data in self.level.entities:
+            components = [LEVEL_COMPONENTS[name](**fields) for name, fields in entity_data.components.items() if name in LEVEL_COMPONENTS]
+            if "Stats" in entity_data.components and "Turn" not in entity_data.components:
+                components.append(TurnComponent())
+            entity = cast(int, self.world.create_entity(*components))
+            self.names[entity] = entity_data.name
+
+            script = entity_data.components.get("Script")
+            if script is not None and self.action_source is None:
+                runner = ScriptRunner()
+                runner.load_program(programs[script["path"]])
+                self._runners[entity] = runner
+
+    # -- Event handlers ----------------------------------------------------
+
+    def _on_turn_ready(self: Self, _: str, payload: Mapping[str, Any]) -> None:
+        self._ready.append(payload["entity_id"])
+
+    # -- Simulation ----------------------------------------------------------
+
+    def combatants(self: Self) -> list[int]:
+        """Return living entities with stats, in entity order."""
+        stats = cast(list[tuple[int, StatsComponent]], self.world.get_component(StatsComponent))
+        return sorted(entity for entity, entity_stats in stats if entity_stats.health > 0)
+
+    def _update_finished(self: Self) -> bool:
+        self.finished = self.tick >= self.max_ticks or len(self.combatants()) <= 1
+        return self.finished
+
+    def step(self: Self) -> bool:
+        """Advance one tick. Returns ``False`` once the match has finished."""
+        if self.finished:
+            return False
+
+        self.world.process()
+        self.tick += 1
+
+        ready, self._ready = sorted(self._ready), []
+        if ready:
+            combatants = self.combatants()
+            alive = set(combatants)
+            for entity in ready:
+                if entity not in alive:
+                    continue
+                actions = self._actions_for(entity, combatants)
+                if actions and self.action_observer is not None:
+                    self.action_observer(self.tick, entity, actions)
+                self._queue_intents(entity, actions, alive)
+                self.world.consume_turn(entity)
+            self.world.apply_commands()
+        return not self._update_finished()
+
+    def restore(self: Self, snapshot: WorldSnapshot, tick: int) -> None:
+        """Resume from a world snapshot taken at the end of ``tick``."""
+        self.world.restore(snapshot)
+        self.tick = tick
+        self._ready = []
+        self._update_finished()
+
+    def run(self: Self) -> MatchResult:
+        """Simulate until the match finishes and report the outcome."""
+        start = perf_counter()
+        while self.step():
+            pass
+        elapsed = perf_counter() - start
+        survivors = tuple(self.names[entity] for entity in self.combatants())
+        return MatchResult(
+            map_name=self.level.name,
+            seed=self.seed,
+            ticks=self.tick,
+            elapsed_seconds=elapsed,
+            winner=survivors[0] if len(survivors) == 1 else None,
+            survivors=survivors,
+            state_hash=self.state_hash.value,
+        )
+
+    # -- Script integration --------------------------------------------------
+
+    def script_variables(self: Self, entity: int, combatants: Sequence[int]) -> dict[str, VariableValue]:
+        """Build the variables a script sees: itself, its nearest enemy and the match state."""
+        world = self.world
+        position = cast(PositionComponent, world.component_for_entity(entity, PositionComponent))
+        stats = cast(StatsComponent, world.component_for_entity(entity, StatsComponent))
+        origin = HexCoord(position.q, position.r)
+        variables: dict[str, VariableValue] = {
+            "self_id": entity,
+            "self_q": position.q,
+            "self_r": position.r,
+            "health": stats.health,
+            "tick": self.tick,
+            "seed": self.seed,
+            "enemies": len(combatants) - 1,
+            "target_id": 0,
+        }
+
+        nearest: tuple[int, int, HexCoord] | None = None
+        for other in combatants:
+            other_position = cast(PositionComponent | None, world.try_component(other, PositionComponent))
+            if other == entity or other_position is None:
+                continue
+            coord = HexCoord(other_position.q, other_position.r)
+            candidate = (origin.distance_to(coord), other, coord)
+            if nearest is None or candidate[:2] < nearest[:2]:
+                nearest = candidate
+        if nearest is not None:
+            distance, target, coord = nearest
+            variables.update(target_id=target, target_q=coord.q, target_r=coord.r, target_distance=distance)
+        return variables
+
+    def _actions_for(self: Self, entity: int, combatants: Sequence[int]) -> Sequence[ActionRecord]:
+        if self.action_source is not None:
+            return self.action_source(self.tick, entity)
+        runner = self._runners.get(entity)
+        if runner is None or self.world.try_component(entity, PositionComponent) is None:
+            return []
+        context: dict[str, object] = {"variables": self.script_variables(entity, combatants), "actions": []}
+        runner.execute(context)
+        return cast(list[ActionRecord], context["actions"])
+
+    def _queue_intents(self: Self, entity: int, actions: Sequence[ActionRecord], alive: set[int]) -> None:
+        commands = self.world.command_buffer
+        for name, arguments in actions:
+            action = name.lower()
+            if action == "move" and len(arguments) == 2:
+                step = self._step_toward(entity, arguments)
+                if step is not None:
+                    commands.add_component(entity, MovementIntentComponent(target=step))
+            elif action == "move" and len(arguments) > 2 and len(arguments) % 2 == 0:
+                hops = self._hops_through(entity, arguments)
+                if hops:
+                    commands.add_component(entity, PathComponent.through(hops))
+            elif action == "attack" and len(arguments) == 1 and arguments[0] in alive and self._in_range(entity, arguments[0]):
+                commands.add_component(entity, CombatIntentComponent(target=cast(int, arguments[0]), damage=ATTACK_DAMAGE))
+
+    def _step_toward(self: Self, entity: int, target: Sequence[VariableValue]) -> HexCoord | None:
+        goals = _waypoints(target)
+        if not goals:
+            return None
+        position = cast(PositionComponent, self.world.component_for_entity(entity, PositionComponent))
+        origin, goal = HexCoord(position.q, position.r), goals[0]
+        if origin == goal:
+            return None
+        return min(origin.neighbors(), key=goal.distance_to)
+
+    def _hops_through(self: Self, entity: int, waypoints: Sequence[VariableValue]) -> list[HexCoord]:
+        """Expand ``q1 r1 q2 r2 ...`` into the single-hex hops that walk through each waypoint.
+
+        Returns no hops if the walk is longer than ``MAX_PATH_HOPS``.
+        """
+        goals = _waypoints(waypoints)
+        position = cast(PositionComponent, self.world.component_for_entity(entity, PositionComponent))
+        current = HexCoord(position.q, position.r)
+        if not goals or sum(start.distance_to(goal) for start, goal in pairwise([current, *goals])) > MAX_PATH_HOPS:
+            return []
+        hops: list[HexCoord] = []
+        for goal in goals:
+            while current != goal:
+                current = min(current.neighbors(), key=goal.distance_to)
+                hops.append(current)
+        return hops
+
+    def _in_range(self: Self, entity: int, target: VariableValue) -> bool:
+        if not isinstance(target, int) or target == entity:
+            return False
+        own = cast(PositionComponent | None, self.world.try_component(entity, PositionComponent))
+        other = cast(PositionComponent | None, self.world.try_component(target, PositionComponent))
+        if own is None or other is None:
+            return False
+        return HexCoord(own.q, own.r).distance_to(HexCoord(other.q, other.r)) <= ATTACK_RANGE
+
+
+def _waypoints(arguments: Sequence[VariableValue]) -> list[HexCoord]:
+    """Parse ``q1 r1 q2 r2 ...`` move arguments; empty unless every coordinate is an int."""
+    if any(not isinstance(value, int) for value in arguments):
+        return []
+    return [HexCoord(cast(int, q), cast(int, r)) for q, r in zip(arguments[0::2], arguments[1::2], strict=True)]
+
+
+def run_match(
+    map_path: Path | str,
+    *,
+    script_root: Path | str = ".",
+    seed: int = 0,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+) -> MatchResult:
+    """Load ``map_path`` and simulate it to completion."""
+    level = MapLoader().load(map_path)
+    return HeadlessMatch(level, script_root=script_root, seed=seed, max_ticks=max_ticks).run()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a Hexa-Core match headlessly and report ticks per second.")
+    parser.add_argument("map", type=Path, help="Path to a level JSON file.")
+    parser.add_argument("--script-root", type=Path, default=Path("."), help="Directory script paths are relative to.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--json", action="store_true", help="Emit the result as JSON.")
+    args = parser.parse_args(argv)
+
+    result = run_match(args.map, script_root=args.script_root, seed=args.seed, max_ticks=args.max_ticks)
+    if args.json:
+        sys.stdout.write(json.dumps(result.to_dict()) + "\n")
+    else:
+        outcome = f"winner {result.winner}" if result.winner else f"draw ({len(result.survivors)} survivors)"
+        sys.stdout.write(f"{result.map_name}: {outcome} after {result.ticks} ticks ({result.ticks_per_second:,.0f} ticks/s)\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+"""Column-packed world snapshots for rollback, lookahead and replay seeking."""
+
+from __future__ import annotations
+
+import copy
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Self
+
+from hexa_core.engine import storage
+
+Column = Sequence[Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentColumns:
+    """All instances of one component type, stored field-by-field.
+
+    Components that cannot be rebuilt from their ``__init__`` fields (non-dataclasses,
+    field-less or ``init=False`` fields) are kept as deep copies in ``instances``.
+    """
+
+    component_type: type[Any]
+    entities: array[int]
+    fields: tuple[Column, ...] = ()
+    instances: tuple[object, ...] = ()
+
+    def __len__(self: Self) -> int:
+        return len(self.entities)
+
+
+@dataclass(frozen=True, slots=True)
+class WorldSnapshot:
+    """Immutable capture of every live entity and component in a world.
+
+    Field values are shared with the live components rather than copied, so
+    component fields must hold immutable values (ints, strings, ``HexCoord``).
+    """
+
+    next_entity: int
+    entities: array[int]
+    columns: tuple[ComponentColumns, ...]
+
+    @property
+    def entity_count(self: Self) -> int:
+        return len(self.entities)
+
+
+_FIELD_NAMES: dict[type[Any], tuple[str, ...] | None] = {}
+
+
+def _field_names(component_type: type[Any]) -> tuple[str, ...] | None:
+    try:
+        return _FIELD_NAMES[component_type]
+    except KeyError:
+        pass
+    names: tuple[str, ...] | None = None
+    if is_dataclass(component_type):
+        declared = fields(component_type)
+        if declared and all(item.init for item in declared):
+            names = tuple(item.name for item in declared)
+    _FIELD_NAMES[component_type] = names
+    return names
+
+
+def _pack(values: tuple[Any, ...]) -> Column:
+    """Store all-int columns in a signed 64-bit array; keep anything else as a tuple."""
+    if set(map(type, values)) == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    return values
+
+
+def capture_snapshot() -> WorldSnapshot:
+    """Capture the active esper context. Entities pending deletion are excluded."""
+    table = storage.entity_table()
+    dead = storage.dead_entities()
+    columns: list[ComponentColumns] = []
+    for component_type, members in storage.component_index().items():
+        owners = sorted(members - dead) if dead else sorted(members)
+        if not owners:
+            continue
+        entities = array("q", owners)
+        names = _field_names(component_type)
+        if names is None:
+            instances = tuple(copy.deepcopy(table[entity][component_type]) for entity in owners)
+            columns.append(ComponentColumns(component_type, entities, instances=instances))
+            continue
+        live_components = [table[entity][component_type] for entity in owners]
+        packed = tuple(_pack(tuple(map(attrgetter(name), live_components))) for name in names)
+        columns.append(ComponentColumns(component_type, entities, fields=packed))
+
+    live = sorted(table.keys() - dead) if dead else sorted(table)
+    return WorldSnapshot(
+        next_entity=storage.peek_next_entity(),
+        entities=array("q", live),
+        columns=tuple(columns),
+    )
+
+
+def restore_snapshot(snapshot: WorldSnapshot) -> None:
+    """Replace the active esper context's entities with ``snapshot``'s contents."""
+    table = storage.entity_table()
+    index = storage.component_index()
+    table.clear()
+    index.clear()
+    storage.dead_entities().clear()
+
+    for entity in snapshot.entities:
+        table[entity] = {}
+    for column in snapshot.columns:
+        component_type = column.component_type
+        if not column.instances:
+            instances: Any = map(component_type, *column.fields)
+        else:
+            instances = (copy.deepcopy(instance) for instance in column.instances)
+        for entity, component in zip(column.entities, instances, strict=True):
+            table[entity][component_type] = component
+        index[component_type] = set(column.entities)
+
+    storage.reset_entity_counter(snapshot.next_entity)
+    storage.invalidate_queries()
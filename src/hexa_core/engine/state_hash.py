@@ -0,0 +1,80 @@
+"""Incremental (Zobrist-style) hash of the simulation-relevant world state.
+
+Every tracked component contributes a 64-bit key: a BLAKE2b digest of its entity
+id and field values packed as int64s. The world hash is the XOR of all keys. Because XOR is its own
+inverse, a mutation costs two key computations::
+
+    state_hash.toggle(entity, position)  # remove the old key
+    position.q, position.r = destination.q, destination.r
+    state_hash.toggle(entity, position)  # add the new key
+
+Engine systems and ``CommandBuffer.apply`` do this for ``PositionComponent``,
+``StatsComponent`` and ``TurnComponent``, so ``value`` is an O(1) per-tick
+checksum. Code that mutates those components directly must call
+``GameWorld.rehash`` afterwards.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable, Mapping
+from hashlib import blake2b
+from typing import Any, Final, Self
+
+from hexa_core.engine.components import PositionComponent, StatsComponent, TurnComponent
+
+# Component type -> (entity, component) -> packed fields. The leading tag keeps
+# equal field values on different component types from cancelling out.
+_KEYS: Final[dict[type[Any], Callable[[int, Any], tuple[int, ...]]]] = {
+    PositionComponent: lambda entity, component: (1, entity, component.q, component.r),
+    StatsComponent: lambda entity, component: (2, entity, component.health, component.speed, component.processor),
+    TurnComponent: lambda entity, component: (3, entity, component.turn_counter, component.ready),
+}
+
+TRACKED_COMPONENTS: Final = tuple(_KEYS)
+_PACKERS: Final = {size: struct.Struct(f"<{size}q") for size in (4, 5)}
+
+
+def _digest(fields: tuple[int, ...]) -> int:
+    # Not hash(): it is not a 64-bit mix, e.g. hash(-1) == hash(-2).
+    try:
+        data = _PACKERS[len(fields)].pack(*fields)
+    except struct.error:  # a field beyond 64 bits
+        data = repr(fields).encode()
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+
+def component_key(entity: int, component: object) -> int:
+    """Return the 64-bit key ``component`` contributes, or 0 for untracked types."""
+    key = _KEYS.get(type(component))
+    return 0 if key is None else _digest(key(entity, component))
+
+
+class StateHash:
+    """Running XOR of ``component_key`` over every tracked component."""
+
+    __slots__ = ("value",)
+
+    def __init__(self: Self) -> None:
+        self.value = 0
+
+    def __repr__(self: Self) -> str:
+        return f"{type(self).__name__}({self.value:016x})"
+
+    def toggle(self: Self, entity: int, component: object) -> None:
+        """Add ``component``'s key to the hash, or remove it if already present."""
+        key = _KEYS.get(type(component))
+        if key is not None:
+            self.value ^= _digest(key(entity, component))
+
+    def toggle_all(self: Self, entity: int, components: Mapping[type[Any], object]) -> None:
+        """Toggle every tracked component of one entity (on creation or deletion)."""
+        for component in components.values():
+            self.toggle(entity, component)
+
+    def reset(self: Self, entities: Mapping[int, Mapping[type[Any], object]]) -> int:
+        """Recompute the hash from an ``entity -> {type: component}`` table and return it."""
+        self.value = 0
+        for entity, components in entities.items():
+            self.toggle_all(entity, components)
+        return self.value
@@ -0,0 +1,109 @@
+"""Direct access to the active esper context's entity database.
+
+``esper`` keeps each world's storage in module-level globals that are swapped by
+``esper.switch_world``. The public API clears the query cache on every structural
+change, which is wasteful for bulk operations (command buffers, snapshots, save
+states). These helpers expose the underlying tables of the *currently active*
+context so bulk writers can mutate them directly and invalidate the cache once.
+
+The layout mirrors ``esper==3.3.0``, which is pinned in ``pyproject.toml``.
+Always call these helpers inside ``GameWorld._activate_context()``.
+"""
+
+from __future__ import annotations
+
+import copy
+from itertools import count
+from typing import Any
+
+import esper
+
+EntityTable = dict[int, dict[type[Any], Any]]
+ComponentIndex = dict[type[Any], set[int]]
+
+
+def entity_table() -> EntityTable:
+    """Return the ``entity -> {component_type: instance}`` table."""
+    return esper._entities
+
+
+def component_index() -> ComponentIndex:
+    """Return the ``component_type -> {entity}`` index."""
+    return esper._components
+
+
+def dead_entities() -> set[int]:
+    """Return entities marked for deferred deletion."""
+    return esper._dead_entities
+
+
+def processors() -> list[esper.Processor]:
+    """Return registered processors in execution (priority) order."""
+    return esper._processors
+
+
+def allocate_entity() -> int:
+    """Reserve the next entity id without touching the query cache."""
+    entity = next(esper._entity_count)
+    esper._entities.setdefault(entity, {})
+    return entity
+
+
+def peek_next_entity() -> int:
+    """Return the id the next ``create_entity`` call would hand out."""
+    return next(copy.copy(esper._entity_count))
+
+
+def reset_entity_counter(next_entity: int) -> None:
+    """Make ``next_entity`` the next id handed out by the active context."""
+    counter = count(start=next_entity)
+    esper._entity_count = counter
+    name = esper.current_world
+    state = esper._context_map[name]
+    esper._context_map[name] = (counter, *state[1:])
+
+
+def attach_component(entity: int, component: object, component_type: type[Any] | None = None) -> None:
+    """Add ``component`` to ``entity`` without clearing the query cache."""
+    key = component_type or type(component)
+    index = esper._components.get(key)
+    if index is None:
+        index = esper._components[key] = set()
+    index.add(entity)
+    esper._entities[entity][key] = component
+
+
+def detach_component(entity: int, component_type: type[Any]) -> object | None:
+    """Remove ``component_type`` from ``entity`` if present, without clearing the cache."""
+    components = esper._entities.get(entity)
+    if components is None or component_type not in components:
+        return None
+    index = esper._components[component_type]
+    index.discard(entity)
+    if not index:
+        del esper._components[component_type]
+    removed: object = components.pop(component_type)
+    return removed
+
+
+def discard_entity(entity: int) -> bool:
+    """Delete ``entity`` immediately, without clearing the cache.
+
+    Returns ``False`` when the entity does not exist.
+    """
+    components = esper._entities.pop(entity, None)
+    if components is None:
+        return False
+    index = esper._components
+    for component_type in components:
+        entities = index[component_type]
+        entities.discard(entity)
+        if not entities:
+            del index[component_type]
+    esper._dead_entities.discard(entity)
+    return True
+
+
+def invalidate_queries() -> None:
+    """Clear esper's ``get_component(s)`` caches once after a bulk change."""
+    esper.clear_cache()
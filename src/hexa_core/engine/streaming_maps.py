@@ -0,0 +1,266 @@
+"""Streaming JSON map loading into compact arrays.
+
+``StreamingMapLoader`` reads a map file in fixed-size chunks and decodes the
+``tiles`` and ``entities`` arrays one element at a time with the C JSON decoder.
+The document tree is never held in memory: tiles go straight into parallel
+``array`` columns of palette indices and axial coordinates. Schema errors are
+raised as soon as the offending element is read, with its index and character
+offset.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from array import array
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Final, Self, TypeVar
+
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+
+CHUNK_SIZE: Final = 1 << 16
+_WHITESPACE: Final = re.compile(r"[ \t\n\r]*")
+_DECODER: Final = json.JSONDecoder()
+_INT32: Final = range(-(2**31), 2**31)
+# Longest token a cut-off window can misread: a surrogate pair escape such as ``\ud83d\ude00``.
+_MAX_TOKEN: Final = 12
+
+_T = TypeVar("_T")
+
+
+class MapSchemaError(ValueError):
+    """Raised when a map file is not valid JSON or does not match the map schema."""
+
+
+@dataclass(slots=True)
+class CompactLevel:
+    """A level whose tiles are stored column-wise: palette index, ``q`` and ``r`` per tile."""
+
+    name: str
+    grid_size: LevelGridSize
+    palette: list[str] = field(default_factory=list)
+    tile_types: array[int] = field(default_factory=lambda: array("B"))
+    tile_q: array[int] = field(default_factory=lambda: array("i"))
+    tile_r: array[int] = field(default_factory=lambda: array("i"))
+    entities: list[LevelEntity] = field(default_factory=list)
+
+    @property
+    def tile_count(self: Self) -> int:
+        return len(self.tile_types)
+
+    def tiles(self: Self) -> Iterator[tuple[str, int, int]]:
+        palette = self.palette
+        for kind, q, r in zip(self.tile_types, self.tile_q, self.tile_r, strict=True):
+            yield palette[kind], q, r
+
+    def to_level(self: Self) -> LevelData:
+        """Expand into the ``LevelData`` that ``MapLoader`` returns for the same file."""
+        return LevelData(name=self.name, grid_size=self.grid_size, tiles=list(self.tiles()), entities=self.entities)
+
+
+class _ChunkReader:
+    """A sliding window over a text stream that decodes JSON values from the window."""
+
+    def __init__(self: Self, stream: IO[str], chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0  # characters dropped from the front of the window
+        self._unbatchable_end = -1
+
+    def _fill(self: Self) -> bool:
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def error(self: Self, message: str, pos: int | None = None) -> MapSchemaError:
+        return MapSchemaError(f"{message} at character {self.offset + (self.pos if pos is None else pos)}")
+
+    def peek(self: Self) -> str:
+        """Skip whitespace and return the next character, or ``""`` at the end of the stream."""
+        while True:
+            match = _WHITESPACE.match(self.buffer, self.pos)
+            self.pos = match.end() if match else self.pos
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self: Self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def decode(self: Self) -> object:
+        """Decode the next JSON value, reading more of the stream only while it may be incomplete."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                # A token cut off by the window edge (``tr``, ``-``, a ``\u`` escape) fails at its
+                # start, within one token of the edge; an open string fails where it starts.
+                if (exc.pos >= len(self.buffer) - _MAX_TOKEN or exc.msg.startswith("Unterminated string")) and self._fill():
+                    continue
+                raise self.error(f"Invalid JSON ({exc.msg})", exc.pos) from None
+            # A number ending near the window edge may continue in the next chunk (``1.`` then ``5``).
+            if end > len(self.buffer) - _MAX_TOKEN and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def decode_objects(self: Self) -> list[Any]:
+        """Decode every complete array element up to the window's last ``}`` in one call.
+
+        Returns an empty list when that span does not parse as a run of elements
+        (a nested object, the end of the array, a syntax error); ``decode`` then
+        takes over until the window is refilled.
+        """
+        window_end = self.offset + len(self.buffer)
+        cut = self.buffer.rfind("}", self.pos)
+        if cut < 0 or window_end == self._unbatchable_end:
+            return []
+        try:
+            values: list[Any] = json.loads(f"[{self.buffer[self.pos : cut + 1]}]")
+        except json.JSONDecodeError:
+            self._unbatchable_end = window_end
+            return []
+        self.pos = cut + 1
+        return values
+
+
+class StreamingMapLoader:
+    """Load map definitions from JSON files without building the document tree."""
+
+    def __init__(self: Self, chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def load(self: Self, path: Path | str) -> CompactLevel:
+        map_path = Path(path)
+        if not map_path.exists():
+            raise FileNotFoundError(f"Map file not found: {map_path}")
+        with map_path.open(encoding="utf-8") as stream:
+            return self.load_stream(stream)
+
+    def load_stream(self: Self, stream: IO[str]) -> CompactLevel:
+        reader = _ChunkReader(stream, self.chunk_size)
+        level = CompactLevel(name="", grid_size=LevelGridSize(width=0, height=0))
+        seen: set[str] = set()
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                key = reader.decode()
+                if not isinstance(key, str):
+                    raise reader.error("Expected a key")
+                reader.expect(":")
+                self._field(reader, level, key)
+                seen.add(key)
+                separator = reader.peek()
+                if separator not in ",}":
+                    raise reader.error("Expected ',' or '}'")
+                reader.pos += 1
+                if separator == "}":
+                    break
+        if reader.peek():
+            raise reader.error("Unexpected data after the map")
+        for required in ("name", "grid_size"):
+            if required not in seen:
+                raise MapSchemaError(f"Map is missing {required!r}")
+        return level
+
+    def _field(self: Self, reader: _ChunkReader, level: CompactLevel, key: str) -> None:
+        if key == "tiles":
+            indices = {kind: index for index, kind in enumerate(level.palette)}
+            self._array(reader, "tiles", lambda tiles, start: _add_tiles(level, indices, tiles, start), batched=True)
+        elif key == "entities":
+            self._array(reader, "entities", lambda entities, start: level.entities.extend(_entity(entity, start + offset) for offset, entity in enumerate(entities)))
+        elif key == "name":
+            level.name = _typed(reader.decode(), str, "name")
+        elif key == "grid_size":
+            level.grid_size = _grid_size(reader.decode())
+        else:
+            reader.decode()
+
+    def _array(self: Self, reader: _ChunkReader, key: str, add: Callable[[list[Any], int], None], *, batched: bool = False) -> None:
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.pos += 1
+            return
+        index = 0
+        while True:
+            values = (batched and reader.decode_objects()) or [reader.decode()]
+            add(values, index)
+            index += len(values)
+            separator = reader.peek()
+            if separator not in ",]":
+                raise reader.error(f"Expected ',' or ']' after {key}[{index - 1}]")
+            reader.pos += 1
+            if separator == "]":
+                return
+
+
+def _typed(value: object, kind: type[_T], where: str) -> _T:
+    # bool is an int subclass; maps never use it for numbers.
+    if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+        expected = "object" if kind is dict else kind.__name__
+        raise MapSchemaError(f"{where} must be {'an' if expected[0] in 'aeiou' else 'a'} {expected}, got {type(value).__name__}")
+    return value
+
+
+def _field_of(value: dict[str, Any], name: str, where: str) -> object:
+    try:
+        return value[name]
+    except KeyError:
+        raise MapSchemaError(f"{where} is missing {name!r}") from None
+
+
+def _grid_size(grid: object) -> LevelGridSize:
+    grid = _typed(grid, dict, "grid_size")
+    return LevelGridSize(width=_typed(_field_of(grid, "width", "grid_size"), int, "grid_size.width"), height=_typed(_field_of(grid, "height", "grid_size"), int, "grid_size.height"))
+
+
+def _tile(tile: object, index: int) -> tuple[str, int, int]:
+    where = f"tiles[{index}]"
+    tile = _typed(tile, dict, where)
+    kind = _typed(_field_of(tile, "type", where), str, f"{where}.type")
+    q, r = (_typed(_field_of(tile, axis, where), int, f"{where}.{axis}") for axis in ("q", "r"))
+    if q not in _INT32 or r not in _INT32:
+        raise MapSchemaError(f"{where} coordinates do not fit in 32 bits")
+    return kind, q, r
+
+
+def _add_tiles(level: CompactLevel, indices: dict[str, int], tiles: list[Any], start: int) -> None:
+    """Append a run of tiles, validating the whole run with C-level passes where possible."""
+    try:
+        kinds, qs, rs = [tile["type"] for tile in tiles], [tile["q"] for tile in tiles], [tile["r"] for tile in tiles]
+        valid = set(map(type, kinds)) <= {str} and set(map(type, qs)) | set(map(type, rs)) <= {int} and min(qs + rs, default=0) in _INT32 and max(qs + rs, default=0) in _INT32
+    except (KeyError, TypeError):
+        valid = False
+    if not valid:
+        # Recheck one tile at a time so the error names the first bad one.
+        kinds, qs, rs = (list(column) for column in zip(*(_tile(tile, start + offset) for offset, tile in enumerate(tiles)), strict=True))
+    for kind in dict.fromkeys(kinds):
+        if kind not in indices:
+            indices[kind] = len(level.palette)
+            level.palette.append(kind)
+    if len(level.palette) > 0x100 and level.tile_types.typecode == "B":
+        level.tile_types = array("H", level.tile_types)
+    level.tile_types.extend(map(indices.__getitem__, kinds))
+    level.tile_q.extend(qs)
+    level.tile_r.extend(rs)
+
+
+def _entity(entity: object, index: int) -> LevelEntity:
+    where = f"entities[{index}]"
+    entity = _typed(entity, dict, where)
+    components = _typed(entity.get("components", {}), dict, f"{where}.components")
+    return LevelEntity(name=_typed(_field_of(entity, "name", where), str, f"{where}.name"), components=components)
@@ -7,41 +7,93 @@ from typing import Self, cast
 
 import esper
 
+from hexa_core.engine import storage
+from hexa_core.engine.command_buffer import CommandBuffer
 from hexa_core.engine.components import CombatIntentComponent, StatsComponent
 from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.events import COMBAT_RESOLVED, CombatResolved, RecordPool
+from hexa_core.engine.state_hash import StateHash
 
 
 class CombatSystem(esper.Processor):
-    """Processes combat intents and applies damage."""
+    """Resolves all combat intents of a tick simultaneously.
 
-    def __init__(self: Self, event_bus: EventBus) -> None:
+    Intents are grouped by target and their damage summed in one pass, then each
+    target is updated once, in ascending id order, and gets a single aggregated
+    ``COMBAT_RESOLVED`` event. Every intent of the tick lands, even if its attacker
+    is defeated by the same volley, so the outcome does not depend on iteration
+    order. Intents against targets that are missing or already at zero health are
+    dropped. Defeated targets are queued for deletion on the command buffer.
+    """
+
+    def __init__(self: Self, event_bus: EventBus, command_buffer: CommandBuffer | None = None, *, state_hash: StateHash | None = None) -> None:
         super().__init__()
         self._event_bus = event_bus
+        # Without a shared buffer the system flushes its own queue at the end of each pass.
+        self._owns_commands = command_buffer is None
+        self._commands = CommandBuffer() if command_buffer is None else command_buffer
+        self._state_hash = state_hash
+        self._records: RecordPool[CombatResolved] = RecordPool(CombatResolved)
+        self.dropped_intents = 0
 
     def process(self: Self, *_: object, **__: object) -> None:
-        for entity, components in self._intent_components():
-            _stats, intent = components
-            target_stats = esper.component_for_entity(intent.target, StatsComponent)
+        if not self._event_bus.has_pending(COMBAT_RESOLVED):
+            self._records.rewind()
 
-            target_stats.health = max(0, target_stats.health - intent.damage)
-            defeated = target_stats.health == 0
+        damage_by_target: dict[int, int] = {}
+        attackers_by_target: dict[int, list[int]] = {}
+        commands = self._commands
+        for entity, (_stats, intent) in self._intent_components():
+            commands.remove_component(entity, CombatIntentComponent)
+            target = intent.target
+            if target in damage_by_target:
+                damage_by_target[target] += intent.damage
+                attackers_by_target[target].append(entity)
+            else:
+                damage_by_target[target] = intent.damage
+                attackers_by_target[target] = [entity]
+
+        if damage_by_target:
+            self._resolve(damage_by_target, attackers_by_target)
 
-            esper.remove_component(entity, CombatIntentComponent)
+        if self._owns_commands:
+            commands.apply()
+
+    def _resolve(self: Self, damage_by_target: dict[int, int], attackers_by_target: dict[int, list[int]]) -> None:
+        entities = storage.entity_table()
+        state_hash = self._state_hash
+        for target in sorted(damage_by_target):
+            attackers = attackers_by_target[target]
+            components = entities.get(target)
+            target_stats = None if components is None else cast(StatsComponent | None, components.get(StatsComponent))
+            if target_stats is None or target_stats.health <= 0:
+                self.dropped_intents += len(attackers)
+                continue
+
+            damage = damage_by_target[target]
+            if state_hash is not None:
+                state_hash.toggle(target, target_stats)
+            target_stats.health = max(0, target_stats.health - damage)
+            if state_hash is not None:
+                state_hash.toggle(target, target_stats)
+            defeated = target_stats.health == 0
+            if defeated:
+                self._commands.delete_entity(target)
 
-            self._event_bus.publish(
-                "engine.combat.resolved",
-                {
-                    "attacker_id": entity,
-                    "target_id": intent.target,
-                    "damage": intent.damage,
-                    "remaining_health": target_stats.health,
-                    "defeated": defeated,
-                },
-            )
+            attackers.sort()
+            event = self._records.acquire()
+            event.attacker_id = attackers[0]
+            event.attacker_ids = tuple(attackers)
+            event.target_id = target
+            event.damage = damage
+            event.remaining_health = target_stats.health
+            event.defeated = defeated
+            self._event_bus.publish(COMBAT_RESOLVED, event)
 
     def _intent_components(
         self: Self,
     ) -> Iterable[tuple[int, tuple[StatsComponent, CombatIntentComponent]]]:
-        for entity, pair in esper.get_components(StatsComponent, CombatIntentComponent):
-            typed_pair = cast(tuple[StatsComponent, CombatIntentComponent], pair)
-            yield entity, typed_pair
+        return cast(
+            Iterable[tuple[int, tuple[StatsComponent, CombatIntentComponent]]],
+            esper.get_components(StatsComponent, CombatIntentComponent),
+        )
@@ -3,43 +3,222 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Self, cast
+from typing import Final, Self, cast
 
 import esper
 
-from hexa_core.engine.components import MovementIntentComponent, PositionComponent
+from hexa_core.engine.command_buffer import CommandBuffer
+from hexa_core.engine.components import MovementIntentComponent, PathComponent, PositionComponent
 from hexa_core.engine.datatypes import HexCoord
 from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.events import MOVEMENT_BLOCKED, MOVEMENT_COMPLETED, MovementBlocked, MovementCompleted, RecordPool
+from hexa_core.engine.state_hash import StateHash
+
+# Reasons reported on ``MOVEMENT_BLOCKED``.
+BLOCKED_CONTESTED: Final = "contested"  # a lower entity id claimed the same hex
+BLOCKED_OCCUPIED: Final = "occupied"  # the hex holds an entity that is not leaving
+BLOCKED_SWAP: Final = "swap"  # two entities tried to trade places
+
+Hex = tuple[int, int]
+Move = tuple[int, PositionComponent, HexCoord]
+
+# Occupant marker for a hex that already holds more than one entity.
+_CROWDED: Final = -1
 
 
 class MovementSystem(esper.Processor):
-    """Resolves movement intents and publishes completion events."""
+    """Resolves all movement of a tick simultaneously and publishes the outcomes.
 
-    def __init__(self: Self, event_bus: EventBus) -> None:
+    Each target hex goes to the lowest entity id claiming it. A winner moves only if
+    its hex is free or its occupant moves away this tick; chains of movers follow
+    each other, cycles of three or more rotate, and two entities trading places are
+    both blocked. Resolution is linear in the number of moves and independent of
+    iteration order. Every intent is consumed; losers receive ``MOVEMENT_BLOCKED``.
+
+    Entities with a ``PathComponent`` take up to ``speed`` hops per tick, one
+    ``MOVEMENT_COMPLETED`` per hop, resolved in rounds so hop ``n`` of every path
+    lands before hop ``n + 1``. A blocked path is dropped, as is a finished one;
+    a ``MovementIntentComponent`` replaces any path the entity was following.
+    """
+
+    def __init__(self: Self, event_bus: EventBus, command_buffer: CommandBuffer | None = None, *, state_hash: StateHash | None = None) -> None:
         super().__init__()
         self._event_bus = event_bus
+        # Without a shared buffer the system flushes its own queue at the end of each pass.
+        self._owns_commands = command_buffer is None
+        self._commands = CommandBuffer() if command_buffer is None else command_buffer
+        self._records: RecordPool[MovementCompleted] = RecordPool(MovementCompleted)
+        self._blocked_records: RecordPool[MovementBlocked] = RecordPool(MovementBlocked)
+        self._state_hash = state_hash
 
     def process(self: Self, *_: object, **__: object) -> None:
-        for entity, (position, intent) in self._iter_intents():
+        # Last pass's records are reusable once they are no longer queued on a batching bus.
+        if not self._event_bus.has_pending(MOVEMENT_COMPLETED):
+            self._records.rewind()
+        if not self._event_bus.has_pending(MOVEMENT_BLOCKED):
+            self._blocked_records.rewind()
+
+        intents = list(self._iter_intents())
+        paths = list(self._iter_paths())
+        if not intents and not paths:
+            return
+
+        commands = self._commands
+        moves: list[Move] = []
+        for entity, (position, intent) in intents:
+            commands.remove_component(entity, MovementIntentComponent)
+            moves.append((entity, position, intent.target))
+
+        occupants = _occupancy()
+        if paths:
+            self._follow_paths(moves, paths, occupants)
+        else:
+            self._move(moves, occupants)
+
+        if self._owns_commands:
+            commands.apply()
+
+    def _follow_paths(self: Self, moves: list[Move], paths: list[tuple[int, tuple[PositionComponent, PathComponent]]], occupants: dict[Hex, int]) -> None:
+        commands = self._commands
+        redirected = {entity for entity, _, _ in moves}
+        followers: list[tuple[int, PositionComponent, PathComponent]] = []
+        for entity, (position, path) in paths:
+            if entity in redirected or path.remaining <= 0:
+                commands.remove_component(entity, PathComponent)
+            else:
+                followers.append((entity, position, path))
+
+        hop = 0
+        while moves or followers:
+            walking = [follower for follower in followers if follower[2].speed > hop]
+            moves.extend((entity, position, HexCoord(*path.next_hex())) for entity, position, path in walking)
+            if not moves:
+                break
+            blocked = self._move(moves, occupants)
+            followers = []
+            for entity, position, path in walking:
+                if entity in blocked:
+                    commands.remove_component(entity, PathComponent)
+                    continue
+                path.cursor += 1
+                if path.remaining:
+                    followers.append((entity, position, path))
+                else:
+                    commands.remove_component(entity, PathComponent)
+            moves = []
+            hop += 1
+
+    def _move(self: Self, moves: list[Move], occupants: dict[Hex, int]) -> dict[int, str]:
+        """Resolve one round of simultaneous moves, commit them and publish the outcomes."""
+        blocked = resolve_moves([(entity, (destination.q, destination.r)) for entity, _, destination in moves], occupants)
+        state_hash = self._state_hash
+        for entity, position, destination in moves:
             origin = HexCoord(position.q, position.r)
-            destination = intent.target
+            reason = blocked.get(entity)
+            if reason is not None:
+                blocked_event = self._blocked_records.acquire()
+                blocked_event.entity_id = entity
+                blocked_event.origin = origin
+                blocked_event.destination = destination
+                blocked_event.reason = reason
+                self._event_bus.publish(MOVEMENT_BLOCKED, blocked_event)
+                continue
 
+            if state_hash is not None:
+                state_hash.toggle(entity, position)
             position.q = destination.q
             position.r = destination.r
-            esper.remove_component(entity, MovementIntentComponent)
+            if state_hash is not None:
+                state_hash.toggle(entity, position)
+            source = (origin.q, origin.r)
+            if occupants.get(source) == entity:
+                del occupants[source]
+            occupants[(destination.q, destination.r)] = entity
 
-            self._event_bus.publish(
-                "engine.movement.completed",
-                {
-                    "entity_id": entity,
-                    "from": origin,
-                    "to": destination,
-                },
-            )
+            event = self._records.acquire()
+            event.entity_id = entity
+            event.origin = origin
+            event.destination = destination
+            self._event_bus.publish(MOVEMENT_COMPLETED, event)
+        return blocked
 
     def _iter_intents(self: Self) -> Iterable[tuple[int, tuple[PositionComponent, MovementIntentComponent]]]:
         components = esper.get_components(PositionComponent, MovementIntentComponent)
-        return cast(
-            Iterable[tuple[int, tuple[PositionComponent, MovementIntentComponent]]],
-            components,
-        )
+        return cast(Iterable[tuple[int, tuple[PositionComponent, MovementIntentComponent]]], components)
+
+    def _iter_paths(self: Self) -> Iterable[tuple[int, tuple[PositionComponent, PathComponent]]]:
+        components = esper.get_components(PositionComponent, PathComponent)
+        return cast(Iterable[tuple[int, tuple[PositionComponent, PathComponent]]], components)
+
+
+def _occupancy() -> dict[Hex, int]:
+    occupants: dict[Hex, int] = {}
+    for entity, position in cast(list[tuple[int, PositionComponent]], esper.get_component(PositionComponent)):
+        key = (position.q, position.r)
+        occupants[key] = entity if key not in occupants else _CROWDED
+    return occupants
+
+
+def resolve_moves(moves: Iterable[tuple[int, Hex]], occupants: dict[Hex, int]) -> dict[int, str]:
+    """Return ``entity -> BLOCKED_*`` for every ``(entity, target hex)`` move that must stay put.
+
+    ``occupants`` maps each occupied hex to its entity (or ``_CROWDED``) before
+    anyone moves.
+    """
+    targets: dict[int, Hex] = {}
+    claims: dict[Hex, int] = {}
+    blocked: dict[int, str] = {}
+    for entity, target in moves:
+        targets[entity] = target
+        claimant = claims.get(target)
+        if claimant is None or entity < claimant:
+            claims[target] = entity
+            if claimant is not None:
+                blocked[claimant] = BLOCKED_CONTESTED
+        else:
+            blocked[entity] = BLOCKED_CONTESTED
+
+    # Every winner depends on at most one other winner (its target's occupant) and
+    # each winner's hex has one claimant, so the dependencies form disjoint chains
+    # and cycles. Walking each once keeps resolution linear. Winners targeting their
+    # own hex succeed trivially but stay put, so they block like stationary entities.
+    winners = {entity for entity in claims.values() if occupants.get(targets[entity]) != entity}
+    settled: dict[int, str | None] = {}
+    for start in winners:
+        if start not in settled:
+            _settle_chain(start, targets, occupants, winners, settled)
+
+    for entity, outcome in settled.items():
+        if outcome is not None:
+            blocked[entity] = outcome
+    return blocked
+
+
+def _settle_chain(start: int, targets: dict[int, Hex], occupants: dict[Hex, int], winners: set[int], settled: dict[int, str | None]) -> None:
+    """Follow ``start``'s chain of occupants until it frees up, blocks or closes a cycle."""
+    path: list[int] = []
+    on_path: dict[int, int] = {}
+    node = start
+    while node not in settled:
+        on_path[node] = len(path)
+        path.append(node)
+        occupant = occupants.get(targets[node])
+        if occupant is None:
+            outcome = None
+            break
+        if occupant not in winners:
+            outcome = BLOCKED_OCCUPIED
+            break
+        if occupant in on_path:
+            cycle = path[on_path[occupant] :]
+            del path[on_path[occupant] :]
+            cycle_outcome = None if len(cycle) > 2 else BLOCKED_SWAP
+            for member in cycle:
+                settled[member] = cycle_outcome
+            outcome = None if cycle_outcome is None else BLOCKED_OCCUPIED
+            break
+        node = occupant
+    else:
+        outcome = None if settled[node] is None else BLOCKED_OCCUPIED
+    for member in path:
+        settled[member] = outcome
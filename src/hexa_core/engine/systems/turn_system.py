@@ -8,6 +8,8 @@ import esper
 
 from hexa_core.engine.components import StatsComponent, TurnComponent
 from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.events import TURN_READY, RecordPool, TurnReady
+from hexa_core.engine.state_hash import StateHash
 
 ACTION_THRESHOLD = 1000
 
@@ -15,27 +17,34 @@ ACTION_THRESHOLD = 1000
 class TurnManager(esper.Processor):
     """Processor that advances initiative and publishes ready events."""
 
-    def __init__(self: Self, event_bus: EventBus, action_threshold: int = ACTION_THRESHOLD) -> None:
+    def __init__(self: Self, event_bus: EventBus, action_threshold: int = ACTION_THRESHOLD, *, state_hash: StateHash | None = None) -> None:
         super().__init__()
         self._event_bus = event_bus
         self._threshold = action_threshold
+        self._records: RecordPool[TurnReady] = RecordPool(TurnReady)
+        self._state_hash = state_hash
 
     def process(self: Self, *_: object, **__: object) -> None:
+        if not self._event_bus.has_pending(TURN_READY):
+            self._records.rewind()
+
+        state_hash = self._state_hash
         for entity, (stats, turn) in esper.get_components(StatsComponent, TurnComponent):
             if turn.ready:
                 # Preserve ready entities for external consumption until explicitly cleared.
                 continue
 
+            if state_hash is not None:
+                state_hash.toggle(entity, turn)
             turn.turn_counter += stats.speed
-            if turn.turn_counter >= self._threshold:
-                turn.ready = True
-                self._event_bus.publish(
-                    "engine.turn.ready",
-                    {
-                        "entity_id": entity,
-                        "turn_counter": turn.turn_counter,
-                    },
-                )
+            turn.ready = turn.turn_counter >= self._threshold
+            if state_hash is not None:
+                state_hash.toggle(entity, turn)
+            if turn.ready:
+                event = self._records.acquire()
+                event.entity_id = entity
+                event.turn_counter = turn.turn_counter
+                self._event_bus.publish(TURN_READY, event)
 
     def consume_turn(self: Self, entity: int) -> None:
         turn = esper.component_for_entity(entity, TurnComponent)
@@ -43,7 +52,11 @@ class TurnManager(esper.Processor):
             msg = f"Entity {entity} is not ready to act"
             raise RuntimeError(msg)
 
+        if self._state_hash is not None:
+            self._state_hash.toggle(entity, turn)
         turn.turn_counter -= self._threshold
         if turn.turn_counter < 0:
             turn.turn_counter = 0
         turn.ready = False
+        if self._state_hash is not None:
+            self._state_hash.toggle(entity, turn)
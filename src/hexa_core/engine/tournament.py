@@ -0,0 +1,206 @@
+"""Round-robin bot tournaments spread across worker processes."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Self
+
+from hexa_core.engine.maps import LevelData, LevelEntity, MapLoader
+from hexa_core.engine.script_runner import ScriptProgram
+from hexa_core.engine.simulation import DEFAULT_MAX_TICKS, HeadlessMatch, MatchResult, load_programs
+
+
+def derive_seed(base_seed: int, *parts: object) -> int:
+    """Return a stable 63-bit seed for ``parts``, independent of scheduling and hash randomization."""
+    digest = hashlib.blake2b(repr((base_seed, *parts)).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") >> 1
+
+
+@dataclass(frozen=True, slots=True)
+class MatchSpec:
+    """A single pairing: ``player`` takes the first scripted entity, ``opponent`` the rest."""
+
+    index: int
+    map_path: str
+    player: str
+    opponent: str
+    seed: int
+
+
+@dataclass(frozen=True, slots=True)
+class MatchOutcome:
+    spec: MatchSpec
+    result: MatchResult
+    winning_script: str | None
+
+
+@dataclass(slots=True)
+class Standing:
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+
+    @property
+    def points(self: Self) -> int:
+        return 3 * self.wins + self.draws
+
+
+@dataclass(slots=True)
+class TournamentReport:
+    outcomes: list[MatchOutcome]
+    elapsed_seconds: float
+    workers: int
+    standings: dict[str, Standing] = field(default_factory=dict)
+
+    @property
+    def matches_per_second(self: Self) -> float:
+        return len(self.outcomes) / self.elapsed_seconds if self.elapsed_seconds > 0 else float("inf")
+
+
+def round_robin(
+    maps: Sequence[Path | str],
+    scripts: Sequence[Path | str],
+    *,
+    base_seed: int = 0,
+) -> list[MatchSpec]:
+    """Pair every script against every other script on every map, from both sides."""
+    specs: list[MatchSpec] = []
+    for map_path in map(str, maps):
+        for player in map(str, scripts):
+            for opponent in map(str, scripts):
+                if player == opponent:
+                    continue
+                seed = derive_seed(base_seed, map_path, player, opponent)
+                specs.append(MatchSpec(len(specs), map_path, player, opponent, seed))
+    return specs
+
+
+def assign_scripts(level: LevelData, player: str, opponent: str) -> LevelData:
+    """Return a copy of ``level`` whose scripted entities run ``player`` (first) or ``opponent``."""
+    entities: list[LevelEntity] = []
+    seen_player = False
+    for entity in level.entities:
+        components = entity.components
+        if "Script" in components:
+            path = opponent if seen_player else player
+            seen_player = True
+            components = {**components, "Script": {**components["Script"], "path": path}}
+        entities.append(LevelEntity(name=entity.name, components=components))
+    return LevelData(name=level.name, grid_size=level.grid_size, tiles=level.tiles, entities=entities)
+
+
+class _WorkerState:
+    """Maps and compiled scripts loaded once per worker process."""
+
+    def __init__(self: Self, maps: Sequence[str], scripts: Sequence[str], max_ticks: int) -> None:
+        loader = MapLoader()
+        self.levels: dict[str, LevelData] = {path: loader.load(path) for path in maps}
+        self.programs: Mapping[str, ScriptProgram] = load_programs(scripts)
+        self.max_ticks = max_ticks
+
+    def play(self: Self, spec: MatchSpec) -> MatchOutcome:
+        level = assign_scripts(self.levels[spec.map_path], spec.player, spec.opponent)
+        match = HeadlessMatch(level, programs=self.programs, seed=spec.seed, max_ticks=self.max_ticks)
+        result = match.run()
+        winning_script = None
+        if result.winner is not None:
+            first_scripted = next(entity.name for entity in level.entities if "Script" in entity.components)
+            winning_script = spec.player if result.winner == first_scripted else spec.opponent
+        return MatchOutcome(spec=spec, result=result, winning_script=winning_script)
+
+
+_worker_state: _WorkerState | None = None
+
+
+def _init_worker(maps: Sequence[str], scripts: Sequence[str], max_ticks: int) -> None:
+    global _worker_state
+    _worker_state = _WorkerState(maps, scripts, max_ticks)
+
+
+def _play_in_worker(spec: MatchSpec) -> MatchOutcome:
+    if _worker_state is None:  # pragma: no cover - initializer always runs first
+        raise RuntimeError("Tournament worker was not initialized")
+    return _worker_state.play(spec)
+
+
+class Tournament:
+    """Plays independent matches across a ``ProcessPoolExecutor``.
+
+    Each worker loads every map and compiles every script once in its initializer,
+    so per-match work is limited to building the world and simulating it. Match
+    seeds derive from the pairing, so results do not depend on worker count or
+    completion order. Script paths must be valid from the current directory.
+
+    ``play`` and ``run`` create a fresh pool per call unless handed one from
+    ``executor()``, which lets callers pay the process start-up once across runs.
+    """
+
+    def __init__(
+        self: Self,
+        maps: Sequence[Path | str],
+        scripts: Sequence[Path | str],
+        *,
+        workers: int | None = None,
+        max_ticks: int = DEFAULT_MAX_TICKS,
+        base_seed: int = 0,
+    ) -> None:
+        self.maps = tuple(map(str, maps))
+        self.scripts = tuple(map(str, scripts))
+        self.workers = workers or os.cpu_count() or 1
+        self.max_ticks = max_ticks
+        self.matches = round_robin(self.maps, self.scripts, base_seed=base_seed)
+
+    def executor(self: Self) -> ProcessPoolExecutor:
+        """Return a worker pool initialized with this tournament's maps and scripts."""
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.maps, self.scripts, self.max_ticks),
+        )
+
+    def play(self: Self, executor: Executor | None = None) -> Iterator[MatchOutcome]:
+        """Yield outcomes as matches complete (in spec order when ``workers == 1``).
+
+        ``executor`` must come from ``executor()`` on a tournament with the same
+        maps, scripts and tick limit; it is left running for the caller to shut down.
+        """
+        if executor is not None:
+            yield from self._collect(executor)
+            return
+        if self.workers == 1:
+            state = _WorkerState(self.maps, self.scripts, self.max_ticks)
+            for spec in self.matches:
+                yield state.play(spec)
+            return
+
+        with self.executor() as pool:
+            yield from self._collect(pool)
+
+    def _collect(self: Self, executor: Executor) -> Iterator[MatchOutcome]:
+        futures = [executor.submit(_play_in_worker, spec) for spec in self.matches]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def run(self: Self, executor: Executor | None = None) -> TournamentReport:
+        """Play every match, on ``executor`` if given, and tally standings per script."""
+        start = perf_counter()
+        outcomes = sorted(self.play(executor), key=lambda outcome: outcome.spec.index)
+        elapsed = perf_counter() - start
+
+        standings = {script: Standing() for script in self.scripts}
+        for outcome in outcomes:
+            spec = outcome.spec
+            if outcome.winning_script is None:
+                standings[spec.player].draws += 1
+                standings[spec.opponent].draws += 1
+                continue
+            loser = spec.opponent if outcome.winning_script == spec.player else spec.player
+            standings[outcome.winning_script].wins += 1
+            standings[loser].losses += 1
+        return TournamentReport(outcomes=outcomes, elapsed_seconds=elapsed, workers=self.workers, standings=standings)
@@ -9,7 +9,12 @@ from typing import ParamSpec, Self, TypeVar, cast
 
 import esper
 
-from hexa_core.engine.event_bus import EventBus, Subscriber
+from hexa_core.engine import storage
+from hexa_core.engine.command_buffer import CommandBuffer
+from hexa_core.engine.event_bus import EventBus, Payload, Subscriber
+from hexa_core.engine.instrumentation import ProcessInstrumentation
+from hexa_core.engine.snapshot import WorldSnapshot, capture_snapshot, restore_snapshot
+from hexa_core.engine.state_hash import StateHash
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -20,9 +25,14 @@ class GameWorld:
 
     _context_ids = count()
 
-    def __init__(self: Self, event_bus: EventBus | None = None) -> None:
+    def __init__(self: Self, event_bus: EventBus | None = None, *, batch_events: bool = False) -> None:
         self.context_name = f"game_world_{next(self._context_ids)}"
         self.event_bus: EventBus = event_bus or EventBus()
+        # When set, events published by processors are delivered as one batch per channel at tick end.
+        self.batch_events = batch_events
+        self.command_buffer = CommandBuffer()
+        self.instrumentation: ProcessInstrumentation | None = None
+        self.state_hash: StateHash | None = None
         self._register_context()
         # TODO: Register systems and set up initial state once implemented.
 
@@ -68,8 +78,6 @@ class GameWorld:
             "add_processor": esper.add_processor,
             "remove_processor": esper.remove_processor,
             "get_processor": esper.get_processor,
-            "process": esper.process,
-            "timed_process": esper.timed_process,
             "clear_dead_entities": esper.clear_dead_entities,
         }
 
@@ -80,12 +88,107 @@ class GameWorld:
 
         raise AttributeError(f"{type(self).__name__!s} has no attribute {name!r}")
 
+    def process(self: Self, *args: object, **kwargs: object) -> None:
+        """Run every processor once, then apply queued structural changes.
+
+        With `batch_events`, queued events are flushed before the command buffer is
+        applied so that structural changes requested by subscribers land this tick.
+        """
+
+        instrumentation = self.instrumentation
+        with self._activate_context():
+            if instrumentation is None:
+                if self.batch_events:
+                    with self.event_bus.batch():
+                        esper.process(*args, **kwargs)
+                else:
+                    esper.process(*args, **kwargs)
+                self.command_buffer.apply()
+                return
+
+            if self.batch_events:
+                with self.event_bus.batch():
+                    profile = instrumentation.process(storage.processors(), *args, **kwargs)
+                    instrumentation.measure(profile, "EventBus.flush", self.event_bus.flush)
+            else:
+                profile = instrumentation.process(storage.processors(), *args, **kwargs)
+            instrumentation.measure(profile, "CommandBuffer.apply", self.command_buffer.apply)
+            instrumentation.finish_tick(profile)
+
+    def apply_commands(self: Self) -> list[int]:
+        """Apply queued structural commands now instead of at the end of the next tick."""
+
+        with self._activate_context():
+            return self.command_buffer.apply()
+
+    def enable_instrumentation(self: Self, instrumentation: ProcessInstrumentation | None = None) -> ProcessInstrumentation:
+        """Install per-processor instrumentation for subsequent `process` calls."""
+
+        self.disable_instrumentation()
+        active = instrumentation or ProcessInstrumentation()
+        active.attach(self.event_bus)
+        self.instrumentation = active
+        return active
+
+    def disable_instrumentation(self: Self) -> None:
+        """Remove instrumentation, restoring the uninstrumented `process` path."""
+
+        if self.instrumentation is not None:
+            self.instrumentation.detach()
+            self.instrumentation = None
+
+    def enable_state_hash(self: Self) -> StateHash:
+        """Start tracking an incremental hash of position, stats and turn state.
+
+        Pass the returned `StateHash` to the engine systems so they can keep it
+        current; structural changes through `command_buffer` are tracked here.
+        """
+
+        if self.state_hash is None:
+            self.state_hash = StateHash()
+            self.command_buffer.state_hash = self.state_hash
+        self.rehash()
+        return self.state_hash
+
+    def rehash(self: Self) -> int:
+        """Recompute the state hash from scratch after untracked mutations."""
+
+        if self.state_hash is None:
+            raise RuntimeError("State hashing is not enabled; call enable_state_hash() first")
+        with self._activate_context():
+            return self.state_hash.reset(storage.entity_table())
+
+    def timed_process(self: Self, *args: object, **kwargs: object) -> None:
+        """Like `process`, recording per-processor times in `esper.process_times`."""
+
+        with self._activate_context():
+            esper.timed_process(*args, **kwargs)
+            self.command_buffer.apply()
+
+    def snapshot(self: Self) -> WorldSnapshot:
+        """Capture every live entity and component for a later `restore`."""
+
+        with self._activate_context():
+            return capture_snapshot()
+
+    def restore(self: Self, snapshot: WorldSnapshot) -> None:
+        """Return the world to `snapshot`, discarding pending structural commands.
+
+        Processors and event subscriptions are left untouched.
+        """
+
+        self.command_buffer.clear()
+        with self._activate_context():
+            restore_snapshot(snapshot)
+        if self.state_hash is not None:
+            self.rehash()
+
     def subscribe_event(self: Self, event_type: str, subscriber: Subscriber) -> None:
         """Register a subscriber on the underlying `EventBus`."""
 
         self.event_bus.subscribe(event_type, subscriber)
 
-    def publish_event(self: Self, event_type: str, payload: dict[str, object]) -> None:
+    def publish_event(self: Self, event_type: str, payload: Payload) -> None:
         """Publish an event via the underlying `EventBus`."""
 
         self.event_bus.publish(event_type, payload)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
 from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.event_queue import EventQueue
 from hexa_core.renderer import arcade_views, events
 from hexa_core.renderer.renderer import HexaRenderer, RendererState
 
@@ -28,6 +29,7 @@ class RendererApp:
     window_title: str = "Hexa-Core Command"
     update_rate: float | None = 1 / 60
     window_factory: WindowFactory | None = None
+    event_queue: EventQueue | None = None
     current_window: Any | None = field(default=None, init=False)
     _current_view: arcade_views.BaseScreen | None = field(default=None, init=False)
 
@@ -43,22 +45,30 @@ class RendererApp:
             kwargs["update_rate"] = self.update_rate
         self.current_window = factory(self.width, self.height, self.window_title, **kwargs)
         self._transition_to_state(self.renderer.current_state)
+        if self.event_queue is not None:
+            arcade.schedule(self.pump_events, self.update_rate or 1 / 60)
         arcade.run()
 
+    def pump_events(self: RendererApp, delta_time: float = 0.0) -> int:  # noqa: ARG002 - arcade.schedule signature
+        """Deliver events queued by an engine thread onto the renderer's bus; called once per frame."""
+        if self.event_queue is None:
+            return 0
+        return self.event_queue.drain_into(self.event_bus)
+
     def _register_handlers(self: RendererApp) -> None:
         self.event_bus.subscribe(events.MISSION_BRIEFING_REQUESTED, self._on_mission_briefing_requested)
         self.event_bus.subscribe(events.GAMEPLAY_ACTIVATED, self._on_gameplay_activated)
         self.event_bus.subscribe(events.GAMEPLAY_EXITED, self._on_gameplay_exited)
 
-    def _on_mission_briefing_requested(self: RendererApp, _: str, payload: dict[str, Any]) -> None:
+    def _on_mission_briefing_requested(self: RendererApp, _: str, payload: Mapping[str, Any]) -> None:
         self.renderer.load_mission_briefing(payload)
         self._transition_to_state(RendererState.MISSION_BRIEFING)
 
-    def _on_gameplay_activated(self: RendererApp, _: str, payload: dict[str, Any]) -> None:  # noqa: ARG002 - future use
+    def _on_gameplay_activated(self: RendererApp, _: str, payload: Mapping[str, Any]) -> None:  # noqa: ARG002 - future use
         self.renderer.proceed_to_gameplay()
         self._transition_to_state(RendererState.GAMEPLAY)
 
-    def _on_gameplay_exited(self: RendererApp, _: str, payload: dict[str, Any]) -> None:  # noqa: ARG002 - future use
+    def _on_gameplay_exited(self: RendererApp, _: str, payload: Mapping[str, Any]) -> None:  # noqa: ARG002 - future use
         self.renderer.should_exit = True
         self.renderer.current_state = RendererState.MAIN_MENU
         self._transition_to_state(RendererState.MAIN_MENU)
@@ -81,6 +91,7 @@ def create_renderer_app(
     title: str = "Hexa-Core Command",
     update_rate: float | None = 1 / 60,
     window_factory: WindowFactory | None = None,
+    event_queue: EventQueue | None = None,
 ) -> RendererApp:
     base_renderer = renderer or HexaRenderer()
     bus = event_bus or EventBus()
@@ -92,6 +103,7 @@ def create_renderer_app(
         window_title=title,
         update_rate=update_rate,
         window_factory=window_factory,
+        event_queue=event_queue,
     )
 
 
@@ -215,7 +215,7 @@ class HexaRenderer:
         self.should_exit = False
         self.current_state = self._transitions.get(action, self.current_state)
 
-    def load_mission_briefing(self: HexaRenderer, payload: dict[str, object]) -> None:
+    def load_mission_briefing(self: HexaRenderer, payload: Mapping[str, object]) -> None:
         self.mission_briefing = self._create_mission_briefing_view(payload)
         self.current_state = RendererState.MISSION_BRIEFING
         self.should_exit = False
@@ -0,0 +1,64 @@
+"""CodSpeed benchmarks for coroutine event delivery."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.async_event_bus import AsyncEventBus
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.event_bus import Payload
+
+registry = BenchmarkRegistry()
+
+TICKS = 20
+EVENTS_PER_TICK = 500
+
+
+def _stream_ticks(concurrency: int) -> int:
+    async def scenario() -> int:
+        delivered = 0
+
+        async def observer(_: str, __: Payload) -> None:
+            nonlocal delivered
+            delivered += 1
+
+        async with AsyncEventBus() as bus:
+            bus.subscribe_async("engine.movement.completed", observer, concurrency=concurrency, capacity=EVENTS_PER_TICK)
+            for _ in range(TICKS):
+                for entity in range(EVENTS_PER_TICK):
+                    bus.publish("engine.movement.completed", {"entity_id": entity})
+                await bus.wait_for_tick(bus.advance_tick())
+        return delivered
+
+    return asyncio.run(scenario())
+
+
+def _stream_ticks_sequential() -> int:
+    """Deliver each tick's movement events to one coroutine observer, awaiting tick completion."""
+
+    return _stream_ticks(1)
+
+
+def _stream_ticks_concurrent() -> int:
+    """Same stream with four worker tasks serving the observer."""
+
+    return _stream_ticks(4)
+
+
+registry.register("async_event_stream_sequential", _stream_ticks_sequential)
+registry.register("async_event_stream_concurrent", _stream_ticks_concurrent)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_async_event_bus_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each async delivery scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) != TICKS * EVENTS_PER_TICK:
+        msg = f"Benchmark {name!r} lost events"
+        raise AssertionError(msg)
@@ -0,0 +1,95 @@
+"""CodSpeed benchmarks for batched combat resolution."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.components import CombatIntentComponent, StatsComponent
+from hexa_core.engine.events import COMBAT_RESOLVED
+from hexa_core.engine.systems.combat_system import CombatSystem
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+ATTACKS = 10_000
+TARGETS = 1_000
+
+
+def _battlefield(attacks: int, targets: int) -> tuple[GameWorld, list[int]]:
+    world = GameWorld()
+    world.add_processor(CombatSystem(world.event_bus, world.command_buffer))
+    commands = world.command_buffer
+    for _ in range(targets):
+        commands.create_entity(StatsComponent(health=attacks * 5, speed=10, processor=10))
+    with world._activate_context():
+        target_ids = commands.apply()
+    for index in range(attacks):
+        commands.create_entity(
+            StatsComponent(health=100, speed=10, processor=10),
+            CombatIntentComponent(target=target_ids[index % targets], damage=1 + index % 7),
+        )
+    with world._activate_context():
+        commands.apply()
+    return world, target_ids
+
+
+def _count_events(world: GameWorld) -> list[int]:
+    events: list[int] = []
+    world.subscribe_event(COMBAT_RESOLVED, lambda _, payload: events.append(payload["target_id"]))
+    return events
+
+
+def _batched_10k_attacks() -> int:
+    """10k simultaneous attacks on 1k targets, aggregated into one event per target."""
+
+    world, _ = _battlefield(ATTACKS, TARGETS)
+    events = _count_events(world)
+    world.process()
+    return len(events)
+
+
+def _batched_10k_attacks_one_target() -> int:
+    """10k simultaneous attacks focused on a single target."""
+
+    world, _ = _battlefield(ATTACKS, 1)
+    events = _count_events(world)
+    world.process()
+    return len(events)
+
+
+def _per_intent_10k_attacks() -> int:
+    """Reference: the same volley resolved one intent at a time, one event per intent."""
+
+    world, _ = _battlefield(ATTACKS, TARGETS)
+    events = _count_events(world)
+    with world._activate_context():
+        for entity, (_stats, intent) in world.get_components(StatsComponent, CombatIntentComponent):
+            target_stats = cast(StatsComponent, world.component_for_entity(intent.target, StatsComponent))
+            target_stats.health = max(0, target_stats.health - intent.damage)
+            world.command_buffer.remove_component(entity, CombatIntentComponent)
+            world.publish_event(
+                COMBAT_RESOLVED,
+                {"attacker_id": entity, "target_id": intent.target, "damage": intent.damage, "remaining_health": target_stats.health, "defeated": target_stats.health == 0},
+            )
+        world.command_buffer.apply()
+    return len(events)
+
+
+registry.register("combat_10k_attacks_batched", _batched_10k_attacks)
+registry.register("combat_10k_attacks_one_target", _batched_10k_attacks_one_target)
+registry.register("combat_10k_attacks_per_intent_reference", _per_intent_10k_attacks)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_combat_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each combat scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} did not resolve any combat"
+        raise AssertionError(msg)
@@ -0,0 +1,71 @@
+"""CodSpeed benchmarks comparing deferred and immediate structural changes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.components import CombatIntentComponent, MovementIntentComponent, PositionComponent, StatsComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.systems.combat_system import CombatSystem
+from hexa_core.engine.systems.movement_system import MovementSystem
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+INTENT_COUNT = 5000
+
+
+def _populate_intents(world: GameWorld) -> None:
+    for index in range(INTENT_COUNT):
+        world.create_entity(
+            PositionComponent(q=index, r=0),
+            StatsComponent(health=100, speed=10, processor=10),
+            MovementIntentComponent(target=HexCoord(index, 1)),
+            CombatIntentComponent(target=index + 1, damage=1),
+        )
+
+
+def _simultaneous_intents_buffered() -> int:
+    """Resolve thousands of movement and combat intents through the shared buffer."""
+
+    world = GameWorld()
+    world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+    world.add_processor(CombatSystem(world.event_bus, world.command_buffer))
+    _populate_intents(world)
+
+    world.process()
+    return len(world.get_component(PositionComponent))
+
+
+def _simultaneous_intents_immediate() -> int:
+    """Baseline that removes every intent through esper directly."""
+
+    world = GameWorld()
+    _populate_intents(world)
+
+    with world._activate_context():
+        for entity, _ in world.get_components(PositionComponent, MovementIntentComponent):
+            world.remove_component(entity, MovementIntentComponent)
+        for entity, _ in world.get_components(StatsComponent, CombatIntentComponent):
+            world.remove_component(entity, CombatIntentComponent)
+    return len(world.get_component(PositionComponent))
+
+
+registry.register("simultaneous_intents_buffered", _simultaneous_intents_buffered)
+registry.register("simultaneous_intents_immediate", _simultaneous_intents_immediate)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_command_buffer_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each structural-change scenario under pytest-codspeed."""
+
+    result = benchmark(registry.get(name))
+    if result != INTENT_COUNT:
+        msg = f"Benchmark {name!r} lost entities: {result}"
+        raise AssertionError(msg)
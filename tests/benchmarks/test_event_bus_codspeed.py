@@ -0,0 +1,170 @@
+"""CodSpeed benchmarks comparing immediate and batched event delivery."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.events import MovementCompleted, RecordPool
+
+registry = BenchmarkRegistry()
+
+EVENT_COUNT = 10_000
+FRAMES = 5
+CHANNEL = "engine.movement.completed"
+
+
+def _publish_moves(bus: EventBus) -> None:
+    publish = bus.publish
+    for frame in range(FRAMES):
+        for entity in range(EVENT_COUNT // FRAMES):
+            publish(CHANNEL, {"entity_id": entity, "from": frame, "to": frame + 1})
+
+
+def _immediate_delivery() -> int:
+    """Deliver each movement event to three per-event subscribers as it is published."""
+
+    bus = EventBus()
+    positions: dict[int, Any] = {}
+    seen = [0]
+
+    def track(_: str, payload: dict[str, Any]) -> None:
+        positions[payload["entity_id"]] = payload["to"]
+
+    def count(_: str, __: dict[str, Any]) -> None:
+        seen[0] += 1
+
+    for subscriber in (track, count, count):
+        bus.subscribe(CHANNEL, subscriber)
+    _publish_moves(bus)
+    return len(positions) + seen[0]
+
+
+def _batched_delivery() -> int:
+    """Queue movement events for one tick and hand each subscriber a single list."""
+
+    bus = EventBus()
+    positions: dict[int, Any] = {}
+    seen = [0]
+
+    def track(_: str, payloads: list[dict[str, Any]]) -> None:
+        positions.update({payload["entity_id"]: payload["to"] for payload in payloads})
+
+    def count(_: str, payloads: list[dict[str, Any]]) -> None:
+        seen[0] += len(payloads)
+
+    for subscriber in (track, count, count):
+        bus.subscribe_batch(CHANNEL, subscriber)
+    with bus.batch():
+        _publish_moves(bus)
+    return len(positions) + seen[0]
+
+
+def _coalesced_delivery() -> int:
+    """Renderer-style consumer that only needs the final position per entity."""
+
+    bus = EventBus()
+    positions: dict[int, Any] = {}
+
+    def track(_: str, payloads: list[dict[str, Any]]) -> None:
+        for payload in payloads:
+            positions[payload["entity_id"]] = payload["to"]
+
+    bus.subscribe_coalesced(CHANNEL, "entity_id", track)
+    with bus.batch():
+        _publish_moves(bus)
+    return len(positions)
+
+
+ORIGIN = HexCoord(0, 0)
+DESTINATION = HexCoord(1, 0)
+
+
+def _counting_bus(*, typed: bool = False) -> tuple[EventBus, list[int]]:
+    bus = EventBus()
+    seen = [0]
+
+    def read_key(_: str, payload: Any) -> None:  # noqa: ANN401 - accepts dicts and records
+        seen[0] += payload["entity_id"]
+
+    def read_attribute(_: str, payload: Any) -> None:  # noqa: ANN401 - typed subscriber
+        seen[0] += payload.entity_id
+
+    bus.subscribe(CHANNEL, read_attribute if typed else read_key)
+    return bus, seen
+
+
+def _publish_dict_payloads() -> int:
+    """Baseline: a fresh dict per movement event."""
+
+    bus, seen = _counting_bus()
+    publish = bus.publish
+    for entity in range(EVENT_COUNT):
+        publish(CHANNEL, {"entity_id": entity, "from": ORIGIN, "to": DESTINATION})
+    return seen[0]
+
+
+def _publish_record_payloads() -> int:
+    """A fresh slotted record per movement event, read by attribute."""
+
+    bus, seen = _counting_bus(typed=True)
+    publish = bus.publish
+    for entity in range(EVENT_COUNT):
+        publish(CHANNEL, MovementCompleted(entity, ORIGIN, DESTINATION))
+    return seen[0]
+
+
+def _publish_pooled_payloads() -> int:
+    """Records drawn from a rewound pool and read by attribute, as the movement system publishes them."""
+
+    bus, seen = _counting_bus(typed=True)
+    publish = bus.publish
+    pool: RecordPool[MovementCompleted] = RecordPool(MovementCompleted)
+    acquire = pool.acquire
+    for _ in range(FRAMES):
+        pool.rewind()
+        for entity in range(EVENT_COUNT // FRAMES):
+            event = acquire()
+            event.entity_id = entity
+            event.origin = ORIGIN
+            event.destination = DESTINATION
+            publish(CHANNEL, event)
+    return seen[0]
+
+
+def _publish_with_wildcard_sink() -> int:
+    """Dict payloads with a telemetry sink subscribed to ``engine.#`` alongside the exact subscriber."""
+
+    bus, seen = _counting_bus()
+    bus.subscribe("engine.#", lambda _event, _payload: None)
+    for noise in range(50):
+        bus.subscribe(f"renderer.channel_{noise}.*", lambda _event, _payload: None)
+    publish = bus.publish
+    for entity in range(EVENT_COUNT):
+        publish(CHANNEL, {"entity_id": entity, "from": ORIGIN, "to": DESTINATION})
+    return seen[0]
+
+
+registry.register("event_delivery_immediate", _immediate_delivery)
+registry.register("event_delivery_batched", _batched_delivery)
+registry.register("event_delivery_coalesced", _coalesced_delivery)
+registry.register("event_publish_dict_payloads", _publish_dict_payloads)
+registry.register("event_publish_record_payloads", _publish_record_payloads)
+registry.register("event_publish_pooled_payloads", _publish_pooled_payloads)
+registry.register("event_publish_with_wildcard_sink", _publish_with_wildcard_sink)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_event_bus_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each event delivery scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} delivered no events"
+        raise AssertionError(msg)
@@ -0,0 +1,66 @@
+"""CodSpeed benchmarks for cross-thread event delivery."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.event_queue import BLOCK, DROP_OLDEST, EventQueue
+
+registry = BenchmarkRegistry()
+
+EVENT_COUNT = 20_000
+FRAME_EVENTS = 500
+
+
+def _same_thread_frames() -> int:
+    """Producer and consumer alternate on one thread, draining once per simulated frame."""
+
+    queue = EventQueue(capacity=4096, policy=DROP_OLDEST)
+    consumer = EventBus()
+    delivered = 0
+    for start in range(0, EVENT_COUNT, FRAME_EVENTS):
+        for value in range(start, start + FRAME_EVENTS):
+            queue.put("engine.movement.completed", {"entity_id": value})
+        delivered += queue.drain_into(consumer)
+    return delivered
+
+
+def _cross_thread_backpressure() -> int:
+    """A producer thread fills a small blocking queue while the consumer drains it between short frames."""
+
+    queue = EventQueue(capacity=256, policy=BLOCK)
+
+    def produce() -> None:
+        for value in range(EVENT_COUNT):
+            queue.put("engine.movement.completed", {"entity_id": value})
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    delivered = 0
+    while delivered < EVENT_COUNT:
+        time.sleep(0.0005)
+        delivered += len(queue.drain())
+    producer.join()
+    return delivered
+
+
+registry.register("event_queue_same_thread_frames", _same_thread_frames)
+registry.register("event_queue_cross_thread_backpressure", _cross_thread_backpressure)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_event_queue_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each event queue scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) != EVENT_COUNT:
+        msg = f"Benchmark {name!r} lost events"
+        raise AssertionError(msg)
@@ -0,0 +1,60 @@
+"""CodSpeed benchmarks measuring the cost of process instrumentation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.components import StatsComponent, TurnComponent
+from hexa_core.engine.systems.turn_system import TurnManager
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+ENTITY_COUNT = 50
+TICKS = 200
+
+
+def _turn_world() -> GameWorld:
+    world = GameWorld()
+    world.add_processor(TurnManager(world.event_bus))
+    for index in range(ENTITY_COUNT):
+        world.create_entity(StatsComponent(health=100, speed=index + 1, processor=10), TurnComponent())
+    return world
+
+
+def _process_uninstrumented() -> int:
+    """Baseline: the disabled instrumentation path."""
+
+    world = _turn_world()
+    for _ in range(TICKS):
+        world.process()
+    return TICKS
+
+
+def _process_instrumented() -> int:
+    """Same workload with per-processor timing and event counting enabled."""
+
+    world = _turn_world()
+    instrumentation = world.enable_instrumentation()
+    for _ in range(TICKS):
+        world.process()
+    return instrumentation.ticks
+
+
+registry.register("world_process_uninstrumented", _process_uninstrumented)
+registry.register("world_process_instrumented", _process_instrumented)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_instrumentation_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each instrumentation scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) != TICKS:
+        msg = f"Benchmark {name!r} did not process every tick"
+        raise AssertionError(msg)
@@ -0,0 +1,90 @@
+"""CodSpeed benchmarks for event journal recording overhead."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.journal import EventJournal, JournalReader
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch
+
+registry = BenchmarkRegistry()
+
+SKIRMISH_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+    ]
+)
+PROGRAMS = {"skirmish.hxc": ScriptRunner().compile(SKIRMISH_SCRIPT)}
+TICKS = 500
+
+
+def _skirmish() -> HeadlessMatch:
+    entities = [
+        LevelEntity(
+            name=f"bot-{index}",
+            components={
+                "Position": {"q": (index % 10) * 3, "r": (index // 10) * 3},
+                "Stats": {"health": 50, "speed": 100 + index * 7, "processor": 10},
+                "Script": {"path": "skirmish.hxc"},
+            },
+        )
+        for index in range(50)
+    ]
+    level = LevelData(name="Skirmish", grid_size=LevelGridSize(width=40, height=40), tiles=[], entities=entities)
+    return HeadlessMatch(level, programs=PROGRAMS, max_ticks=TICKS)
+
+
+def _skirmish_unrecorded() -> int:
+    """Baseline 50-bot skirmish without a journal."""
+
+    return _skirmish().run().ticks
+
+
+def _skirmish_journaled() -> int:
+    """Same skirmish with every engine event appended to an in-memory journal."""
+
+    match = _skirmish()
+    stream = io.BytesIO()
+    journal = EventJournal(stream, tick_source=lambda: match.tick)
+    journal.attach(match.world.event_bus)
+    ticks = match.run().ticks
+    journal.flush()
+    return ticks if journal.events and stream.tell() else 0
+
+
+def _read_journal() -> int:
+    """Decode a journal of 20k movement events."""
+
+    stream = io.BytesIO()
+    journal = EventJournal(stream)
+    for entity in range(20_000):
+        journal.record("engine.movement.completed", {"entity_id": entity, "from": entity, "to": entity + 1})
+    journal.flush()
+    return sum(1 for _ in JournalReader(stream.getvalue()))
+
+
+registry.register("journal_skirmish_unrecorded", _skirmish_unrecorded)
+registry.register("journal_skirmish_recorded", _skirmish_journaled)
+registry.register("journal_read_20k_events", _read_journal)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_journal_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each journal scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} did not record or replay anything"
+        raise AssertionError(msg)
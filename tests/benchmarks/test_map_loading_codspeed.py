@@ -0,0 +1,113 @@
+"""Map loading benchmarks comparing JSON parsing, streaming JSON and compiled, memory-mapped maps."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.benchmarking.memory import measure_memory
+from hexa_core.engine.benchmarking.runner import run_benchmarks
+from hexa_core.engine.compiled_maps import CompiledMapReader, MapCompiler, load_compiled_map
+from hexa_core.engine.maps import MapLoader
+from hexa_core.engine.streaming_maps import StreamingMapLoader
+
+registry = BenchmarkRegistry()
+
+MAP_SIDES = (200, 1_000)
+TILE_TYPES = ("plain", "plain", "forest", "water", "wall")
+STREAMING_PEAK_RATIO = 5  # streaming must peak at under a fifth of MapLoader's traced allocations
+
+
+@cache
+def _json_map(side: int) -> Path:
+    """A procedurally generated ``side`` x ``side`` JSON map, written once per session."""
+
+    path = Path(tempfile.gettempdir()) / f"hexa_loading_{side}.json"
+    entities = [{"name": f"bot-{index}", "components": {"Position": {"q": index, "r": index}}} for index in range(min(side, 100))]
+    with path.open("w", encoding="utf-8") as stream:
+        stream.write(f'{{"name": "Generated {side}", "grid_size": {{"width": {side}, "height": {side}}}, "tiles": [')
+        for q in range(side):
+            # Written a column at a time so generating the map never holds the whole document.
+            column = ", ".join(f'{{"type": "{TILE_TYPES[(q * 7 + r * 3) % len(TILE_TYPES)]}", "q": {q}, "r": {r}}}' for r in range(side))
+            stream.write(f"{', ' if q else ''}{column}")
+        stream.write(f'], "entities": {json.dumps(entities)}}}')
+    return path
+
+
+@cache
+def _compiled_map(side: int) -> Path:
+    return MapCompiler().compile(_json_map(side))
+
+
+def _json_load(side: int) -> int:
+    """Parse the JSON map into ``LevelData``."""
+
+    return len(MapLoader().load(_json_map(side)).tiles)
+
+
+def _streaming_load(side: int) -> int:
+    """Stream the JSON map into compact tile arrays."""
+
+    return StreamingMapLoader().load(_json_map(side)).tile_count
+
+
+def _compiled_load(side: int) -> int:
+    """Memory-map the compiled map and decode it into ``LevelData``."""
+
+    return len(load_compiled_map(_compiled_map(side)).tiles)
+
+
+def _compiled_open(side: int) -> int:
+    """Memory-map the compiled map and read tiles through the zero-copy layer."""
+
+    with CompiledMapReader.open(_compiled_map(side)) as reader:
+        corners = [reader.tile_at(q, r) for q in (0, side - 1) for r in (0, side - 1)]
+        return reader.tile_count if all(corners) else 0
+
+
+registry.register("json_load", _json_load, tags=("maps",), params={"side": MAP_SIDES})
+registry.register("streaming_load", _streaming_load, tags=("maps",), params={"side": MAP_SIDES})
+registry.register("compiled_load", _compiled_load, tags=("maps",), params={"side": MAP_SIDES})
+registry.register("compiled_open", _compiled_open, tags=("maps",), params={"side": MAP_SIDES})
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_map_loading_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Load each generated map under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} loaded no tiles"
+        raise AssertionError(msg)
+
+
+def test_compiled_maps_load_faster_than_json() -> None:
+    """Fail when decoding a compiled map is no faster than parsing its JSON source."""
+
+    report = run_benchmarks([registry], match=f"side={MAP_SIDES[0]}]", warmup=1, rounds=3, calibrated=False)
+    json_load, compiled_load = report.result(f"json_load[side={MAP_SIDES[0]}]"), report.result(f"compiled_load[side={MAP_SIDES[0]}]")
+    if json_load is None or compiled_load is None or compiled_load.median >= json_load.median:
+        msg = f"Compiled map load is not faster than JSON: {compiled_load} vs {json_load}"
+        raise AssertionError(msg)
+
+
+def test_streaming_loader_keeps_peak_memory_low() -> None:
+    """Fail when streaming a map allocates anywhere near as much as parsing the whole document."""
+
+    side = MAP_SIDES[0]
+    parsed = measure_memory(registry.spec(f"json_load[side={side}]"), rss=True)
+    streamed = measure_memory(registry.spec(f"streaming_load[side={side}]"), rss=True)
+    if streamed.peak_bytes * STREAMING_PEAK_RATIO > parsed.peak_bytes:
+        msg = f"Streaming load peaked at {streamed.peak_bytes:,} B against {parsed.peak_bytes:,} B for MapLoader"
+        raise AssertionError(msg)
+    if parsed.peak_rss_bytes is not None and streamed.peak_rss_bytes is not None and streamed.peak_rss_bytes > parsed.peak_rss_bytes:
+        msg = f"Streaming load raised peak RSS by {streamed.peak_rss_bytes:,} B against {parsed.peak_rss_bytes:,} B for MapLoader"
+        raise AssertionError(msg)
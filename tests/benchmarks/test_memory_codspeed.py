@@ -0,0 +1,134 @@
+"""Memory-footprint benchmarks for worlds, levels, compiled scripts and event buffers."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from functools import cache, partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.benchmarking.memory import check_component_budgets, check_memory_budgets, component_footprint, run_memory_benchmarks
+from hexa_core.engine.components import MovementIntentComponent, PathComponent, PositionComponent, StatsComponent, TurnComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.event_queue import EventQueue
+from hexa_core.engine.events import MOVEMENT_COMPLETED, MovementCompleted
+from hexa_core.engine.maps import LevelData, MapLoader
+from hexa_core.engine.script_runner import ScriptProgram, ScriptRunner
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+ENTITY_COUNTS = (1_000, 10_000)
+MAP_SIDES = (50, 200)
+SCRIPT_BLOCKS = 50
+QUEUED_EVENTS = 4096
+PATH_HOPS = 10
+
+# Steady-state bytes each scenario may retain, about 1.5x what it measured when added.
+WORLD_BYTES_PER_ENTITY = 950
+LEVEL_BYTES_PER_TILE = 190
+SCRIPT_BYTES = 170_000
+EVENT_QUEUE_BYTES = 1_200_000
+
+# Deep bytes per component instance, about 1.5x what they measured when added.
+COMPONENT_BUDGETS = {
+    "PositionComponent": 105,
+    "StatsComponent": 105,
+    "TurnComponent": 72,
+    "MovementIntentComponent": 310,
+    "PathComponent": 355,
+}
+
+
+def _world(entities: int) -> GameWorld:
+    """A world of ``entities`` units with position, stats and initiative."""
+
+    world = GameWorld()
+    for index in range(entities):
+        world.command_buffer.create_entity(PositionComponent(q=index % 1000, r=index // 1000), StatsComponent(health=100, speed=100 + index % 400, processor=10), TurnComponent())
+    world.apply_commands()
+    return world
+
+
+@cache
+def _map_file(side: int) -> Path:
+    path = Path(tempfile.gettempdir()) / f"hexa_memory_{side}.json"
+    tiles = [{"type": "wall" if (q + r) % 7 == 0 else "plain", "q": q, "r": r} for q in range(side) for r in range(side)]
+    path.write_text(json.dumps({"name": f"Plains {side}", "grid_size": {"width": side, "height": side}, "tiles": tiles, "entities": []}), encoding="utf-8")
+    return path
+
+
+def _level(side: int) -> LevelData:
+    """A ``side`` x ``side`` map loaded from JSON."""
+
+    return MapLoader().load(_map_file(side))
+
+
+def _script_program() -> ScriptProgram:
+    """A compiled script of 50 labelled decision blocks."""
+
+    lines = []
+    for block in range(SCRIPT_BLOCKS):
+        lines += [
+            f'LABEL "block_{block}"',
+            f'SET "reach_{block}" ( target_distance + {block} )',
+            f'IF reach_{block} <= 1 GOTO "strike_{block}"',
+            'ACTION "move" target_q target_r',
+            "END_TURN",
+            f'LABEL "strike_{block}"',
+            'ACTION "attack" target_id',
+        ]
+    return ScriptRunner().compile("\n".join(lines))
+
+
+def _event_queue() -> EventQueue:
+    """A renderer-bound event queue filled to its default capacity."""
+
+    queue = EventQueue(capacity=QUEUED_EVENTS)
+    record = MovementCompleted(0, HexCoord(0, 0), HexCoord(0, 1))
+    for entity in range(QUEUED_EVENTS):
+        record.entity_id = entity
+        queue.put(MOVEMENT_COMPLETED, record)
+    return queue
+
+
+for entities in ENTITY_COUNTS:
+    registry.register(f"world_{entities}_entities", partial(_world, entities), tags=("memory", "ecs"), memory_budget=entities * WORLD_BYTES_PER_ENTITY)
+for side in MAP_SIDES:
+    registry.register(f"level_{side}x{side}", partial(_level, side), tags=("memory", "map"), memory_budget=side * side * LEVEL_BYTES_PER_TILE)
+registry.register("script_program", _script_program, tags=("memory", "script"), memory_budget=SCRIPT_BYTES)
+registry.register("event_queue", _event_queue, tags=("memory", "events"), memory_budget=EVENT_QUEUE_BYTES)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_memory_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Time building each measured structure under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) is None:
+        msg = f"Benchmark {name!r} returned nothing to measure"
+        raise AssertionError(msg)
+
+
+def test_memory_budgets() -> None:
+    """Fail when a structure keeps more memory allocated than its budget."""
+
+    check_memory_budgets(run_memory_benchmarks([registry]))
+
+
+def test_component_footprint_budgets() -> None:
+    """Fail when a component type grows beyond its per-instance byte budget."""
+
+    world = _world(ENTITY_COUNTS[0])
+    for entity in range(1, ENTITY_COUNTS[0] + 1):
+        world.command_buffer.add_component(entity, MovementIntentComponent(target=HexCoord(entity, 1)))
+        world.command_buffer.add_component(entity, PathComponent.through(HexCoord(entity, hop) for hop in range(PATH_HOPS)))
+    world.apply_commands()
+
+    check_component_budgets(component_footprint(world), COMPONENT_BUDGETS)
@@ -0,0 +1,104 @@
+"""CodSpeed benchmarks for simultaneous movement resolution in dense crowds."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.components import MovementIntentComponent, PathComponent, PositionComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.events import MOVEMENT_COMPLETED
+from hexa_core.engine.systems.movement_system import MovementSystem
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+SIDE = 100  # 100 x 100 = 10k movers packed edge to edge
+WALKERS = 1000
+HOPS = 20
+
+
+def _crowd(target: Callable[[int, int], HexCoord]) -> tuple[GameWorld, list[int]]:
+    world = GameWorld()
+    world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+    commands = world.command_buffer
+    for q in range(SIDE):
+        for r in range(SIDE):
+            commands.create_entity(PositionComponent(q=q, r=r), MovementIntentComponent(target=target(q, r)))
+    with world._activate_context():
+        commands.apply()
+    completed: list[int] = []
+    world.subscribe_event(MOVEMENT_COMPLETED, lambda _, payload: completed.append(payload["entity_id"]))
+    return world, completed
+
+
+def _marching_columns() -> int:
+    """10k movers each stepping into the hex its neighbour is vacating."""
+
+    world, completed = _crowd(lambda q, r: HexCoord(q + 1, r))
+    world.process()
+    return len(completed)
+
+
+def _converging_crowd() -> int:
+    """10k movers where pairs of columns contest the same hexes."""
+
+    world, completed = _crowd(lambda q, r: HexCoord(q + SIDE + q % 2, r))
+    world.process()
+    return len(completed)
+
+
+def _walkers(world: GameWorld) -> list[int]:
+    completed: list[int] = []
+    world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+    world.subscribe_event(MOVEMENT_COMPLETED, lambda _, payload: completed.append(payload["entity_id"]))
+    return completed
+
+
+def _paths_1k_walkers() -> int:
+    """1k walkers following 20-hop paths queued once."""
+
+    world = GameWorld()
+    completed = _walkers(world)
+    for row in range(WALKERS):
+        world.command_buffer.create_entity(PositionComponent(q=0, r=row * 2), PathComponent.through(HexCoord(hop, row * 2) for hop in range(1, HOPS + 1)))
+    world.apply_commands()
+    for _ in range(HOPS):
+        world.process()
+    return len(completed)
+
+
+def _intents_1k_walkers() -> int:
+    """Reference: the same walk driven by a fresh intent per hop."""
+
+    world = GameWorld()
+    completed = _walkers(world)
+    for row in range(WALKERS):
+        world.command_buffer.create_entity(PositionComponent(q=0, r=row * 2))
+    entities = world.apply_commands()
+    for hop in range(1, HOPS + 1):
+        for row, entity in enumerate(entities):
+            world.add_component(entity, MovementIntentComponent(target=HexCoord(hop, row * 2)))
+        world.process()
+    return len(completed)
+
+
+registry.register("movement_10k_marching_columns", _marching_columns)
+registry.register("movement_10k_converging_crowd", _converging_crowd)
+registry.register("movement_1k_walkers_path_component", _paths_1k_walkers)
+registry.register("movement_1k_walkers_intent_per_hop", _intents_1k_walkers)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_movement_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each crowd movement scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} did not move anyone"
+        raise AssertionError(msg)
@@ -0,0 +1,94 @@
+"""CodSpeed benchmarks for deterministic replay verification and seeking."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.replay import Replayer, ReplayRecord, ReplayRecorder
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch
+
+registry = BenchmarkRegistry()
+
+SKIRMISH_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+    ]
+)
+PROGRAMS = {"skirmish.hxc": ScriptRunner().compile(SKIRMISH_SCRIPT)}
+TICKS = 500
+SEEK_TICK = 450
+
+
+@cache
+def _recorded_skirmish() -> ReplayRecord:
+    entities = [
+        LevelEntity(
+            name=f"bot-{index}",
+            components={
+                "Position": {"q": (index % 10) * 3, "r": (index // 10) * 3},
+                "Stats": {"health": 5000, "speed": 100 + index * 7, "processor": 10},
+                "Script": {"path": "skirmish.hxc"},
+            },
+        )
+        for index in range(50)
+    ]
+    level = LevelData(name="Skirmish", grid_size=LevelGridSize(width=40, height=40), tiles=[], entities=entities)
+    return ReplayRecorder(HeadlessMatch(level, programs=PROGRAMS, max_ticks=TICKS), checksum_interval=50, keyframe_interval=100).run()
+
+
+def _verify_replay() -> int:
+    """Re-simulate a 50-bot skirmish from its action stream, checking every checksum."""
+
+    return Replayer(_recorded_skirmish()).verify().tick
+
+
+def _seek_from_start() -> int:
+    """Seek near the end of the replay by simulating from tick zero."""
+
+    return Replayer(_without_keyframes(_recorded_skirmish())).seek(SEEK_TICK).tick
+
+
+def _without_keyframes(record: ReplayRecord) -> ReplayRecord:
+    return ReplayRecord(
+        level=record.level,
+        seed=record.seed,
+        max_ticks=record.max_ticks,
+        action_threshold=record.action_threshold,
+        script_hashes=record.script_hashes,
+        actions=record.actions,
+        checksums=record.checksums,
+        final_tick=record.final_tick,
+    )
+
+
+def _seek_from_keyframe() -> int:
+    """Seek to the same tick, restoring the nearest keyframe first."""
+
+    return Replayer(_recorded_skirmish()).seek(SEEK_TICK).tick
+
+
+registry.register("replay_verify_skirmish", _verify_replay)
+registry.register("replay_seek_from_start", _seek_from_start)
+registry.register("replay_seek_from_keyframe", _seek_from_keyframe)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_replay_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each replay scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} did not advance the replay"
+        raise AssertionError(msg)
@@ -0,0 +1,146 @@
+"""Scaling-curve benchmarks sweeping entity counts and map sizes through the real systems."""
+
+from __future__ import annotations
+
+import random
+from math import isqrt
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.benchmarking.runner import run_benchmarks
+from hexa_core.engine.benchmarking.scaling import scaling_fits
+from hexa_core.engine.components import CombatIntentComponent, MovementIntentComponent, PositionComponent, StatsComponent, TurnComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.events import MOVEMENT_COMPLETED
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch
+from hexa_core.engine.systems.combat_system import CombatSystem
+from hexa_core.engine.systems.movement_system import MovementSystem
+from hexa_core.engine.systems.turn_system import TurnManager
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+ENTITY_COUNTS = (10, 100, 1_000, 10_000, 100_000)
+MAP_SIDES = (15, 50, 150, 500, 1_000)
+SCRIPTED_BOTS = (10, 50, 200, 500)
+# Only run with ``--tag slow``: nearest-enemy lookup scans every combatant per script, so a
+# tick in which all bots act is quadratic and 10k bots already take minutes (100k, hours).
+SLOW_SCRIPTED_BOTS = (1_000, 2_000, 5_000)
+SYSTEM_TICKS = 1
+MAP_BOTS = 100
+MAP_TICKS = 10
+SCRIPTS_PER_TURN = 10  # ADR-0005: 50 entities and 10 script executions per turn
+MAX_LINEAR_SLOPE = 1.3
+
+SKIRMISH_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+    ]
+)
+PROGRAMS = {"skirmish.hxc": ScriptRunner().compile(SKIRMISH_SCRIPT)}
+
+
+def _bot(index: int, q: int, r: int) -> LevelEntity:
+    return LevelEntity(
+        name=f"bot-{index}",
+        components={
+            "Position": {"q": q, "r": r},
+            "Stats": {"health": 50, "speed": 100 + (index % 50) * 7, "processor": 10},
+            "Script": {"path": "skirmish.hxc"},
+        },
+    )
+
+
+def _systems_tick(entities: int) -> int:
+    """One tick of turn, movement and combat for ``entities`` units marching east while every fourth attacks."""
+
+    world = GameWorld()
+    bus, commands = world.event_bus, world.command_buffer
+    world.add_processor(TurnManager(bus), priority=3)
+    world.add_processor(MovementSystem(bus, commands), priority=2)
+    world.add_processor(CombatSystem(bus, commands), priority=1)
+    moved: list[int] = []
+    world.subscribe_event(MOVEMENT_COMPLETED, lambda _, payload: moved.append(payload["entity_id"]))
+
+    side = isqrt(entities - 1) + 1
+    origins = [((index % side) * 2, index // side) for index in range(entities)]
+    for index, (q, r) in enumerate(origins):
+        commands.create_entity(PositionComponent(q=q, r=r), StatsComponent(health=1_000_000, speed=100 + index % 400, processor=10), TurnComponent())
+    units = world.apply_commands()
+    for tick in range(1, SYSTEM_TICKS + 1):
+        # Queue intents the way HeadlessMatch does for script actions, then run the tick.
+        for index, (entity, (q, r)) in enumerate(zip(units, origins, strict=True)):
+            commands.add_component(entity, MovementIntentComponent(target=HexCoord(q + tick, r)))
+            if index % 4 == 0:
+                commands.add_component(entity, CombatIntentComponent(target=units[index - 1], damage=1))
+        world.apply_commands()
+        world.process()
+    return len(moved)
+
+
+def _map_match(side: int) -> int:
+    """100 scripted bots scattered over a ``side`` x ``side`` map for 10 ticks."""
+
+    rng = random.Random(side)
+    cells = rng.sample(range(side * side), MAP_BOTS)
+    level = LevelData(
+        name=f"Plains {side}",
+        grid_size=LevelGridSize(width=side, height=side),
+        tiles=[("plain", q, r) for q in range(side) for r in range(side)],
+        entities=[_bot(index, cell % side, cell // side) for index, cell in enumerate(cells)],
+    )
+    return HeadlessMatch(level, programs=PROGRAMS, max_ticks=MAP_TICKS).run().ticks
+
+
+def _scripted_turn(bots: int, scripts: int) -> int:
+    """Spawn ``bots`` scripted bots and step until at least ``scripts`` scripts have run."""
+
+    side = isqrt(bots - 1) + 1
+    level = LevelData(
+        name="Skirmish",
+        grid_size=LevelGridSize(width=side * 3, height=side * 3),
+        tiles=[],
+        entities=[_bot(index, (index % side) * 3, (index // side) * 3) for index in range(bots)],
+    )
+    match = HeadlessMatch(level, programs=PROGRAMS)
+    executed: list[int] = []
+    match.action_observer = lambda _tick, entity, _actions: executed.append(entity)
+    while len(executed) < scripts and match.step():
+        pass
+    return len(executed)
+
+
+registry.register("systems_tick", _systems_tick, tags=("scaling", "ecs"), params={"entities": ENTITY_COUNTS})
+registry.register("map_match", _map_match, tags=("scaling", "script"), params={"side": MAP_SIDES})
+registry.register("scripted_turn", _scripted_turn, tags=("scaling", "script"), params={"bots": SCRIPTED_BOTS, "scripts": (SCRIPTS_PER_TURN,)})
+registry.register("scripted_turn", _scripted_turn, tags=("scaling", "script", "slow"), params={"bots": SLOW_SCRIPTED_BOTS, "scripts": (SCRIPTS_PER_TURN,)})
+
+
+@pytest.mark.parametrize("name", [name for name in registry.names if name not in registry.select(["slow"])])
+def test_scaling_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each point of the scaling sweeps under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} did no work"
+        raise AssertionError(msg)
+
+
+def test_systems_tick_scales_linearly() -> None:
+    """Fail when one tick of the core systems grows faster than linearly with entity count."""
+
+    report = run_benchmarks([registry], match="systems_tick", warmup=0, rounds=1, calibrated=False)
+    (fit,) = scaling_fits(report.results)
+    if fit.slope > MAX_LINEAR_SLOPE:
+        msg = f"systems_tick grows with {fit.param} at log-log slope {fit.slope:.2f} (points: {fit.points})"
+        raise AssertionError(msg)
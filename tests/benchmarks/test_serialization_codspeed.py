@@ -0,0 +1,106 @@
+"""CodSpeed benchmarks for binary save states against a JSON baseline."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import asdict
+from functools import cache
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.components import PositionComponent, StatsComponent, TurnComponent
+from hexa_core.engine.serialization import SaveStateReader, dumps
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+ENTITY_COUNT = 100_000
+COMPONENT_TYPES = (PositionComponent, StatsComponent, TurnComponent)
+
+
+@cache
+def _populated_world() -> GameWorld:
+    world = GameWorld()
+    for index in range(ENTITY_COUNT):
+        world.create_entity(
+            PositionComponent(q=index % 1000, r=index // 1000),
+            StatsComponent(health=100, speed=index % 50, processor=10),
+            TurnComponent(turn_counter=index % 1000),
+        )
+    return world
+
+
+@cache
+def _binary_state() -> bytes:
+    return dumps(_populated_world().snapshot())
+
+
+@cache
+def _json_state() -> str:
+    return _json_save()
+
+
+def _json_save() -> str:
+    world = _populated_world()
+    with world._activate_context():
+        document = {str(entity): {type(component).__name__: asdict(component) for component in world.components_for_entity(entity)} for entity, _ in world.get_component(PositionComponent)}
+    return json.dumps(document)
+
+
+def _binary_save() -> int:
+    """Encode a 100k-entity world into the binary save-state format."""
+
+    return len(dumps(_populated_world().snapshot()))
+
+
+def _binary_load() -> int:
+    """Decode a 100k-entity save state and restore it into a world."""
+
+    world = GameWorld()
+    SaveStateReader(_binary_state()).restore(world)
+    return len(world.get_component(PositionComponent))
+
+
+def _json_save_baseline() -> int:
+    """Baseline: per-entity ``asdict`` serialization to JSON."""
+
+    return len(_json_save())
+
+
+def _json_load_baseline() -> int:
+    """Baseline: parse the JSON document and rebuild every component."""
+
+    types = {component_type.__name__: component_type for component_type in COMPONENT_TYPES}
+    world = GameWorld()
+    for components in json.loads(_json_state()).values():
+        world.create_entity(*(types[name](**fields) for name, fields in components.items()))
+    return len(world.get_component(PositionComponent))
+
+
+registry.register("save_state_binary_save_100000", _binary_save)
+registry.register("save_state_binary_load_100000", _binary_load)
+registry.register("save_state_json_save_100000", _json_save_baseline)
+registry.register("save_state_json_load_100000", _json_load_baseline)
+
+_SETUP: dict[str, Callable[[], object]] = {
+    "save_state_binary_save_100000": _populated_world,
+    "save_state_binary_load_100000": _binary_state,
+    "save_state_json_save_100000": _populated_world,
+    "save_state_json_load_100000": _json_state,
+}
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_serialization_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each save-state scenario under pytest-codspeed."""
+
+    _SETUP[name]()
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} produced an empty result"
+        raise AssertionError(msg)
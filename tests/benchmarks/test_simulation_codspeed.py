@@ -0,0 +1,82 @@
+"""CodSpeed benchmarks for the headless simulation driver."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch
+
+registry = BenchmarkRegistry()
+
+TURN_BUDGET_SECONDS = 0.1  # ADR-0005: 50 entities and 10 script executions per turn
+SCRIPTS_PER_TURN = 10
+
+SKIRMISH_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+    ]
+)
+PROGRAMS = {"skirmish.hxc": ScriptRunner().compile(SKIRMISH_SCRIPT)}
+
+
+def _skirmish_level(bots: int) -> LevelData:
+    entities = [
+        LevelEntity(
+            name=f"bot-{index}",
+            components={
+                "Position": {"q": (index % 10) * 3, "r": (index // 10) * 3},
+                "Stats": {"health": 50, "speed": 100 + index * 7, "processor": 10},
+                "Script": {"path": "skirmish.hxc"},
+            },
+        )
+        for index in range(bots)
+    ]
+    return LevelData(name="Skirmish", grid_size=LevelGridSize(width=40, height=40), tiles=[], entities=entities)
+
+
+def _headless_skirmish() -> int:
+    """Fast-forward a 50-bot free-for-all for 500 ticks."""
+
+    return HeadlessMatch(_skirmish_level(50), programs=PROGRAMS, max_ticks=500).run().ticks
+
+
+def _headless_turn(bots: int) -> int:
+    """Spawn a skirmish and step it until ``SCRIPTS_PER_TURN`` scripts have run."""
+
+    match = HeadlessMatch(_skirmish_level(bots), programs=PROGRAMS)
+    executed: list[int] = []
+    match.action_observer = lambda _tick, entity, _actions: executed.append(entity)
+    while len(executed) < SCRIPTS_PER_TURN and match.step():
+        pass
+    return len(executed)
+
+
+registry.register("headless_skirmish_50_bots", _headless_skirmish, tags=("simulation", "script"))
+registry.register("headless_turn", _headless_turn, tags=("simulation", "script"), budget=TURN_BUDGET_SECONDS, params={"bots": (50,)}, warmup=1, rounds=5)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_simulation_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each headless simulation scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} did not advance the simulation"
+        raise AssertionError(msg)
+
+
+def test_simulation_turn_budget() -> None:
+    """Fail when a scripted turn exceeds ADR-0005's budget on this machine."""
+
+    registry.check_budgets(tags=["simulation"])
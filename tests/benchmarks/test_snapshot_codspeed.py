@@ -0,0 +1,85 @@
+"""CodSpeed benchmarks for world snapshot capture and restore."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from functools import cache, partial
+from typing import TYPE_CHECKING
+
+import esper
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.components import PositionComponent, StatsComponent, TurnComponent
+from hexa_core.engine.snapshot import WorldSnapshot
+from hexa_core.engine.world import GameWorld
+
+registry = BenchmarkRegistry()
+
+ENTITY_COUNTS = (100, 10_000, 100_000)
+
+
+@cache
+def _populated_world(entity_count: int) -> GameWorld:
+    world = GameWorld()
+    for index in range(entity_count):
+        world.create_entity(
+            PositionComponent(q=index % 1000, r=index // 1000),
+            StatsComponent(health=100, speed=index % 50, processor=10),
+            TurnComponent(turn_counter=index % 1000),
+        )
+    return world
+
+
+def _snapshot_scenario(entity_count: int) -> Callable[[], int]:
+    def capture() -> int:
+        return _populated_world(entity_count).snapshot().entity_count
+
+    return capture
+
+
+def _restore_scenario(entity_count: int) -> Callable[[], int]:
+    def restore() -> int:
+        world = _populated_world(entity_count)
+        snapshot = _baseline_snapshot(entity_count)
+        world.restore(snapshot)
+        return snapshot.entity_count
+
+    return restore
+
+
+@cache
+def _baseline_snapshot(entity_count: int) -> WorldSnapshot:
+    return _populated_world(entity_count).snapshot()
+
+
+def _deepcopy_baseline() -> int:
+    """Reference cost of deep-copying esper's entity table for 10k entities."""
+
+    world = _populated_world(10_000)
+    with world._activate_context():
+        return len(copy.deepcopy(esper._entities))
+
+
+# World construction is cached and primed outside the measured call.
+_SETUP: dict[str, Callable[[], object]] = {"world_deepcopy_baseline_10000": lambda: _populated_world(10_000)}
+for count in ENTITY_COUNTS:
+    registry.register(f"world_snapshot_{count}", _snapshot_scenario(count))
+    registry.register(f"world_restore_{count}", _restore_scenario(count))
+    _SETUP[f"world_snapshot_{count}"] = _SETUP[f"world_restore_{count}"] = partial(_baseline_snapshot, count)
+registry.register("world_deepcopy_baseline_10000", _deepcopy_baseline)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_snapshot_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each snapshot scenario under pytest-codspeed."""
+
+    _SETUP[name]()
+    result = benchmark(registry.get(name))
+    if not isinstance(result, int) or result <= 0:
+        msg = f"Benchmark {name!r} produced an empty result"
+        raise AssertionError(msg)
@@ -0,0 +1,79 @@
+"""CodSpeed benchmarks comparing per-tick incremental hashing with full checksums."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.replay import world_checksum
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch
+
+registry = BenchmarkRegistry()
+
+SKIRMISH_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+    ]
+)
+PROGRAMS = {"skirmish.hxc": ScriptRunner().compile(SKIRMISH_SCRIPT)}
+TICKS = 60
+
+
+def _skirmish() -> HeadlessMatch:
+    entities = [
+        LevelEntity(
+            name=f"bot-{index}",
+            components={
+                "Position": {"q": (index % 10) * 3, "r": (index // 10) * 3},
+                "Stats": {"health": 5000, "speed": 100 + index * 7, "processor": 10},
+                "Script": {"path": "skirmish.hxc"},
+            },
+        )
+        for index in range(50)
+    ]
+    level = LevelData(name="Skirmish", grid_size=LevelGridSize(width=40, height=40), tiles=[], entities=entities)
+    return HeadlessMatch(level, programs=PROGRAMS, max_ticks=TICKS)
+
+
+def _incremental_hash_per_tick() -> int:
+    """50-bot skirmish reading the incremental state hash after every tick."""
+
+    match = _skirmish()
+    hashes = set()
+    while match.step():
+        hashes.add(match.state_hash.value)
+    return len(hashes)
+
+
+def _full_checksum_per_tick() -> int:
+    """Same skirmish serializing and digesting the whole world after every tick."""
+
+    match = _skirmish()
+    digests = set()
+    while match.step():
+        digests.add(world_checksum(match.world))
+    return len(digests)
+
+
+registry.register("state_hash_incremental_per_tick", _incremental_hash_per_tick)
+registry.register("state_hash_full_checksum_per_tick", _full_checksum_per_tick)
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_state_hash_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each hashing scenario under pytest-codspeed."""
+
+    if benchmark(registry.get(name)) <= 1:
+        msg = f"Benchmark {name!r} did not observe the world changing"
+        raise AssertionError(msg)
@@ -0,0 +1,100 @@
+"""CodSpeed benchmarks for the multi-process tournament runner."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import Executor
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest import BenchmarkFixture
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.tournament import Tournament
+
+# 8 maps x 6 pairings: enough matches per worker that process scheduling, not
+# pool start-up, dominates each timed round.
+MAPS = 8
+
+registry = BenchmarkRegistry()
+
+SCRIPTS = {
+    "brawler.hxc": 'IF target_distance <= 1 GOTO "strike"\nACTION "move" target_q target_r\nEND_TURN\nLABEL "strike"\nACTION "attack" target_id',
+    "rusher.hxc": 'ACTION "move" target_q target_r\nACTION "attack" target_id',
+    "idle.hxc": "END_TURN",
+}
+
+
+@cache
+def _arena() -> tuple[tuple[Path, ...], tuple[Path, ...]]:
+    """Write the four-bot maps and the competing scripts once per session."""
+
+    root = Path(tempfile.mkdtemp(prefix="hexa-tournament-"))
+    maps = []
+    for layout in range(MAPS):
+        entities = [
+            {
+                "name": f"bot-{index}",
+                "components": {
+                    "Position": {"q": index * (3 + layout % 3), "r": (index + layout) % 2},
+                    "Stats": {"health": 60, "speed": 150 + index * 10, "processor": 10},
+                    "Script": {"path": "placeholder.hxc"},
+                },
+            }
+            for index in range(4)
+        ]
+        map_path = root / f"arena-{layout}.json"
+        map_path.write_text(json.dumps({"name": f"Arena {layout}", "grid_size": {"width": 20, "height": 20}, "entities": entities}), encoding="utf-8")
+        maps.append(map_path)
+    scripts = []
+    for name, source in SCRIPTS.items():
+        path = root / name
+        path.write_text(source, encoding="utf-8")
+        scripts.append(path)
+    return tuple(maps), tuple(scripts)
+
+
+@cache
+def _prepared(workers: int) -> tuple[Tournament, Executor | None]:
+    """Build the tournament and start its warmed-up pool outside the timed region."""
+
+    maps, scripts = _arena()
+    tournament = Tournament(maps, scripts, workers=workers, max_ticks=400)
+    if workers == 1:
+        return tournament, None
+    executor = tournament.executor()
+    for future in [executor.submit(os.getpid) for _ in range(workers)]:
+        future.result()
+    return tournament, executor
+
+
+def _tournament(workers: int) -> Callable[[], float]:
+    def run() -> float:
+        """Play a full round robin on a reused pool and report matches per second."""
+
+        tournament, executor = _prepared(workers)
+        return tournament.run(executor).matches_per_second
+
+    return run
+
+
+WORKERS = {f"tournament_round_robin_{workers}_workers": workers for workers in sorted({1, 2, 4, os.cpu_count() or 1})}
+for label, workers in WORKERS.items():
+    registry.register(label, _tournament(workers))
+
+
+@pytest.mark.parametrize("name", registry.names)
+def test_tournament_benchmarks_execute(benchmark: BenchmarkFixture, name: str) -> None:
+    """Run each tournament scenario under pytest-codspeed."""
+
+    _prepared(WORKERS[name])
+    if benchmark(registry.get(name)) <= 0:
+        msg = f"Benchmark {name!r} completed no matches"
+        raise AssertionError(msg)
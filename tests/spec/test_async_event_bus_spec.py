@@ -0,0 +1,253 @@
+"""asyncio event bus specs."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, cast
+
+import pytest
+from hexa_core.engine.async_event_bus import AsyncEventBus
+from hexa_core.engine.event_bus import Payload
+
+
+def describe_async_event_bus() -> None:
+    def it_delivers_to_coroutine_subscribers_without_blocking_publish() -> None:
+        async def scenario() -> tuple[list[int], list[int]]:
+            received: list[int] = []
+            published: list[int] = []
+
+            async def slow(_: str, payload: Payload) -> None:
+                await asyncio.sleep(0.01)
+                received.append(payload["value"])
+
+            async with AsyncEventBus() as bus:
+                bus.subscribe_async("tick", slow)
+                for value in range(3):
+                    bus.publish("tick", {"value": value})
+                    published.append(value)
+                assert received == []
+                await bus.wait_for_tick(bus.advance_tick())
+            return published, received
+
+        published, received = asyncio.run(scenario())
+
+        assert published == [0, 1, 2]
+        assert received == [0, 1, 2]
+
+    def it_still_calls_synchronous_subscribers_inline() -> None:
+        bus = AsyncEventBus()
+        received: list[object] = []
+        bus.subscribe("tick", lambda _event, payload: received.append(payload["value"]))
+
+        bus.publish("tick", {"value": 1})
+
+        assert received == [1]
+
+
+def describe_async_wildcards() -> None:
+    def it_routes_pattern_subscriptions_to_coroutine_handlers() -> None:
+        async def scenario() -> list[tuple[str, str]]:
+            received: list[tuple[str, str]] = []
+
+            def recorder(label: str) -> Callable[[str, Payload], Awaitable[None]]:
+                async def handler(channel: str, _: Payload) -> None:
+                    received.append((label, channel))
+
+                return handler
+
+            async with AsyncEventBus() as bus:
+                bus.publish("engine.movement.completed", {})
+                bus.subscribe_async("engine.#", recorder("all"))
+                bus.subscribe_async("engine.*.completed", recorder("completed"))
+                bus.subscribe_async("engine.turn.ready", recorder("exact"))
+                bus.publish("engine.movement.completed", {})
+                bus.publish("engine.turn.ready", {})
+                bus.publish("ui.click", {})
+                await bus.wait_for_tick(bus.advance_tick())
+            return received
+
+        assert sorted(asyncio.run(scenario())) == [
+            ("all", "engine.movement.completed"),
+            ("all", "engine.turn.ready"),
+            ("completed", "engine.movement.completed"),
+            ("exact", "engine.turn.ready"),
+        ]
+
+
+def describe_async_subscriber_limits() -> None:
+    def it_runs_handlers_concurrently_up_to_the_limit() -> None:
+        async def scenario() -> int:
+            active = 0
+            peak = 0
+
+            async def handler(_: str, __: Payload) -> None:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+            async with AsyncEventBus() as bus:
+                bus.subscribe_async("tick", handler, concurrency=3)
+                for _ in range(9):
+                    bus.publish("tick", {})
+                await bus.wait_for_tick(bus.advance_tick())
+            return peak
+
+        assert asyncio.run(scenario()) == 3
+
+    def it_drops_the_oldest_buffered_events_when_a_subscriber_falls_behind() -> None:
+        async def scenario() -> tuple[list[int], int]:
+            received: list[int] = []
+
+            async def handler(_: str, payload: Payload) -> None:
+                received.append(payload["value"])
+
+            async with AsyncEventBus() as bus:
+                subscription = bus.subscribe_async("tick", handler, capacity=2)
+                for value in range(5):
+                    bus.publish("tick", {"value": value})
+                await bus.wait_for_tick(bus.advance_tick())
+            return received, subscription.dropped
+
+        received, dropped = asyncio.run(scenario())
+
+        assert received == [3, 4]
+        assert dropped == 3
+
+
+def describe_async_backpressure() -> None:
+    def it_applies_backpressure_through_apublish() -> None:
+        async def scenario() -> list[int]:
+            received: list[int] = []
+
+            async def handler(_: str, payload: Payload) -> None:
+                await asyncio.sleep(0)
+                received.append(payload["value"])
+
+            async with AsyncEventBus() as bus:
+                bus.subscribe_async("tick", handler, capacity=1)
+                for value in range(5):
+                    await bus.apublish("tick", {"value": value})
+                await bus.wait_for_tick(bus.advance_tick())
+            return received
+
+        assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+
+
+def describe_async_tick_tracking() -> None:
+    def it_waits_only_for_the_requested_tick() -> None:
+        async def scenario() -> list[str]:
+            log: list[str] = []
+            release = asyncio.Event()
+
+            async def handler(_: str, payload: Payload) -> None:
+                if payload["tick"] == 1:
+                    await release.wait()
+                log.append(f"handled {payload['tick']}")
+
+            async with AsyncEventBus() as bus:
+                bus.subscribe_async("tick", handler, concurrency=2)
+                bus.publish("tick", {"tick": 0})
+                bus.advance_tick()
+                bus.publish("tick", {"tick": 1})
+                bus.advance_tick()
+                await bus.wait_for_tick(0)
+                log.append("tick 0 delivered")
+                release.set()
+                await bus.wait_for_tick(1)
+            return log
+
+        assert asyncio.run(scenario()) == ["handled 0", "tick 0 delivered", "handled 1"]
+
+    def it_collects_subscriber_errors() -> None:
+        async def scenario() -> list[BaseException]:
+            async def failing(_: str, __: Payload) -> None:
+                raise RuntimeError("observer disconnected")
+
+            async with AsyncEventBus() as bus:
+                bus.subscribe_async("tick", failing)
+                bus.publish("tick", {})
+                await bus.wait_for_tick(bus.advance_tick())
+            return list(bus.errors)
+
+        [error] = asyncio.run(scenario())
+        assert str(error) == "observer disconnected"
+
+
+def describe_async_shutdown() -> None:
+    def it_settles_pending_ticks_on_close() -> None:
+        async def scenario() -> tuple[int, int]:
+            async def stuck(_: str, __: Payload) -> None:
+                await asyncio.Event().wait()
+
+            bus = AsyncEventBus()
+            bus.start()
+            subscription = bus.subscribe_async("tick", stuck)
+            bus.publish("tick", {})
+            bus.publish("tick", {})
+            tick = bus.advance_tick()
+            await asyncio.sleep(0)
+            await bus.aclose()
+            await asyncio.wait_for(bus.wait_for_tick(tick), timeout=1)
+            return subscription.delivered, subscription.dropped
+
+        assert asyncio.run(scenario()) == (0, 2)
+
+    def it_does_not_count_cancelled_handlers_as_delivered() -> None:
+        async def scenario() -> tuple[int, int, list[int]]:
+            handled: list[int] = []
+
+            async def handler(_: str, payload: Payload) -> None:
+                if payload["n"] == 0:
+                    raise asyncio.CancelledError
+                handled.append(payload["n"])
+
+            async with AsyncEventBus() as bus:
+                subscription = bus.subscribe_async("tick", handler)
+                bus.publish("tick", {"n": 0})
+                bus.publish("tick", {"n": 1})
+                await bus.wait_for_tick(bus.advance_tick())
+            return subscription.delivered, subscription.dropped, handled
+
+        assert asyncio.run(scenario()) == (1, 1, [1])
+
+
+def describe_async_engine_integration() -> None:
+    def it_copies_pooled_records_published_by_engine_systems() -> None:
+        from hexa_core.engine.components import MovementIntentComponent, PositionComponent
+        from hexa_core.engine.datatypes import HexCoord
+        from hexa_core.engine.events import MOVEMENT_COMPLETED
+        from hexa_core.engine.systems.movement_system import MovementSystem
+        from hexa_core.engine.world import GameWorld
+
+        async def scenario() -> list[Any]:
+            destinations: list[Any] = []
+
+            async def observer(_: str, payload: Payload) -> None:
+                destinations.append(payload["to"])
+
+            async with AsyncEventBus() as bus:
+                bus.subscribe_async(MOVEMENT_COMPLETED, observer)
+                world = GameWorld(event_bus=bus)
+                world.add_processor(MovementSystem(bus, world.command_buffer))
+                entity = cast(int, world.create_entity(PositionComponent(q=0, r=0)))
+                for step in (1, 2):
+                    world.add_component(entity, MovementIntentComponent(target=HexCoord(step, 0)))
+                    world.process()
+                    bus.advance_tick()
+                await bus.wait_for_tick(1)
+            return destinations
+
+        assert asyncio.run(scenario()) == [HexCoord(1, 0), HexCoord(2, 0)]
+
+    def it_rejects_invalid_limits() -> None:
+        bus = AsyncEventBus()
+
+        async def handler(_: str, __: Payload) -> None:
+            return None
+
+        with pytest.raises(ValueError, match="positive"):
+            bus.subscribe_async("tick", handler, concurrency=0)
@@ -0,0 +1,112 @@
+"""Benchmark result store and regression comparison specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.benchmarking.compare import IMPROVEMENT, REGRESSION, UNCHANGED, compare_reports, main, mann_whitney_u
+from hexa_core.engine.benchmarking.history import ResultStore, machine_fingerprint
+from hexa_core.engine.benchmarking.runner import BenchmarkReport, BenchmarkStats, machine_info
+
+STEADY = [0.010, 0.011, 0.0105, 0.0102, 0.0108, 0.0101, 0.0109, 0.0103, 0.0106, 0.0104]
+
+
+def _report(commit: str, **samples: list[float]) -> BenchmarkReport:
+    return BenchmarkReport(commit=commit, results=[BenchmarkStats.from_samples(name, values) for name, values in samples.items()])
+
+
+def describe_mann_whitney_u() -> None:
+    def it_matches_the_normal_approximation_for_separated_samples() -> None:
+        u_statistic, p_value = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+
+        assert u_statistic == 0
+        assert p_value == pytest.approx(0.01219, abs=1e-4)
+
+    def it_finds_no_difference_between_identical_samples() -> None:
+        assert mann_whitney_u(STEADY, STEADY)[1] == pytest.approx(1.0)
+        assert mann_whitney_u([1.0, 1.0], [1.0, 1.0]) == (2.0, 1.0)
+        assert mann_whitney_u([], STEADY) == (0.0, 1.0)
+
+
+def describe_result_store() -> None:
+    def it_saves_and_loads_reports_per_machine_and_python(tmp_path: Path) -> None:
+        store = ResultStore(tmp_path)
+        report = _report("abc123", world_process=STEADY)
+
+        path = store.save(report)
+        loaded = store.load("abc123", report.machine)
+
+        assert path.relative_to(tmp_path).parts[0] == machine_fingerprint(report.machine)
+        assert loaded.result("world_process") == report.result("world_process")
+        assert store.commits(report.machine) == ["abc123"]
+
+    def it_keeps_other_machines_apart(tmp_path: Path) -> None:
+        store = ResultStore(tmp_path)
+        store.save(_report("abc123", world_process=STEADY))
+        elsewhere = {**machine_info(), "node": "build-box-2"}
+
+        assert store.commits(elsewhere) == []
+        with pytest.raises(FileNotFoundError):
+            store.load("abc123", elsewhere)
+
+    def it_fingerprints_the_operating_system() -> None:
+        machine = machine_info()
+
+        assert machine["system"]
+        assert machine_fingerprint({**machine, "system": "Plan 9"}) != machine_fingerprint(machine)
+
+    def it_overrides_the_commit_when_saving(tmp_path: Path) -> None:
+        store = ResultStore(tmp_path)
+        report = _report("abc123", world_process=STEADY)
+
+        store.save(report, "release-1.2")
+
+        assert report.commit == "release-1.2"
+        assert store.commits(report.machine) == ["release-1.2"]
+
+
+def describe_compare_reports() -> None:
+    def it_classifies_significant_changes_beyond_the_threshold() -> None:
+        baseline = _report("old", slower=STEADY, faster=STEADY, noisy=STEADY)
+        candidate = _report(
+            "new",
+            slower=[sample * 1.5 for sample in STEADY],
+            faster=[sample * 0.5 for sample in STEADY],
+            noisy=[sample * 1.01 for sample in STEADY],
+        )
+
+        verdicts = {comparison.name: comparison.verdict for comparison in compare_reports(baseline, candidate)}
+
+        assert verdicts == {"slower": REGRESSION, "faster": IMPROVEMENT, "noisy": UNCHANGED}
+
+    def it_ignores_benchmarks_missing_from_the_baseline() -> None:
+        comparisons = compare_reports(_report("old", kept=STEADY), _report("new", kept=STEADY, added=STEADY))
+
+        assert [comparison.name for comparison in comparisons] == ["kept"]
+
+
+def describe_compare_cli() -> None:
+    def it_exits_non_zero_on_regressions(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        store = ResultStore(tmp_path)
+        store.save(_report("old", world_process=STEADY))
+        store.save(_report("new", world_process=[sample * 2 for sample in STEADY]))
+
+        assert main(["old", "new", "--store", str(tmp_path)]) == 1
+        assert "1 regression(s) beyond 5%: world_process" in capsys.readouterr().out
+        assert main(["new", "old", "--store", str(tmp_path)]) == 0
+
+    def it_accepts_json_reports(tmp_path: Path) -> None:
+        paths = []
+        for name, scale in (("base.json", 1.0), ("head.json", 1.02)):
+            path = tmp_path / name
+            path.write_text(json.dumps(_report(name, world_process=[sample * scale for sample in STEADY]).to_dict()), encoding="utf-8")
+            paths.append(str(path))
+
+        assert main(paths) == 0
+
+    def it_reports_missing_runs(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main(["no-such-commit", "--store", str(tmp_path)]) == 2
+        assert "No benchmark results" in capsys.readouterr().err
@@ -0,0 +1,180 @@
+"""Memory benchmark and component footprint specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.benchmarking.__main__ import main
+from hexa_core.engine.benchmarking.compare import IMPROVEMENT, REGRESSION, UNCHANGED, compare_reports
+from hexa_core.engine.benchmarking.memory import (
+    COMPONENT_INDEX,
+    ENTITY_TABLE,
+    MemoryBudgetExceededError,
+    MemoryStats,
+    check_component_budgets,
+    check_memory_budgets,
+    component_footprint,
+    deep_sizeof,
+    measure_memory,
+    run_memory_benchmarks,
+)
+from hexa_core.engine.benchmarking.runner import BenchmarkReport
+from hexa_core.engine.components import PositionComponent, StatsComponent
+from hexa_core.engine.world import GameWorld
+
+MEGABYTE = 1_000_000
+
+BENCHMARK_MODULE = """
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+
+registry = BenchmarkRegistry()
+registry.register("buffer", lambda: bytearray(200_000), tags=("memory",))
+"""
+
+
+def _registry() -> BenchmarkRegistry:
+    registry = BenchmarkRegistry()
+    registry.register("kept", lambda: bytearray(MEGABYTE), memory_budget=2 * MEGABYTE)
+    registry.register("discarded", lambda: len(bytearray(MEGABYTE)), tags=("scratch",))
+    return registry
+
+
+def describe_measure_memory() -> None:
+    def it_separates_retained_bytes_from_the_peak() -> None:
+        registry = _registry()
+
+        kept = measure_memory(registry.spec("kept"))
+        discarded = measure_memory(registry.spec("discarded"))
+
+        assert kept.retained_bytes >= MEGABYTE
+        assert kept.budget == 2 * MEGABYTE
+        assert not kept.exceeded
+        assert discarded.peak_bytes >= MEGABYTE
+        assert discarded.retained_bytes < MEGABYTE // 10
+
+    def it_filters_by_tag_and_name() -> None:
+        registry = _registry()
+
+        assert [result.name for result in run_memory_benchmarks([registry], tags=["scratch"])] == ["discarded"]
+        assert [result.name for result in run_memory_benchmarks([registry], match="buffer")] == []
+        assert [result.name for result in run_memory_benchmarks([registry], match="kept")] == ["kept"]
+
+    def it_rejects_non_positive_memory_budgets() -> None:
+        with pytest.raises(ValueError, match="memory budget"):
+            BenchmarkRegistry().register("empty", list, memory_budget=0)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="peak RSS is measured in a forked child")
+    def it_measures_peak_rss_in_a_forked_child() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("touched", lambda: len(b"x" * (50 * MEGABYTE)))
+
+        untracked = measure_memory(registry.spec("touched"))
+        tracked = measure_memory(registry.spec("touched"), rss=True)
+
+        assert untracked.peak_rss_bytes is None
+        assert tracked.peak_rss_bytes is not None
+        assert tracked.peak_rss_bytes >= 40 * MEGABYTE
+
+
+def describe_check_memory_budgets() -> None:
+    def it_returns_budgeted_results_within_budget() -> None:
+        results = [MemoryStats("kept", 10, 5, budget=8), MemoryStats("free", 10, 50)]
+
+        assert check_memory_budgets(results) == results[:1]
+
+    def it_raises_listing_every_budgeted_result() -> None:
+        results = [MemoryStats("kept", 10, 9, budget=8), MemoryStats("small", 1, 1, budget=8)]
+
+        with pytest.raises(MemoryBudgetExceededError, match="1 of 2 memory budgets") as error:
+            check_memory_budgets(results)
+
+        assert error.value.over == 1
+        assert "OVER  kept: 9 B retained / 8 B budget" in str(error.value)
+
+
+def describe_deep_sizeof() -> None:
+    def it_counts_shared_objects_once() -> None:
+        payload = "x" * 100
+        seen: set[int] = set()
+
+        first, second = [payload], [payload]
+
+        assert deep_sizeof(first, seen) == sys.getsizeof(first) + sys.getsizeof(payload)
+        assert deep_sizeof(second, seen) == sys.getsizeof(second)
+        assert deep_sizeof(second, seen) == 0
+
+    def it_ignores_interpreter_shared_values() -> None:
+        assert deep_sizeof((None, True, 7, int), set()) == sys.getsizeof((None, True, 7, int))
+
+    def it_follows_slots_and_instance_dicts() -> None:
+        position = PositionComponent(q=1000, r=2000)
+
+        assert deep_sizeof(position, set()) == sys.getsizeof(position) + sys.getsizeof(1000) + sys.getsizeof(2000)
+
+
+def describe_component_footprint() -> None:
+    def it_reports_components_and_esper_bookkeeping() -> None:
+        world = GameWorld()
+        for index in range(10):
+            world.command_buffer.create_entity(PositionComponent(q=index, r=0), StatsComponent(health=100, speed=100, processor=10))
+        world.apply_commands()
+
+        rows = {row.component: row for row in component_footprint(world)}
+
+        assert rows["PositionComponent"].count == 10
+        assert rows["StatsComponent"].count == 10
+        assert rows[ENTITY_TABLE].count == 10
+        assert rows[COMPONENT_INDEX].count == 2
+        assert rows["PositionComponent"].per_instance == rows["PositionComponent"].bytes / 10
+
+    def it_checks_bytes_per_instance_against_budgets() -> None:
+        world = GameWorld()
+        world.command_buffer.create_entity(PositionComponent(q=0, r=0))
+        world.apply_commands()
+        footprint = component_footprint(world)
+
+        check_component_budgets(footprint, {"PositionComponent": 10_000, "StatsComponent": 1})
+        with pytest.raises(MemoryBudgetExceededError, match="PositionComponent"):
+            check_component_budgets(footprint, {"PositionComponent": 1})
+
+
+def describe_memory_reports() -> None:
+    def it_round_trips_memory_results() -> None:
+        report = BenchmarkReport(commit="abc123", memory=[MemoryStats("level", 300, 200, budget=250, params={"side": 50})])
+
+        loaded = BenchmarkReport.from_dict(report.to_dict())
+
+        assert loaded.memory_result("level") == report.memory[0]
+        assert loaded.memory_result("world") is None
+
+    def it_compares_retained_bytes_against_the_threshold() -> None:
+        baseline = BenchmarkReport(memory=[MemoryStats("level", 0, 1000), MemoryStats("world", 0, 1000), MemoryStats("queue", 0, 1000)])
+        candidate = BenchmarkReport(memory=[MemoryStats("level", 0, 1200), MemoryStats("world", 0, 1020), MemoryStats("queue", 0, 500)])
+
+        verdicts = {comparison.name: (comparison.verdict, comparison.unit, comparison.p_value) for comparison in compare_reports(baseline, candidate)}
+
+        assert verdicts == {"level": (REGRESSION, "B", None), "world": (UNCHANGED, "B", None), "queue": (IMPROVEMENT, "B", None)}
+
+    def it_prints_memory_from_the_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        module = tmp_path / "test_buffers_codspeed.py"
+        module.write_text(BENCHMARK_MODULE, encoding="utf-8")
+
+        assert main([str(module), "--memory", "--rounds", "2", "--warmup", "0", "--no-calibration"]) == 0
+
+        output = capsys.readouterr().out
+        assert "retained KiB" in output
+        name, _, retained, _ = output.splitlines()[-1].split()
+        assert name == "buffer"
+        assert float(retained) >= 195
+
+    def it_fails_the_cli_when_retained_bytes_are_over_budget(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        module = tmp_path / "test_buffers_codspeed.py"
+        module.write_text(BENCHMARK_MODULE.replace('tags=("memory",)', "memory_budget=1_000"), encoding="utf-8")
+
+        assert main([str(module), "--memory", "--rounds", "2", "--warmup", "0", "--no-calibration"]) == 1
+        assert "OVER  buffer" in capsys.readouterr().err
@@ -0,0 +1,120 @@
+"""Benchmark profiling and collapsed-stack specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.benchmarking.__main__ import main
+from hexa_core.engine.benchmarking.profiling import CPROFILE, SAMPLE, Profile, _collapse_cprofile, diff_profiles, profile_benchmark
+from hexa_core.engine.benchmarking.profiling import main as diff_main
+
+BENCHMARK_MODULE = """
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+
+registry = BenchmarkRegistry()
+registry.register("sums", lambda size: sum(range(size)), params={"size": (1_000, 10_000)})
+"""
+
+
+def _spin(seconds: float) -> float:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return deadline
+
+
+def _scenario() -> float:
+    return _spin(0.02)
+
+
+def describe_collapse_cprofile() -> None:
+    def it_splits_shared_callees_across_their_call_paths() -> None:
+        a, b, c = ("m.py", 1, "a"), ("m.py", 2, "b"), ("m.py", 3, "c")
+        stats = {
+            a: (1, 1, 0.003, 0.010, {}),
+            b: (1, 1, 0.003, 0.006, {a: (1, 1, 0.003, 0.006)}),
+            c: (2, 2, 0.004, 0.004, {a: (1, 1, 0.001, 0.001), b: (1, 1, 0.003, 0.003)}),
+        }
+
+        assert _collapse_cprofile(stats) == {"m.py:a": 3000, "m.py:a;m.py:b": 3000, "m.py:a;m.py:b;m.py:c": 3000, "m.py:a;m.py:c": 1000}
+
+    def it_stops_at_recursive_calls() -> None:
+        a = ("m.py", 1, "a")
+        stats = {a: (3, 1, 0.002, 0.002, {a: (2, 0, 0.001, 0.001)})}
+
+        assert _collapse_cprofile(stats) == {}
+
+
+def describe_profile_benchmark() -> None:
+    def it_records_deterministic_stacks_from_the_scenario_down() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("spin", _scenario, rounds=2)
+
+        profile = profile_benchmark(registry.spec("spin"), mode=CPROFILE)
+
+        hottest = max(profile.stacks, key=profile.stacks.__getitem__)
+        assert hottest.startswith("test_benchmark_profiling_spec.py:_scenario;test_benchmark_profiling_spec.py:_spin")
+        assert profile.total >= 30_000
+
+    def it_samples_the_benchmarking_thread() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("spin", _scenario)
+
+        profile = profile_benchmark(registry.spec("spin"), mode=SAMPLE, rounds=5, interval=0.001)
+
+        assert profile.total > 0
+        assert all(stack.startswith("test_benchmark_profiling_spec.py:_scenario") for stack in profile.stacks)
+        assert "test_benchmark_profiling_spec.py:_spin" in profile.self_weights()
+
+    def it_rejects_unknown_profilers() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("spin", _scenario)
+
+        with pytest.raises(ValueError, match="Unknown profiler"):
+            profile_benchmark(registry.spec("spin"), mode="perf")
+
+
+def describe_collapsed_profiles() -> None:
+    def it_round_trips_through_folded_files(tmp_path: Path) -> None:
+        profile = Profile("map_match[side=50]", CPROFILE, {"a;b": 5, "a": 2})
+        path = tmp_path / profile.filename()
+        with path.open("w", encoding="utf-8") as stream:
+            profile.write_collapsed(stream)
+
+        assert path.name == "map_match_side=50.cprofile.folded"
+        assert path.read_text(encoding="utf-8") == "a 2\na;b 5\n"
+        assert Profile.read_collapsed(path) == Profile("map_match_side=50", CPROFILE, {"a;b": 5, "a": 2})
+
+    def it_diffs_shares_of_self_time() -> None:
+        baseline = Profile("tick", CPROFILE, {"run;move": 75, "run;attack": 25})
+        candidate = Profile("tick", SAMPLE, {"run;move": 2, "run;attack": 6})
+
+        deltas = diff_profiles(baseline, candidate)
+
+        assert [(delta.frame, delta.change) for delta in deltas] == [("attack", 0.5), ("move", -0.5)]
+
+
+def describe_profiling_cli() -> None:
+    def it_writes_profiles_next_to_the_results(tmp_path: Path) -> None:
+        module = tmp_path / "test_sums_codspeed.py"
+        module.write_text(BENCHMARK_MODULE, encoding="utf-8")
+        output = tmp_path / "results.json"
+
+        exit_code = main([str(module), "--rounds", "2", "--no-calibration", "--format", "json", "--output", str(output), "--profile", "cprofile"])
+
+        assert exit_code == 0
+        assert sorted(path.name for path in (tmp_path / "results.profiles").iterdir()) == ["sums_size=1000.cprofile.folded", "sums_size=10000.cprofile.folded"]
+
+    def it_diffs_two_folded_files(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        (tmp_path / "base.folded").write_text("run;move 3\nrun;attack 1\n", encoding="utf-8")
+        (tmp_path / "new.folded").write_text("run;move 1\nrun;attack 3\n", encoding="utf-8")
+
+        assert diff_main([str(tmp_path / "base.folded"), str(tmp_path / "new.folded"), "--limit", "1"]) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1].split() == ["attack", "25.0%", "75.0%", "+50.0%"]
+        assert diff_main([str(tmp_path / "missing.folded"), str(tmp_path / "new.folded")]) == 2
@@ -7,7 +7,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 import pytest
-from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.benchmarking import BenchmarkRegistry, BudgetExceededError
 
 
 @dataclass
@@ -132,3 +132,102 @@ def describe_benchmark_registry_execution() -> None:
 
         assert results == {"alpha": 1, "beta": 2}
         assert [call.name for call in runner.calls] == ["alpha", "beta"]
+
+
+class FakeTimer:
+    """Advances by a scripted duration every time a benchmark call is timed."""
+
+    def __init__(self: FakeTimer, durations: list[float]) -> None:
+        self.now = 0.0
+        self._durations = durations
+        self._started = False
+
+    def __call__(self: FakeTimer) -> float:
+        if self._started:
+            self.now += self._durations.pop(0)
+        self._started = not self._started
+        return self.now
+
+
+def describe_benchmark_registry_metadata() -> None:
+    def it_records_tags_budget_warmup_and_rounds() -> None:
+        registry = BenchmarkRegistry()
+
+        @registry.register("alpha", tags=("ecs", "turn"), budget=0.1, warmup=2, rounds=5)
+        def alpha() -> int:
+            return 1
+
+        spec = registry.spec("alpha")
+        assert spec.tags == frozenset({"ecs", "turn"})
+        assert (spec.budget, spec.warmup, spec.rounds) == (0.1, 2, 5)
+        assert registry.get("alpha") is alpha
+
+    def it_expands_parameter_sweeps_into_named_variants() -> None:
+        registry = BenchmarkRegistry()
+
+        def spawn(entities: int, ticks: int) -> int:
+            return entities * ticks
+
+        registry.register("spawn", spawn, params={"entities": (10, 100), "ticks": (1,)})
+
+        assert registry.names == ("spawn[entities=10,ticks=1]", "spawn[entities=100,ticks=1]")
+        assert registry.get("spawn[entities=100,ticks=1]")() == 100
+        assert registry.spec("spawn[entities=10,ticks=1]").params == {"entities": 10, "ticks": 1}
+
+    def it_rejects_invalid_options() -> None:
+        registry = BenchmarkRegistry()
+
+        with pytest.raises(ValueError):
+            registry.register("alpha", lambda: 1, budget=0)
+        with pytest.raises(ValueError):
+            registry.register("alpha", lambda: 1, rounds=0)
+
+    def it_runs_only_benchmarks_with_matching_tags() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("ecs", lambda: "ecs", tags=("ecs",))
+        registry.register("script", lambda: "script", tags=("script",))
+        registry.register("both", lambda: "both", tags=("ecs", "script"))
+
+        assert registry.select(["script"]) == ("script", "both")
+        assert registry.run_all(tags=["ecs"]) == {"ecs": "ecs", "both": "both"}
+
+    def it_honours_warmup_and_rounds_in_the_default_runner() -> None:
+        registry = BenchmarkRegistry()
+        calls: list[int] = []
+        registry.register("alpha", lambda: calls.append(1) or len(calls), warmup=2, rounds=3)
+
+        assert registry.run_all() == {"alpha": 5}
+
+
+def describe_benchmark_registry_budgets() -> None:
+    def it_reports_the_median_round_against_the_budget() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("turn", lambda: None, budget=0.1, rounds=3)
+        registry.register("unbudgeted", lambda: None)
+
+        results = registry.check_budgets(timer=FakeTimer([0.0625, 0.5, 0.09375]))
+
+        assert [(result.name, result.seconds, result.exceeded) for result in results] == [("turn", 0.09375, False)]
+
+    def it_fails_with_a_report_when_a_budget_is_exceeded() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("fast", lambda: None, budget=0.1)
+        registry.register("slow", lambda: None, budget=0.1)
+
+        with pytest.raises(BudgetExceededError) as excinfo:
+            registry.check_budgets(timer=FakeTimer([0.02, 0.25]))
+
+        report = str(excinfo.value)
+        assert report.startswith("1 of 2 benchmarks exceeded their budget")
+        assert "OVER  slow: 250.0 ms / 100.0 ms budget (2.50x)" in report
+        assert "ok  fast: 20.0 ms" in report
+        assert [result.name for result in excinfo.value.results if result.exceeded] == ["slow"]
+
+    def it_skips_warmup_calls_when_timing() -> None:
+        registry = BenchmarkRegistry()
+        calls: list[int] = []
+        registry.register("alpha", lambda: calls.append(1), budget=1.0, warmup=3)
+
+        registry.check_budgets(timer=FakeTimer([0.5]))
+
+        assert len(calls) == 4
@@ -0,0 +1,140 @@
+"""Standalone benchmark runner specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+from hexa_core.engine.benchmarking.__main__ import main
+from hexa_core.engine.benchmarking.runner import BenchmarkStats, discover, percentile, reject_outliers, run_benchmarks
+
+BENCHMARK_MODULE = """
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+
+registry = BenchmarkRegistry()
+registry.register("sum_small", lambda: sum(range(100)), tags=("math",))
+registry.register("sum_large", lambda: sum(range(10_000)), tags=("math", "slow"))
+"""
+
+
+class SteppingTimer:
+    """Advances by the next scripted duration on every second call."""
+
+    def __init__(self: SteppingTimer, durations: list[float]) -> None:
+        self.now = 0.0
+        self._durations = iter(durations)
+        self._started = False
+
+    def __call__(self: SteppingTimer) -> float:
+        if self._started:
+            self.now += next(self._durations)
+        self._started = not self._started
+        return self.now
+
+
+def describe_statistics() -> None:
+    def it_rejects_samples_outside_tukey_fences() -> None:
+        kept, rejected = reject_outliers([1.0, 1.1, 0.9, 1.0, 1.05, 9.0])
+
+        assert rejected == 1
+        assert 9.0 not in kept
+
+    def it_keeps_tiny_samples_intact() -> None:
+        assert reject_outliers([1.0, 50.0, 2.0]) == ([1.0, 50.0, 2.0], 0)
+
+    def it_interpolates_percentiles() -> None:
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.95) == pytest.approx(4.8)
+        assert percentile([3.0], 0.95) == 3.0
+
+    def it_summarises_kept_samples_and_normalises_by_calibration() -> None:
+        stats = BenchmarkStats.from_samples("alpha", [0.25, 0.5, 0.5, 0.5, 0.75, 8.0], calibration=0.25, budget=1.0)
+
+        assert (stats.rounds, stats.outliers) == (6, 1)
+        assert (stats.min, stats.median, stats.mean) == (0.25, 0.5, 0.5)
+        assert stats.normalized == 2.0
+        assert stats.budget == 1.0
+
+
+def describe_run_benchmarks() -> None:
+    def it_times_rounds_after_warmup_with_registered_defaults() -> None:
+        registry = BenchmarkRegistry()
+        calls: list[int] = []
+        registry.register("alpha", lambda: calls.append(1), warmup=2, rounds=12)
+
+        report = run_benchmarks([registry], calibrated=False, timer=SteppingTimer([0.5] * 12))
+
+        assert len(calls) == 14
+        assert report.calibration_seconds is None
+        assert [(result.name, result.rounds, result.median) for result in report.results] == [("alpha", 12, 0.5)]
+
+    def it_filters_by_tag_and_name_and_overrides_rounds() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("ecs_small", lambda: None, tags=("ecs",))
+        registry.register("ecs_large", lambda: None, tags=("ecs",))
+        registry.register("script", lambda: None, tags=("script",))
+
+        report = run_benchmarks([registry], tags=["ecs"], match="large", warmup=0, rounds=3, calibrated=False)
+
+        assert [(result.name, result.rounds) for result in report.results] == [("ecs_large", 3)]
+
+    def it_writes_json_and_csv_reports() -> None:
+        registry = BenchmarkRegistry()
+        registry.register("alpha", lambda: None)
+        report = run_benchmarks([registry], rounds=4)
+
+        json_stream, csv_stream = io.StringIO(), io.StringIO()
+        report.write_json(json_stream)
+        report.write_csv(csv_stream)
+
+        document = json.loads(json_stream.getvalue())
+        assert document["calibration_seconds"] > 0
+        assert document["machine"]["cpu_count"]
+        assert document["results"][0]["name"] == "alpha"
+        rows = list(csv.DictReader(io.StringIO(csv_stream.getvalue())))
+        assert [(row["name"], row["rounds"]) for row in rows] == [("alpha", "4")]
+
+
+def describe_cli() -> None:
+    def it_discovers_registries_in_benchmark_files(tmp_path: Path) -> None:
+        (tmp_path / "test_sums_codspeed.py").write_text(BENCHMARK_MODULE, encoding="utf-8")
+        (tmp_path / "helpers.py").write_text("raise RuntimeError('not a benchmark module')\n", encoding="utf-8")
+
+        registries = discover([str(tmp_path)])
+
+        assert [registry.names for registry in registries] == [("sum_small", "sum_large")]
+
+    def it_runs_selected_scenarios_and_writes_json(tmp_path: Path) -> None:
+        module = tmp_path / "test_sums_codspeed.py"
+        module.write_text(BENCHMARK_MODULE, encoding="utf-8")
+        output = tmp_path / "results.json"
+
+        exit_code = main([str(module), "--tag", "slow", "--rounds", "3", "--format", "json", "--output", str(output)])
+
+        assert exit_code == 0
+        results = json.loads(output.read_text(encoding="utf-8"))["results"]
+        assert [(result["name"], result["rounds"]) for result in results] == [("sum_large", 3)]
+
+    def it_prints_a_table_by_default(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        module = tmp_path / "test_sums_codspeed.py"
+        module.write_text(BENCHMARK_MODULE, encoding="utf-8")
+
+        main([str(module), "-k", "small", "--rounds", "2", "--no-calibration"])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split()[:3] == ["name", "rounds", "min"]
+        assert lines[1].split()[:2] == ["sum_small", "2"]
+        assert len(lines) == 2
+
+    def it_fails_when_a_median_round_is_over_budget(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        module = tmp_path / "test_budgets_codspeed.py"
+        module.write_text(BENCHMARK_MODULE + 'registry.register("sum_budgeted", lambda: sum(range(10_000)), budget=1e-9)\n', encoding="utf-8")
+        arguments = [str(module), "--rounds", "2", "--warmup", "0", "--no-calibration"]
+
+        assert main([*arguments, "-k", "small"]) == 0
+        assert main(arguments) == 1
+        assert "OVER  sum_budgeted" in capsys.readouterr().err
@@ -0,0 +1,81 @@
+"""Benchmark scaling-curve fit specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.benchmarking.__main__ import main
+from hexa_core.engine.benchmarking.runner import BenchmarkStats
+from hexa_core.engine.benchmarking.scaling import fit_loglog, scaling_fits, write_scaling
+
+SLEEPING_SWEEP = """
+import time
+
+from hexa_core.engine.benchmarking import BenchmarkRegistry
+
+registry = BenchmarkRegistry()
+registry.register("sleep", lambda ms: time.sleep(ms / 1000), params={"ms": (2, 4, 8)})
+"""
+
+
+def _point(name: str, median: float, **params: object) -> BenchmarkStats:
+    return BenchmarkStats.from_samples(name, [median], params=params)
+
+
+def describe_fit_loglog() -> None:
+    def it_recovers_the_exponent_of_a_power_law() -> None:
+        slope, intercept, r_squared = fit_loglog([(size, 3 * size**2) for size in (10, 100, 1000)])
+
+        assert slope == pytest.approx(2.0)
+        assert intercept == pytest.approx(1.0986, abs=1e-4)
+        assert r_squared == pytest.approx(1.0)
+
+    def it_needs_two_distinct_sizes() -> None:
+        with pytest.raises(ValueError):
+            fit_loglog([(10, 1.0)])
+        with pytest.raises(ValueError):
+            fit_loglog([(10, 1.0), (10, 2.0)])
+
+
+def describe_scaling_fits() -> None:
+    def it_fits_sweeps_over_one_numeric_parameter() -> None:
+        results = [_point(f"tick[entities={size},ticks=1]", size * 0.001, entities=size, ticks=1) for size in (10, 100, 1000)]
+
+        (fit,) = scaling_fits(results)
+
+        assert (fit.benchmark, fit.param) == ("tick", "entities")
+        assert fit.slope == pytest.approx(1.0)
+        assert fit.points[0] == (10.0, 0.01)
+
+    def it_skips_plain_benchmarks_short_sweeps_and_ambiguous_sweeps() -> None:
+        results = [
+            _point("plain", 1.0),
+            _point("short[n=1]", 1.0, n=1),
+            _point("short[n=2]", 2.0, n=2),
+            *(_point(f"both[a={size},b={size}]", float(size), a=size, b=size) for size in (1, 2, 3)),
+            *(_point(f"named[mode={mode}]", 1.0, mode=mode) for mode in ("x", "y", "z")),
+        ]
+
+        assert scaling_fits(results) == []
+
+    def it_writes_a_scaling_table() -> None:
+        stream = io.StringIO()
+
+        write_scaling(scaling_fits([_point(f"tick[n={size}]", size**2, n=size) for size in (1, 2, 4)]), stream)
+
+        assert stream.getvalue().splitlines()[-1].split() == ["tick/n", "3", "2.00", "1.00"]
+
+
+def describe_max_slope_gate() -> None:
+    def it_fails_when_a_sweep_grows_faster_than_allowed(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        module = tmp_path / "test_sleep_codspeed.py"
+        module.write_text(SLEEPING_SWEEP, encoding="utf-8")
+        arguments = [str(module), "--warmup", "0", "--rounds", "1", "--no-calibration"]
+
+        assert main([*arguments, "--max-slope", "0.5"]) == 1
+        assert "sleep grows with ms at slope" in capsys.readouterr().err
+        assert main([*arguments, "--max-slope", "3"]) == 0
+        assert "sleep/ms" in capsys.readouterr().out
@@ -45,6 +45,7 @@ def describe_combat_system() -> None:
                     "damage": 35,
                     "remaining_health": 25,
                     "defeated": False,
+                    "attacker_ids": (attacker,),
                 },
             )
         ]
@@ -69,8 +70,6 @@ def describe_combat_system() -> None:
 
         world.process()
 
-        target_stats = cast(StatsComponent, world.component_for_entity(target, StatsComponent))
-        assert target_stats.health == 0
         assert list(captured) == [
             (
                 "engine.combat.resolved",
@@ -80,9 +79,59 @@ def describe_combat_system() -> None:
                     "damage": 50,
                     "remaining_health": 0,
                     "defeated": True,
+                    "attacker_ids": (attacker,),
                 },
             )
         ]
 
-        with pytest.raises(RuntimeError):
-            world.consume_turn(target)  # ensure no unintended side effects
+        with pytest.raises(KeyError):
+            world.component_for_entity(target, StatsComponent)  # defeated targets are deleted
+
+
+def _battle(attacks: list[tuple[int, int]], health: dict[int, int]) -> tuple[GameWorld, list[dict[str, object]]]:
+    """Create combatants ``0..n`` with ``health`` and ``(attacker, target)`` intents of 10 damage each."""
+    from hexa_core.engine.systems.combat_system import CombatSystem
+
+    world = GameWorld()
+    world.add_processor(CombatSystem(world.event_bus, world.command_buffer))
+    ids = {index: cast(int, world.create_entity(StatsComponent(health=hp, speed=10, processor=10))) for index, hp in health.items()}
+    for attacker, target in attacks:
+        world.add_component(ids[attacker], CombatIntentComponent(target=ids[target], damage=10))
+
+    captured: list[dict[str, object]] = []
+    world.subscribe_event("engine.combat.resolved", lambda _, payload: captured.append(dict(payload)))
+    world.process()
+    return world, captured
+
+
+def describe_batched_combat_resolution() -> None:
+    def it_aggregates_damage_into_one_event_per_target() -> None:
+        world, captured = _battle([(1, 0), (2, 0), (3, 1)], {0: 100, 1: 100, 2: 100, 3: 100})
+
+        assert [(event["target_id"], event["damage"], event["attacker_ids"]) for event in captured] == [(1, 20, (2, 3)), (2, 10, (4,))]
+        assert [event["attacker_id"] for event in captured] == [2, 4]
+        assert [cast(StatsComponent, world.component_for_entity(entity, StatsComponent)).health for entity in (1, 2)] == [80, 90]
+
+    def it_resolves_mutual_attacks_simultaneously() -> None:
+        world, captured = _battle([(0, 1), (1, 0)], {0: 10, 1: 10})
+
+        assert [event["defeated"] for event in captured] == [True, True]
+        assert list(world.get_component(StatsComponent)) == []
+
+    def it_is_independent_of_intent_order() -> None:
+        attacks = [(index, (index * 7) % 5) for index in range(5) if index != (index * 7) % 5]
+        health = dict.fromkeys(range(5), 25)
+
+        _, forward = _battle(attacks, health)
+        _, backward = _battle(list(reversed(attacks)), health)
+
+        assert forward == backward
+
+    def it_drops_intents_against_targets_that_are_already_down() -> None:
+        from hexa_core.engine.systems.combat_system import CombatSystem
+
+        world, captured = _battle([(1, 0)], {0: 0, 1: 50})
+
+        assert captured == []
+        assert world.get_processor(CombatSystem).dropped_intents == 1
+        assert world.try_component(2, CombatIntentComponent) is None
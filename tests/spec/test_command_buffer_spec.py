@@ -0,0 +1,60 @@
+"""Command buffer specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+from typing import cast
+
+from hexa_core.engine.components import MovementIntentComponent, PositionComponent, StatsComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.world import GameWorld
+
+
+def describe_command_buffer() -> None:
+    def it_defers_changes_until_applied() -> None:
+        world = GameWorld()
+        entity = cast(int, world.create_entity(PositionComponent(q=0, r=0)))
+
+        world.command_buffer.add_component(entity, StatsComponent(health=10, speed=1, processor=1))
+        world.command_buffer.remove_component(entity, PositionComponent)
+
+        assert len(world.command_buffer) == 2
+        assert world.try_component(entity, StatsComponent) is None
+
+        with world._activate_context():
+            world.command_buffer.apply()
+
+        assert len(world.command_buffer) == 0
+        assert world.try_component(entity, PositionComponent) is None
+        assert world.component_for_entity(entity, StatsComponent).health == 10
+
+    def it_applies_commands_in_enqueue_order_and_reports_created_entities() -> None:
+        world = GameWorld()
+        doomed = cast(int, world.create_entity(PositionComponent(q=1, r=1)))
+
+        world.command_buffer.delete_entity(doomed)
+        world.command_buffer.add_component(doomed, StatsComponent(health=1, speed=1, processor=1))
+        world.command_buffer.create_entity(PositionComponent(q=2, r=2))
+        world.command_buffer.create_entity(PositionComponent(q=3, r=3))
+
+        with world._activate_context():
+            created = world.command_buffer.apply()
+
+        positions = [cast(PositionComponent, world.component_for_entity(entity, PositionComponent)) for entity in created]
+        assert [(position.q, position.r) for position in positions] == [(2, 2), (3, 3)]
+        assert [entity for entity, _ in world.get_component(PositionComponent)] == created
+
+    def it_is_flushed_at_the_end_of_world_process() -> None:
+        world = GameWorld()
+
+        from hexa_core.engine.systems.movement_system import MovementSystem
+
+        world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+        entity = cast(int, world.create_entity(PositionComponent(q=0, r=0), MovementIntentComponent(target=HexCoord(0, 1))))
+
+        world.process()
+
+        position = cast(PositionComponent, world.component_for_entity(entity, PositionComponent))
+        assert (position.q, position.r) == (0, 1)
+        assert world.try_component(entity, MovementIntentComponent) is None
+        assert len(world.command_buffer) == 0
@@ -0,0 +1,110 @@
+"""Compiled binary map format specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.compiled_maps import SUFFIX, CompiledMapError, CompiledMapReader, MapCompiler, dumps, load_compiled_map
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize, MapLoader
+
+SCOUT = {"Position": {"q": 0, "r": 0}, "Script": {"path": "scout.hxc"}}
+MAP = {
+    "name": "Crossing",
+    "grid_size": {"width": 4, "height": 3},
+    "tiles": [
+        {"type": "wall", "q": 3, "r": 2},
+        {"type": "plain", "q": 0, "r": 0},
+        {"type": "water", "q": 1, "r": 0},
+        {"type": "plain", "q": 2, "r": 1},
+    ],
+    "entities": [{"name": "Scout", "components": SCOUT}],
+}
+
+
+def _map_file(tmp_path: Path, data: dict[str, object] = MAP) -> Path:
+    path = tmp_path / "crossing.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def _level(tiles: list[tuple[str, int, int]], width: int = 4, height: int = 3) -> LevelData:
+    return LevelData(name="Test", grid_size=LevelGridSize(width=width, height=height), tiles=tiles, entities=[])
+
+
+def describe_map_compiler() -> None:
+    def it_round_trips_maps_loaded_from_json(tmp_path: Path) -> None:
+        source = _map_file(tmp_path)
+
+        compiled = MapCompiler().compile(source)
+        expected = MapLoader().load(source)
+        loaded = load_compiled_map(compiled)
+
+        assert compiled == source.with_suffix(SUFFIX)
+        assert loaded == LevelData(expected.name, expected.grid_size, sorted(expected.tiles, key=lambda tile: (tile[2], tile[1])), expected.entities)
+
+    def it_writes_to_an_explicit_target(tmp_path: Path) -> None:
+        target = tmp_path / "out" / "level.bin"
+        target.parent.mkdir()
+
+        assert MapCompiler().compile(_map_file(tmp_path), target) == target
+        assert target.read_bytes()[:6] == b"HXMAPC"
+
+    def it_rejects_tiles_outside_the_grid() -> None:
+        with pytest.raises(CompiledMapError, match=r"Tile \(4, 0\) lies outside the 4x3 grid"):
+            dumps(_level([("plain", 4, 0)]))
+
+    def it_rejects_cells_defined_twice() -> None:
+        with pytest.raises(CompiledMapError, match="more than once"):
+            dumps(_level([("plain", 1, 1), ("wall", 1, 1)]))
+
+    def it_widens_cells_for_large_palettes() -> None:
+        tiles = [(f"kind-{index:03}", index % 20, index // 20) for index in range(300)]
+
+        with CompiledMapReader(dumps(_level(tiles, width=20, height=15))) as reader:
+            assert reader.layer.format == "H"
+            assert reader.tile_at(19, 14) == "kind-299"
+            assert reader.to_level().tiles == tiles
+
+
+def describe_compiled_map_reader() -> None:
+    def it_exposes_the_tile_layer_without_copying(tmp_path: Path) -> None:
+        compiled = MapCompiler().compile(_map_file(tmp_path))
+
+        with CompiledMapReader.open(compiled) as reader:
+            layer, row = reader.layer, reader.row(0)
+
+            assert reader.name == "Crossing"
+            assert reader.palette == ("plain", "wall", "water")
+            assert (reader.grid_size.width, reader.grid_size.height, reader.tile_count) == (4, 3, 4)
+            assert list(row) == [1, 3, 0, 0]
+            assert row.obj is layer.obj
+            assert (reader.tile_at(3, 2), reader.tile_at(0, 1), reader.tile_at(-1, 0)) == ("wall", None, None)
+            assert reader.entities() == [LevelEntity("Scout", SCOUT)]
+            # Views into the mapping must be released before it closes.
+            del layer, row
+
+    def it_rejects_rows_outside_the_grid() -> None:
+        with CompiledMapReader(dumps(_level([]))) as reader, pytest.raises(IndexError):
+            reader.row(3)
+
+    @pytest.mark.parametrize(
+        ("mutate", "message"),
+        [
+            (lambda data: data[:4], "truncated"),
+            (lambda data: b"NOTMAP" + data[6:], "Not a Hexa-Core compiled map"),
+            (lambda data: data[:6] + b"\x09\x00" + data[8:], "Unsupported compiled map version 9"),
+            (lambda data: data[:12] + b"[" + data[13:], "header is corrupt"),
+            (lambda data: data[:13] + b"}" + data[14:], "header is corrupt"),
+            (lambda data: data[:-1], "truncated"),
+        ],
+    )
+    def it_rejects_damaged_files(tmp_path: Path, mutate: Callable[[bytes], bytes], message: str) -> None:
+        path = tmp_path / f"damaged{SUFFIX}"
+        path.write_bytes(mutate(dumps(_level([("plain", 0, 0)]))))
+
+        with pytest.raises(CompiledMapError, match=message):
+            CompiledMapReader.open(path)
@@ -91,3 +91,130 @@ def describe_game_world() -> None:
 
         with pytest.raises(AttributeError):
             _ = world.non_existent_method  # type: ignore[attr-defined]
+
+
+def describe_event_bus_batching() -> None:
+    def it_defers_delivery_until_the_batch_exits() -> None:
+        bus = EventBus()
+        received: list[int] = []
+        bus.subscribe("tick", lambda _event, payload: received.append(payload["value"]))
+
+        with bus.batch():
+            bus.publish("tick", {"value": 1})
+            bus.publish("tick", {"value": 2})
+            assert received == []
+            assert bus.batching
+
+        assert received == [1, 2]
+        assert not bus.batching
+
+    def it_delivers_one_list_per_channel_to_batch_subscribers() -> None:
+        bus = EventBus()
+        batches: list[tuple[str, list[int]]] = []
+        bus.subscribe_batch("moved", lambda event, payloads: batches.append((event, [payload["id"] for payload in payloads])))
+
+        bus.publish("moved", {"id": 9})
+        with bus.batch():
+            for entity in (1, 2, 3):
+                bus.publish("moved", {"id": entity})
+
+        assert batches == [("moved", [9]), ("moved", [1, 2, 3])]
+
+    def it_coalesces_to_the_last_payload_per_key() -> None:
+        bus = EventBus()
+        latest: list[list[tuple[int, int]]] = []
+        bus.subscribe_coalesced("moved", "entity_id", lambda _event, payloads: latest.append([(p["entity_id"], p["to"]) for p in payloads]))
+
+        with bus.batch():
+            bus.publish("moved", {"entity_id": 1, "to": 10})
+            bus.publish("moved", {"entity_id": 2, "to": 20})
+            bus.publish("moved", {"entity_id": 1, "to": 11})
+
+        assert latest == [[(1, 11), (2, 20)]]
+
+    def it_flushes_events_published_by_subscribers_during_a_flush() -> None:
+        bus = EventBus()
+        received: list[str] = []
+        bus.subscribe("first", lambda _event, _payload: bus.publish("second", {}))
+        bus.subscribe("second", lambda event, _payload: received.append(event))
+
+        with bus.batch(), bus.batch():
+            bus.publish("first", {})
+
+        assert received == ["second"]
+
+    def it_delivers_events_at_tick_end_in_a_batching_world() -> None:
+        from hexa_core.engine.components import MovementIntentComponent, PositionComponent
+        from hexa_core.engine.datatypes import HexCoord
+        from hexa_core.engine.systems.movement_system import MovementSystem
+
+        world = GameWorld(batch_events=True)
+        world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+        entity = cast(int, world.create_entity(PositionComponent(q=0, r=0), MovementIntentComponent(target=HexCoord(1, 0))))
+        batches: list[int] = []
+        world.event_bus.subscribe_batch("engine.movement.completed", lambda _event, payloads: batches.append(len(payloads)))
+        world.event_bus.subscribe("engine.movement.completed", lambda _event, payload: world.command_buffer.delete_entity(payload["entity_id"]))
+
+        world.process()
+
+        assert batches == [1]
+        with world._activate_context():
+            assert not esper.entity_exists(entity)
+
+
+def describe_event_bus_wildcards() -> None:
+    @pytest.mark.parametrize(
+        ("pattern", "channel", "expected"),
+        [
+            ("engine.*", "engine.tick", True),
+            ("engine.*", "engine.movement.completed", False),
+            ("engine.#", "engine.movement.completed", True),
+            ("engine.#", "engine", True),
+            ("*.movement.*", "engine.movement.completed", True),
+            ("#.completed", "engine.movement.completed", True),
+            ("engine.#", "renderer.gameplay.activated", False),
+        ],
+    )
+    def it_matches_dotted_topics(pattern: str, channel: str, expected: bool) -> None:
+        from hexa_core.engine.event_bus import topic_matches
+
+        assert topic_matches(pattern, channel) is expected
+
+    def it_delivers_to_exact_then_pattern_subscribers() -> None:
+        bus = EventBus()
+        received: list[tuple[str, str]] = []
+        bus.subscribe("engine.#", lambda event, _payload: received.append(("all", event)))
+        bus.subscribe("engine.movement.completed", lambda event, _payload: received.append(("exact", event)))
+        bus.subscribe("renderer.*", lambda event, _payload: received.append(("renderer", event)))
+
+        bus.publish("engine.movement.completed", {})
+        bus.publish("engine.turn.ready", {})
+
+        assert received == [
+            ("exact", "engine.movement.completed"),
+            ("all", "engine.movement.completed"),
+            ("all", "engine.turn.ready"),
+        ]
+
+    def it_refreshes_cached_dispatch_when_subscriptions_change() -> None:
+        bus = EventBus()
+        received: list[str] = []
+        bus.publish("engine.tick", {})
+
+        bus.subscribe("engine.*", lambda event, _payload: received.append(event))
+        bus.publish("engine.tick", {})
+
+        assert received == ["engine.tick"]
+        assert len(bus.dispatch_for("engine.tick")) == 1
+
+    def it_supports_patterns_for_batch_subscribers() -> None:
+        bus = EventBus()
+        batches: list[tuple[str, int]] = []
+        bus.subscribe_batch("engine.#", lambda event, payloads: batches.append((event, len(payloads))))
+
+        with bus.batch():
+            bus.publish("engine.movement.completed", {})
+            bus.publish("engine.movement.completed", {})
+            bus.publish("engine.turn.ready", {})
+
+        assert batches == [("engine.movement.completed", 2), ("engine.turn.ready", 1)]
@@ -0,0 +1,102 @@
+"""Cross-thread event queue specs."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import threading
+from typing import Any, cast
+
+import pytest
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.event_queue import BLOCK, DROP_OLDEST, EngineThread, EventQueue, EventQueueFull
+from hexa_core.engine.events import MOVEMENT_COMPLETED, MovementCompleted
+
+
+def describe_event_queue() -> None:
+    def it_delivers_events_in_order_onto_a_consumer_bus() -> None:
+        queue = EventQueue(capacity=8)
+        consumer = EventBus()
+        received: list[int] = []
+        consumer.subscribe("tick", lambda _event, payload: received.append(payload["value"]))
+
+        for value in range(3):
+            queue.put("tick", {"value": value})
+
+        assert queue.drain_into(consumer) == 3
+        assert received == [0, 1, 2]
+        assert len(queue) == 0
+        assert queue.metrics()["latency_ns"]["count"] == 3
+
+    def it_drops_the_oldest_events_when_full() -> None:
+        queue = EventQueue(capacity=2, policy=DROP_OLDEST)
+
+        for value in range(5):
+            queue.put("tick", {"value": value})
+
+        assert [payload["value"] for _, payload in queue.drain()] == [3, 4]
+        assert queue.dropped == 3
+        assert queue.max_depth == 2
+
+    def it_blocks_the_producer_until_the_consumer_drains() -> None:
+        queue = EventQueue(capacity=1, policy=BLOCK)
+        queue.put("tick", {"value": 0})
+        producer = threading.Thread(target=queue.put, args=("tick", {"value": 1}))
+
+        producer.start()
+        producer.join(0.05)
+        assert producer.is_alive()
+
+        first = queue.drain()
+        producer.join(1.0)
+
+        assert not producer.is_alive()
+        assert first == [("tick", {"value": 0})]
+        assert queue.drain() == [("tick", {"value": 1})]
+        assert queue.blocked == 1
+
+    def it_raises_when_a_blocking_put_times_out() -> None:
+        queue = EventQueue(capacity=1, policy=BLOCK, timeout=0.01)
+        queue.put("tick", {})
+
+        with pytest.raises(EventQueueFull):
+            queue.put("tick", {})
+
+    def it_copies_pooled_records_forwarded_from_the_engine_bus() -> None:
+        engine_bus = EventBus()
+        queue = EventQueue()
+        queue.connect(engine_bus, [MOVEMENT_COMPLETED])
+        record = MovementCompleted(1, HexCoord(0, 0), HexCoord(1, 0))
+
+        engine_bus.publish(MOVEMENT_COMPLETED, record)
+        record.entity_id = 99
+
+        [(_, payload)] = queue.drain()
+        assert payload["entity_id"] == 1
+
+    def it_rejects_invalid_configuration() -> None:
+        with pytest.raises(ValueError, match="capacity"):
+            EventQueue(capacity=0)
+        with pytest.raises(ValueError, match="policy"):
+            EventQueue(policy=cast(Any, "drop_newest"))
+
+
+def describe_engine_thread() -> None:
+    def it_runs_the_world_on_a_background_thread() -> None:
+        from hexa_core.engine.components import MovementIntentComponent, PositionComponent
+        from hexa_core.engine.systems.movement_system import MovementSystem
+        from hexa_core.engine.world import GameWorld
+
+        world = GameWorld()
+        world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+        for index in range(10):
+            world.create_entity(PositionComponent(q=0, r=index), MovementIntentComponent(target=HexCoord(1, index)))
+        queue = EventQueue(capacity=64)
+        queue.connect(world.event_bus, [MOVEMENT_COMPLETED])
+
+        engine = EngineThread(world, max_ticks=5)
+        engine.start()
+        engine.join(5.0)
+
+        assert engine.ticks == 5
+        assert sorted(payload["entity_id"] for _, payload in queue.drain()) == list(range(1, 11))
@@ -0,0 +1,88 @@
+"""Typed engine event record specs."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+from typing import Any, cast
+
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.events import (
+    MOVEMENT_COMPLETED,
+    CombatResolved,
+    MovementCompleted,
+    RecordPool,
+    TurnReady,
+    dict_payloads,
+)
+
+
+def describe_event_records() -> None:
+    def it_behaves_like_the_equivalent_dict_payload() -> None:
+        record = MovementCompleted(7, HexCoord(0, 0), HexCoord(1, 0))
+
+        assert record["from"] == HexCoord(0, 0)
+        assert list(record) == ["entity_id", "from", "to"]
+        assert record == {"entity_id": 7, "from": HexCoord(0, 0), "to": HexCoord(1, 0)}
+        assert dict(record) == record.to_dict()
+        assert record.get("missing") is None
+
+    def it_has_no_instance_dict() -> None:
+        record = CombatResolved(1, 2, 10, 0, True)
+
+        assert not hasattr(record, "__dict__")
+        assert repr(record) == "CombatResolved(attacker_id=1, target_id=2, damage=10, remaining_health=0, defeated=True, attacker_ids=(1,))"
+
+    def it_copies_into_a_detached_record() -> None:
+        record = TurnReady(3, 1000)
+
+        duplicate = record.copy()
+        record.entity_id = 4
+
+        assert duplicate == {"entity_id": 3, "turn_counter": 1000}
+
+
+def describe_record_pool() -> None:
+    def it_reuses_records_after_rewind() -> None:
+        pool: RecordPool[TurnReady] = RecordPool(TurnReady)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.rewind()
+        reused = pool.acquire()
+
+        assert reused is first
+        assert second is not first
+        assert isinstance(reused, TurnReady)
+        assert len(pool) == 2
+
+    def it_keeps_records_queued_on_a_batching_bus_intact() -> None:
+        from hexa_core.engine.components import MovementIntentComponent, PositionComponent
+        from hexa_core.engine.systems.movement_system import MovementSystem
+        from hexa_core.engine.world import GameWorld
+
+        world = GameWorld()
+        world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+        entity = cast(int, world.create_entity(PositionComponent(q=0, r=0)))
+        received: list[Any] = []
+        world.event_bus.subscribe(MOVEMENT_COMPLETED, lambda _event, payload: received.append(payload["to"]))
+
+        with world.event_bus.batch():
+            for step in (1, 2):
+                world.add_component(entity, MovementIntentComponent(target=HexCoord(step, 0)))
+                world.process()
+
+        assert received == [HexCoord(1, 0), HexCoord(2, 0)]
+
+
+def describe_dict_payloads() -> None:
+    def it_hands_plain_dicts_to_legacy_subscribers() -> None:
+        bus = EventBus()
+        received: list[dict[str, Any]] = []
+        bus.subscribe("engine.turn.ready", dict_payloads(lambda _event, payload: received.append(payload)))
+
+        bus.publish("engine.turn.ready", TurnReady(5, 1000))
+
+        assert isinstance(received[0], dict)
+        assert not isinstance(received[0], TurnReady)
+        assert received == [{"entity_id": 5, "turn_counter": 1000}]
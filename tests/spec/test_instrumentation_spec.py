@@ -0,0 +1,96 @@
+"""Process instrumentation specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import json
+
+from hexa_core.engine.components import MovementIntentComponent, PositionComponent, StatsComponent, TurnComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.instrumentation import ProcessInstrumentation, RollingHistogram
+from hexa_core.engine.world import GameWorld
+
+
+def _instrumented_world(instrumentation: ProcessInstrumentation | None = None) -> tuple[GameWorld, ProcessInstrumentation]:
+    from hexa_core.engine.systems.movement_system import MovementSystem
+    from hexa_core.engine.systems.turn_system import TurnManager
+
+    world = GameWorld()
+    world.add_processor(TurnManager(world.event_bus), priority=1)
+    world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+    for index in range(3):
+        world.create_entity(
+            PositionComponent(q=index, r=0),
+            StatsComponent(health=10, speed=1000, processor=10),
+            TurnComponent(),
+            MovementIntentComponent(target=HexCoord(index, 1)),
+        )
+    return world, world.enable_instrumentation(instrumentation)
+
+
+def describe_rolling_histogram() -> None:
+    def it_keeps_only_the_most_recent_window() -> None:
+        histogram = RollingHistogram(window=3)
+
+        for value in (100, 1, 2, 3):
+            histogram.add(value)
+
+        summary = histogram.summary()
+        assert len(histogram) == 3
+        assert (summary["min"], summary["max"], summary["p50"]) == (1, 3, 2)
+        assert histogram.buckets() == {"2": 1, "4": 2}
+
+
+def describe_process_instrumentation() -> None:
+    def it_records_wall_time_and_calls_per_processor() -> None:
+        world, instrumentation = _instrumented_world()
+
+        world.process()
+        world.process()
+
+        assert instrumentation.ticks == 2
+        assert instrumentation.calls["TurnManager"] == 2
+        assert instrumentation.calls["MovementSystem"] == 2
+        assert instrumentation.calls["CommandBuffer.apply"] == 2
+        last_tick = instrumentation.last_tick
+        assert last_tick is not None
+        assert last_tick.slowest() in last_tick.wall_ns
+
+    def it_counts_events_per_channel_per_tick() -> None:
+        world, instrumentation = _instrumented_world()
+
+        world.process()
+
+        last_tick = instrumentation.last_tick
+        assert last_tick is not None
+        assert last_tick.events == {"engine.turn.ready": 3, "engine.movement.completed": 3}
+        report = json.loads(instrumentation.to_json())
+        assert report["events"]["engine.movement.completed"]["total"] == 3
+
+    def it_records_allocation_deltas_when_requested() -> None:
+        world, instrumentation = _instrumented_world(ProcessInstrumentation(trace_allocations=True))
+
+        world.process()
+        world.disable_instrumentation()
+
+        report = instrumentation.to_dict()
+        assert "allocated_bytes" in report["processors"]["MovementSystem"]
+
+    def it_flags_ticks_exceeding_the_budget() -> None:
+        world, instrumentation = _instrumented_world(ProcessInstrumentation(budget_ms=0.0))
+
+        world.process()
+
+        assert [profile.tick for profile in instrumentation.over_budget] == [0]
+        assert instrumentation.to_dict()["ticks_over_budget"][0]["slowest"] is not None
+
+    def it_restores_the_event_bus_when_disabled() -> None:
+        bus = EventBus()
+        world = GameWorld(event_bus=bus)
+        world.enable_instrumentation()
+
+        world.disable_instrumentation()
+
+        assert "publish" not in vars(bus)
+        assert world.instrumentation is None
@@ -0,0 +1,106 @@
+"""Event journal specs."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.event_bus import EventBus
+from hexa_core.engine.events import MOVEMENT_COMPLETED, MovementCompleted
+from hexa_core.engine.journal import EventJournal, JournalError, JournalReader
+
+
+def _record_sample(path: Path) -> None:
+    bus = EventBus()
+    with EventJournal.open(path, flush_bytes=32) as journal:
+        journal.attach(bus)
+        bus.publish(MOVEMENT_COMPLETED, MovementCompleted(1, HexCoord(0, 0), HexCoord(1, 0)))
+        journal.advance_tick()
+        bus.publish("engine.combat.resolved", {"attacker_id": 1, "target_id": 2, "damage": 10, "remaining_health": 0, "defeated": True})
+        bus.publish("renderer.gameplay.activated", {"name": "Dawn", "scores": [1.5, None], "meta": {"big": 2**70, "pair": (1, "x")}})
+
+
+def describe_event_journal() -> None:
+    def it_round_trips_events_through_a_memory_mapped_reader(tmp_path: Path) -> None:
+        path = tmp_path / "match.hxj"
+        _record_sample(path)
+
+        with JournalReader.open(path) as reader:
+            entries = list(reader)
+
+        assert [(entry.tick, entry.event_type) for entry in entries] == [
+            (0, MOVEMENT_COMPLETED),
+            (1, "engine.combat.resolved"),
+            (1, "renderer.gameplay.activated"),
+        ]
+        assert entries[0].payload == {"entity_id": 1, "from": HexCoord(0, 0), "to": HexCoord(1, 0)}
+        assert entries[1].payload["defeated"] is True
+        assert entries[2].payload == {"name": "Dawn", "scores": [1.5, None], "meta": {"big": 2**70, "pair": (1, "x")}}
+
+    def it_declares_each_payload_shape_once() -> None:
+        stream = io.BytesIO()
+        bus = EventBus()
+        journal = EventJournal(stream)
+        journal.attach(bus, "engine.#")
+        for entity in range(100):
+            bus.publish("engine.turn.ready", {"entity_id": entity, "turn_counter": 1000})
+        bus.publish("renderer.gameplay.exited", {})
+        journal.flush()
+
+        entries = list(JournalReader(stream.getvalue()))
+
+        assert journal.events == 100
+        assert [entry.payload["entity_id"] for entry in entries] == list(range(100))
+        assert len(stream.getvalue()) < 100 * 40
+
+    def it_stamps_events_from_a_tick_source() -> None:
+        stream = io.BytesIO()
+        clock = iter([7, 9])
+        journal = EventJournal(stream, tick_source=lambda: next(clock))
+
+        journal.record("engine.tick", {})
+        journal.record("engine.tick", {})
+        journal.flush()
+
+        assert [entry.tick for entry in JournalReader(stream.getvalue())] == [7, 9]
+
+    def it_rejects_values_it_cannot_encode() -> None:
+        journal = EventJournal(io.BytesIO())
+
+        with pytest.raises(JournalError, match="object"):
+            journal.record("engine.tick", {"value": object()})
+
+
+def describe_journal_reader() -> None:
+    def it_replays_a_tick_range_through_an_event_bus_at_a_fixed_rate(tmp_path: Path) -> None:
+        path = tmp_path / "match.hxj"
+        _record_sample(path)
+        bus = EventBus()
+        received: list[str] = []
+        bus.subscribe("#", lambda event, _payload: received.append(event))
+        pauses: list[float] = []
+
+        with JournalReader.open(path) as reader:
+            replayed = reader.replay(bus, tick_rate=20.0, sleep=pauses.append)
+            partial = reader.replay(EventBus(), start_tick=1, end_tick=1)
+
+        assert replayed == 3
+        assert received == [MOVEMENT_COMPLETED, "engine.combat.resolved", "renderer.gameplay.activated"]
+        assert pauses == [0.05]
+        assert partial == 2
+
+    def it_stops_at_a_truncated_trailing_record(tmp_path: Path) -> None:
+        path = tmp_path / "match.hxj"
+        _record_sample(path)
+        data = path.read_bytes()
+
+        entries = list(JournalReader(data[:-3]))
+
+        assert len(entries) == 2
+
+    def it_rejects_foreign_files() -> None:
+        with pytest.raises(JournalError, match="journal"):
+            JournalReader(b"HXSAVE\x01\x00")
@@ -6,7 +6,7 @@ from __future__ import annotations
 from collections import deque
 from typing import cast
 
-from hexa_core.engine.components import MovementIntentComponent, PositionComponent
+from hexa_core.engine.components import MovementIntentComponent, PathComponent, PositionComponent
 from hexa_core.engine.datatypes import HexCoord
 from hexa_core.engine.event_bus import EventBus
 from hexa_core.engine.world import GameWorld
@@ -67,3 +67,148 @@ def describe_movement_system() -> None:
 
         position = cast(PositionComponent, world.component_for_entity(entity, PositionComponent))
         assert (position.q, position.r) == (3, 0)
+
+
+def _crowd(moves: dict[tuple[int, int], tuple[int, int] | None]) -> tuple[GameWorld, list[int], list[dict[str, object]]]:
+    """Place one entity per key, moving it to the value (``None`` stays still); return final state and blocked events."""
+    from hexa_core.engine.systems.movement_system import MovementSystem
+
+    world = GameWorld()
+    world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+    entities = []
+    for (q, r), target in moves.items():
+        entity = cast(int, world.create_entity(PositionComponent(q=q, r=r)))
+        if target is not None:
+            world.add_component(entity, MovementIntentComponent(target=HexCoord(*target)))
+        entities.append(entity)
+
+    blocked: list[dict[str, object]] = []
+    world.subscribe_event("engine.movement.blocked", lambda _, payload: blocked.append(dict(payload)))
+    world.process()
+    return world, entities, blocked
+
+
+def _positions(world: GameWorld, entities: list[int]) -> list[tuple[int, int]]:
+    positions = [cast(PositionComponent, world.component_for_entity(entity, PositionComponent)) for entity in entities]
+    return [(position.q, position.r) for position in positions]
+
+
+def describe_simultaneous_movement() -> None:
+    def it_gives_a_contested_hex_to_the_lowest_entity_id() -> None:
+        world, entities, blocked = _crowd({(0, 0): (1, 0), (2, 0): (1, 0)})
+
+        assert _positions(world, entities) == [(1, 0), (2, 0)]
+        assert blocked == [{"entity_id": entities[1], "from": HexCoord(2, 0), "to": HexCoord(1, 0), "reason": "contested"}]
+        assert world.try_component(entities[1], MovementIntentComponent) is None
+
+    def it_blocks_moves_into_hexes_that_stay_occupied() -> None:
+        world, entities, blocked = _crowd({(0, 0): (1, 0), (1, 0): None, (5, 5): (5, 5)})
+
+        assert _positions(world, entities) == [(0, 0), (1, 0), (5, 5)]
+        assert [event["reason"] for event in blocked] == ["occupied"]
+
+    def it_lets_a_chain_of_movers_follow_each_other() -> None:
+        world, entities, blocked = _crowd({(0, 0): (1, 0), (1, 0): (2, 0), (2, 0): (3, 0)})
+
+        assert _positions(world, entities) == [(1, 0), (2, 0), (3, 0)]
+        assert blocked == []
+
+    def it_blocks_a_whole_chain_behind_a_stationary_entity() -> None:
+        world, entities, blocked = _crowd({(0, 0): (1, 0), (1, 0): (2, 0), (2, 0): None})
+
+        assert _positions(world, entities) == [(0, 0), (1, 0), (2, 0)]
+        assert [event["reason"] for event in blocked] == ["occupied", "occupied"]
+
+    def it_blocks_swaps_but_rotates_longer_cycles() -> None:
+        world, entities, blocked = _crowd({(0, 0): (1, 0), (1, 0): (0, 0)})
+        assert _positions(world, entities) == [(0, 0), (1, 0)]
+        assert [event["reason"] for event in blocked] == ["swap", "swap"]
+
+        world, entities, blocked = _crowd({(0, 0): (1, 0), (1, 0): (0, 1), (0, 1): (0, 0)})
+        assert _positions(world, entities) == [(1, 0), (0, 1), (0, 0)]
+        assert blocked == []
+
+    def it_resolves_independently_of_intent_order() -> None:
+        from hexa_core.engine.systems.movement_system import resolve_moves
+
+        moves = [(entity, ((entity * 3) % 7, 0)) for entity in range(1, 7)]
+        occupants = {(entity, 0): entity for entity in range(1, 7)}
+
+        assert resolve_moves(moves, occupants) == resolve_moves(list(reversed(moves)), occupants)
+
+
+def _walker(world: GameWorld, start: tuple[int, int], hops: list[tuple[int, int]], speed: int = 1) -> int:
+    return cast(int, world.create_entity(PositionComponent(q=start[0], r=start[1]), PathComponent.through([HexCoord(*hop) for hop in hops], speed=speed)))
+
+
+def _path_world() -> tuple[GameWorld, list[tuple[str, dict[str, object]]]]:
+    from hexa_core.engine.systems.movement_system import MovementSystem
+
+    world = GameWorld()
+    world.add_processor(MovementSystem(world.event_bus, world.command_buffer))
+    captured: list[tuple[str, dict[str, object]]] = []
+    world.subscribe_event("engine.movement.#", lambda event, payload: captured.append((event, dict(payload))))
+    return world, captured
+
+
+def describe_path_following() -> None:
+    def it_packs_hexes_into_an_int_array() -> None:
+        path = PathComponent.through([HexCoord(1, 0), HexCoord(2, -1)])
+
+        assert path.steps.typecode == "i"
+        assert list(path.steps) == [1, 0, 2, -1]
+        assert (path.remaining, path.next_hex()) == (2, (1, 0))
+
+    def it_walks_one_hop_per_tick_and_drops_the_finished_path() -> None:
+        world, captured = _path_world()
+        walker = _walker(world, (0, 0), [(1, 0), (2, 0)])
+
+        world.process()
+        assert _positions(world, [walker]) == [(1, 0)]
+        world.process()
+        world.process()
+
+        assert _positions(world, [walker]) == [(2, 0)]
+        assert [(payload["from"], payload["to"]) for _, payload in captured] == [(HexCoord(0, 0), HexCoord(1, 0)), (HexCoord(1, 0), HexCoord(2, 0))]
+        assert world.try_component(walker, PathComponent) is None
+
+    def it_takes_speed_hops_per_tick() -> None:
+        world, captured = _path_world()
+        walker = _walker(world, (0, 0), [(1, 0), (2, 0), (3, 0)], speed=2)
+
+        world.process()
+
+        assert _positions(world, [walker]) == [(2, 0)]
+        assert len(captured) == 2
+        assert cast(PathComponent, world.component_for_entity(walker, PathComponent)).remaining == 1
+
+    def it_lets_walkers_in_single_file_follow_each_other() -> None:
+        world, captured = _path_world()
+        leader = _walker(world, (1, 0), [(2, 0), (3, 0)], speed=2)
+        follower = _walker(world, (0, 0), [(1, 0), (2, 0)], speed=2)
+
+        world.process()
+
+        assert _positions(world, [leader, follower]) == [(3, 0), (2, 0)]
+        assert all(event == "engine.movement.completed" for event, _ in captured)
+
+    def it_stops_and_drops_the_path_when_blocked() -> None:
+        world, captured = _path_world()
+        walker = _walker(world, (0, 0), [(1, 0), (2, 0)], speed=2)
+        world.create_entity(PositionComponent(q=2, r=0))
+
+        world.process()
+
+        assert _positions(world, [walker]) == [(1, 0)]
+        assert captured[-1] == ("engine.movement.blocked", {"entity_id": walker, "from": HexCoord(1, 0), "to": HexCoord(2, 0), "reason": "occupied"})
+        assert world.try_component(walker, PathComponent) is None
+
+    def it_is_replaced_by_a_movement_intent() -> None:
+        world, _ = _path_world()
+        walker = _walker(world, (0, 0), [(1, 0), (2, 0)])
+        world.add_component(walker, MovementIntentComponent(target=HexCoord(0, 1)))
+
+        world.process()
+
+        assert _positions(world, [walker]) == [(0, 1)]
+        assert world.try_component(walker, PathComponent) is None
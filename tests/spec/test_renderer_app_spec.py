@@ -51,12 +51,16 @@ class StubArcade(SimpleNamespace):
         self.View = object
         self.key = SimpleNamespace(ENTER=65293, ESCAPE=65307)
         self.run_calls: list[None] = []
+        self.scheduled: list[tuple[object, float]] = []
         self.background_color: tuple[int, int, int, int] | None = None
         self.color = SimpleNamespace(BLACK=(0, 0, 0, 255))
 
     def run(self: StubArcade) -> None:
         self.run_calls.append(None)
 
+    def schedule(self: StubArcade, callback: object, interval: float) -> None:
+        self.scheduled.append((callback, interval))
+
     def set_background_color(self: StubArcade, color: tuple[int, int, int, int]) -> None:
         self.background_color = color
 
@@ -159,3 +163,18 @@ def describe_renderer_app() -> None:
 
         bus = renderer_app.event_bus
         assert bus.published[-1][0] == events.GAMEPLAY_EXITED
+
+    def it_drains_queued_engine_events_once_per_frame(stub_arcade: StubArcade) -> None:
+        from hexa_core.engine.event_queue import EventQueue
+
+        queue = EventQueue(capacity=8)
+        app = create_renderer_app(event_bus=RecordingEventBus(), event_queue=queue)
+        app.launch()
+        queue.put(events.GAMEPLAY_EXITED, {})
+
+        [(callback, interval)] = stub_arcade.scheduled
+        delivered = callback(interval)
+
+        assert delivered == 1
+        assert app.renderer.should_exit is True
+        assert app.pump_events() == 0
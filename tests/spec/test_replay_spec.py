@@ -0,0 +1,132 @@
+"""Deterministic replay specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.replay import ReplayDesyncError, Replayer, ReplayRecord, record_match, script_hash, world_checksum
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch
+
+BRAWLER_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+        "END_TURN",
+    ]
+)
+
+
+def _duel_level() -> LevelData:
+    def bot(name: str, q: int, health: int, speed: int) -> LevelEntity:
+        return LevelEntity(
+            name=name,
+            components={
+                "Position": {"q": q, "r": 0},
+                "Stats": {"health": health, "speed": speed, "processor": 10},
+                "Script": {"path": "brawler.hxc"},
+            },
+        )
+
+    return LevelData(
+        name="Duel",
+        grid_size=LevelGridSize(width=15, height=15),
+        tiles=[("floor", 0, 0)],
+        entities=[bot("Tank", 0, 100, 250), bot("Scout", 6, 40, 250)],
+    )
+
+
+def _record(tmp_path: Path, **kwargs: int) -> ReplayRecord:
+    (tmp_path / "brawler.hxc").write_text(BRAWLER_SCRIPT, encoding="utf-8")
+    return record_match(_duel_level(), script_root=tmp_path, checksum_interval=5, **kwargs)
+
+
+def describe_replay_recording() -> None:
+    def it_captures_actions_checksums_and_script_hashes(tmp_path: Path) -> None:
+        record = _record(tmp_path)
+
+        assert record.script_hashes == {"brawler.hxc": script_hash(BRAWLER_SCRIPT)}
+        assert record.actions
+        assert record.final_tick in record.checksums
+        assert len(record.tick_hashes) == record.final_tick
+        assert all(tick % 5 == 0 for tick in record.checksums if tick != record.final_tick)
+
+    def it_round_trips_through_json(tmp_path: Path) -> None:
+        record = _record(tmp_path)
+        record.save(tmp_path / "duel.replay.json")
+
+        loaded = ReplayRecord.load(tmp_path / "duel.replay.json")
+
+        assert loaded.level == record.level
+        assert loaded.actions == record.actions
+        assert loaded.checksums == record.checksums
+        assert loaded.tick_hashes == record.tick_hashes
+        assert loaded.keyframes == {}
+
+
+def describe_replayer() -> None:
+    def it_reproduces_the_recorded_match_without_scripts(tmp_path: Path) -> None:
+        record = _record(tmp_path)
+        programs = {"brawler.hxc": ScriptRunner().compile(BRAWLER_SCRIPT)}
+        original = HeadlessMatch(_duel_level(), programs=programs).run()
+
+        match = Replayer(record).verify()
+
+        assert match.tick == original.ticks == record.final_tick
+        assert [match.names[entity] for entity in match.combatants()] == list(original.survivors)
+
+    def it_detects_divergence_on_the_next_tick_from_state_hashes(tmp_path: Path) -> None:
+        record = _record(tmp_path)
+        tick, entity, _ = record.actions[0]
+        record.actions[0] = (tick, entity, ())
+
+        with pytest.raises(ReplayDesyncError) as error:
+            Replayer(record).verify()
+
+        assert error.value.tick == tick + 1
+
+    def it_falls_back_to_periodic_checksums_without_state_hashes(tmp_path: Path) -> None:
+        record = _record(tmp_path)
+        record.tick_hashes.clear()
+        tick, entity, _ = record.actions[1]
+        record.actions[1] = (tick, entity, ())
+
+        with pytest.raises(ReplayDesyncError) as error:
+            Replayer(record).verify()
+
+        assert error.value.tick == min(checksum_tick for checksum_tick in record.checksums if checksum_tick > tick)
+
+    def it_seeks_through_keyframes_to_the_same_state(tmp_path: Path) -> None:
+        record = _record(tmp_path, keyframe_interval=10)
+        replayer = Replayer(record)
+        target = record.final_tick - 3
+
+        from_keyframe = replayer.seek(target)
+        replayer.record.keyframes.clear()
+        from_zero = replayer.seek(target)
+
+        assert from_keyframe.tick == from_zero.tick == target
+        assert world_checksum(from_keyframe.world) == world_checksum(from_zero.world)
+
+    def it_rebuilds_keyframes_for_loaded_replays(tmp_path: Path) -> None:
+        record = ReplayRecord.from_dict(_record(tmp_path).to_dict())
+        replayer = Replayer(record)
+
+        replayer.build_keyframes(10)
+
+        assert sorted(record.keyframes) == list(range(10, record.final_tick + 1, 10))
+        assert replayer.seek(record.final_tick).tick == record.final_tick
+
+    def it_reports_scripts_changed_since_recording(tmp_path: Path) -> None:
+        replayer = Replayer(_record(tmp_path))
+        assert replayer.stale_scripts(tmp_path) == []
+
+        (tmp_path / "brawler.hxc").write_text("END_TURN", encoding="utf-8")
+
+        assert replayer.stale_scripts(tmp_path) == ["brawler.hxc"]
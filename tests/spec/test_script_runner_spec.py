@@ -78,3 +78,33 @@ def describe_script_runner() -> None:
 
         with pytest.raises(RuntimeError):
             runner.execute({"variables": {}})
+
+    def it_treats_end_turn_as_end_of_script() -> None:
+        runner = ScriptRunner()
+        runner.load(
+            "\n".join(
+                [
+                    'ACTION "wait"',
+                    "END_TURN",
+                    'ACTION "unreachable"',
+                ]
+            )
+        )
+        context: dict[str, object] = {"variables": {}, "actions": []}
+
+        runner.execute(context)
+
+        assert context["actions"] == [("wait", ())]
+
+    def it_shares_compiled_programs_between_runners() -> None:
+        program = ScriptRunner().compile('SET "answer" 42')
+        first, second = ScriptRunner(), ScriptRunner()
+        first.load_program(program)
+        second.load_program(program)
+        first_context: dict[str, object] = {"variables": {}}
+        second_context: dict[str, object] = {"variables": {"answer": 0}}
+
+        first.execute(first_context)
+        second.execute(second_context)
+
+        assert first_context["variables"] == second_context["variables"] == {"answer": 42}
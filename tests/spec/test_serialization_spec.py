@@ -0,0 +1,144 @@
+"""Binary save-state specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import json
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+import pytest
+from hexa_core.engine.components import MovementIntentComponent, PathComponent, PositionComponent, ScriptComponent, StatsComponent, TurnComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.serialization import MAGIC, SaveStateError, SaveStateReader, dumps, load_world, register_component_type, save_world
+from hexa_core.engine.world import GameWorld
+
+PREAMBLE = struct.Struct("<6sHI")
+
+
+@dataclass(slots=True)
+class InventoryComponent:
+    items: list[str]
+
+
+register_component_type(InventoryComponent)
+
+
+def _retyped(data: bytes, name: str) -> bytes:
+    """Rewrite the type name of the first component in a save state's schema."""
+    _, version, length = PREAMBLE.unpack_from(data)
+    schema_end = PREAMBLE.size + length
+    schema = json.loads(data[PREAMBLE.size : schema_end])
+    schema["components"][0]["type"] = name
+    encoded = json.dumps(schema).encode("utf-8")
+    header = PREAMBLE.pack(MAGIC, version, len(encoded)) + encoded
+    return header + bytes(-len(header) % 8) + data[schema_end + (-schema_end % 8) :]
+
+
+def _sample_world() -> tuple[GameWorld, int, int]:
+    world = GameWorld()
+    bot = cast(
+        int,
+        world.create_entity(
+            PositionComponent(q=-2, r=5),
+            ScriptComponent(path="assets/scripts/player_default.hxc"),
+            MovementIntentComponent(target=HexCoord(-1, 5)),
+        ),
+    )
+    drone = cast(int, world.create_entity(TurnComponent(turn_counter=900, ready=True), ScriptComponent(path="drone.hxc")))
+    return world, bot, drone
+
+
+def describe_save_state() -> None:
+    def it_round_trips_a_world_through_a_file(tmp_path: Path) -> None:
+        world, bot, drone = _sample_world()
+        path = tmp_path / "state.hxsave"
+        save_world(world, path)
+
+        restored = GameWorld()
+        load_world(restored, path)
+
+        assert restored.component_for_entity(bot, PositionComponent) == PositionComponent(q=-2, r=5)
+        assert restored.component_for_entity(bot, MovementIntentComponent) == MovementIntentComponent(target=HexCoord(-1, 5))
+        assert restored.component_for_entity(drone, ScriptComponent) == ScriptComponent(path="drone.hxc")
+        turn = cast(TurnComponent, restored.component_for_entity(drone, TurnComponent))
+        assert turn.ready is True
+        assert restored.create_entity() == drone + 1
+
+    def it_exposes_columns_lazily_without_copying(tmp_path: Path) -> None:
+        world, bot, _ = _sample_world()
+        path = tmp_path / "state.hxsave"
+        save_world(world, path)
+
+        with SaveStateReader.open(path) as reader:
+            position_type = "hexa_core.engine.components:PositionComponent"
+            assert position_type in reader.component_types
+            q_column = reader.column(position_type, 0)
+            assert isinstance(q_column, memoryview)
+            assert (list(reader.entities(position_type)), list(q_column)) == ([bot], [-2])
+            del q_column
+
+    def it_encodes_other_json_compatible_fields() -> None:
+        world = GameWorld()
+        entity = cast(int, world.create_entity(InventoryComponent(items=["laser", "shield"])))
+
+        reader = SaveStateReader(dumps(world.snapshot()))
+        restored = GameWorld()
+        reader.restore(restored)
+
+        assert restored.component_for_entity(entity, InventoryComponent) == InventoryComponent(items=["laser", "shield"])
+
+    def it_packs_int_array_fields() -> None:
+        world = GameWorld()
+        path = PathComponent.through([HexCoord(1, 0), HexCoord(2, -1)], speed=2)
+        entity = cast(int, world.create_entity(path))
+
+        restored = GameWorld()
+        SaveStateReader(dumps(world.snapshot())).restore(restored)
+
+        assert restored.component_for_entity(entity, PathComponent) == path
+
+    def it_stores_ints_beyond_64_bits_as_json(tmp_path: Path) -> None:
+        world = GameWorld()
+        entity = cast(int, world.create_entity(StatsComponent(health=2**70, speed=3, processor=1)))
+        path = tmp_path / "state.hxsave"
+        save_world(world, path)
+
+        restored = GameWorld()
+        load_world(restored, path)
+
+        assert restored.component_for_entity(entity, StatsComponent) == StatsComponent(health=2**70, speed=3, processor=1)
+
+    @pytest.mark.parametrize("name", ["os:system", "hexa_core.engine.world:GameWorld", "hexa_core.engine.missing:Nothing"])
+    def it_only_restores_registered_component_types(name: str) -> None:
+        world = GameWorld()
+        world.create_entity(PositionComponent(q=0, r=0))
+        reader = SaveStateReader(_retyped(dumps(world.snapshot()), name))
+
+        with pytest.raises(SaveStateError, match="Unknown component type"):
+            reader.restore(GameWorld())
+
+    def it_rejects_foreign_buffers() -> None:
+        with pytest.raises(SaveStateError):
+            SaveStateReader(b"not a save state at all")
+
+    @pytest.mark.parametrize(
+        ("mutate", "message"),
+        [
+            (lambda data: data[:4], "truncated"),
+            (lambda data: b"NOTSAV" + data[6:], "Not a Hexa-Core save state"),
+            (lambda data: data[:6] + b"\x09\x00" + data[8:], "Unsupported save state version 9"),
+            (lambda data: data[:12] + b"[" + data[13:], "schema is corrupt"),
+            (lambda data: PREAMBLE.pack(MAGIC, 1, 2) + b"[]", "schema is corrupt"),
+        ],
+    )
+    def it_rejects_damaged_files(tmp_path: Path, mutate: Callable[[bytes], bytes], message: str) -> None:
+        world, _, _ = _sample_world()
+        path = tmp_path / "damaged.hxsave"
+        path.write_bytes(mutate(dumps(world.snapshot())))
+
+        with pytest.raises(SaveStateError, match=message):
+            SaveStateReader.open(path)
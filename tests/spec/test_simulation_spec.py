@@ -0,0 +1,124 @@
+"""Headless simulation specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.components import PathComponent, PositionComponent
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch, main, run_match
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+BRAWLER_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+        "END_TURN",
+    ]
+)
+
+
+def _duel_level() -> LevelData:
+    def bot(name: str, q: int, health: int, speed: int) -> LevelEntity:
+        return LevelEntity(
+            name=name,
+            components={
+                "Position": {"q": q, "r": 0},
+                "Stats": {"health": health, "speed": speed, "processor": 10},
+                "Script": {"path": "brawler.hxc"},
+            },
+        )
+
+    return LevelData(
+        name="Duel",
+        grid_size=LevelGridSize(width=15, height=15),
+        tiles=[],
+        entities=[bot("Tank", 0, 100, 250), bot("Scout", 6, 40, 250)],
+    )
+
+
+def describe_headless_match() -> None:
+    def it_runs_scripted_bots_until_one_survives() -> None:
+        programs = {"brawler.hxc": ScriptRunner().compile(BRAWLER_SCRIPT)}
+
+        result = HeadlessMatch(_duel_level(), programs=programs).run()
+
+        assert result.winner == "Tank"
+        assert result.survivors == ("Tank",)
+        assert 0 < result.ticks < 1000
+        assert result.ticks_per_second > 0
+
+    def it_is_deterministic_across_runs() -> None:
+        programs = {"brawler.hxc": ScriptRunner().compile(BRAWLER_SCRIPT)}
+
+        first = HeadlessMatch(_duel_level(), programs=programs, seed=7).run()
+        second = HeadlessMatch(_duel_level(), programs=programs, seed=7).run()
+
+        assert (first.ticks, first.winner) == (second.ticks, second.winner)
+
+    def it_stops_at_the_tick_limit_when_nobody_wins() -> None:
+        result = run_match(REPO_ROOT / "assets/maps/level_01.json", script_root=REPO_ROOT, max_ticks=50)
+
+        assert result.ticks == 50
+        assert result.winner is None
+        assert result.survivors == ("Player", "Enemy Drone")
+
+
+def describe_simulation_cli() -> None:
+    def it_reports_results_as_json(capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code = main([str(REPO_ROOT / "assets/maps/level_01.json"), "--script-root", str(REPO_ROOT), "--max-ticks", "20", "--json"])
+
+        report = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert report["ticks"] == 20
+        assert report["ticks_per_second"] > 0
+
+
+def _walker_match(waypoints: str) -> HeadlessMatch:
+    walker = LevelEntity(
+        name="Walker",
+        components={
+            "Position": {"q": 0, "r": 0},
+            "Stats": {"health": 10, "speed": 1000, "processor": 10},
+            "Script": {"path": "walker.hxc"},
+        },
+    )
+    idler = LevelEntity(name="Idler", components={"Position": {"q": 9, "r": 9}, "Stats": {"health": 10, "speed": 1, "processor": 10}})
+    level = LevelData(name="Walk", grid_size=LevelGridSize(width=15, height=15), tiles=[], entities=[walker, idler])
+    programs = {"walker.hxc": ScriptRunner().compile(f'IF tick > 1 GOTO "done"\nACTION "move" {waypoints}\nLABEL "done"\nEND_TURN')}
+    return HeadlessMatch(level, programs=programs, max_ticks=6)
+
+
+def describe_scripted_paths() -> None:
+    def it_walks_a_multi_waypoint_move_without_rerunning_the_script() -> None:
+        match = _walker_match("2 0 2 2")
+
+        match.step()
+        assert match.world.component_for_entity(1, PathComponent).remaining == 4
+        match.run()
+
+        position = match.world.component_for_entity(1, PositionComponent)
+        assert (position.q, position.r) == (2, 2)
+
+    def it_walks_through_negative_axial_coordinates() -> None:
+        match = _walker_match("-2 0 -2 -2")
+
+        match.run()
+
+        position = match.world.component_for_entity(1, PositionComponent)
+        assert (position.q, position.r) == (-2, -2)
+
+    def it_ignores_multi_waypoint_moves_beyond_the_path_limit() -> None:
+        match = _walker_match("1000000 0 0 0")
+
+        match.step()
+
+        assert match.world.try_component(1, PathComponent) is None
@@ -0,0 +1,63 @@
+"""World snapshot specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+from typing import cast
+
+from hexa_core.engine.components import MovementIntentComponent, PositionComponent, StatsComponent, TurnComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.world import GameWorld
+
+
+def describe_world_snapshot() -> None:
+    def it_restores_mutated_components_and_deleted_entities() -> None:
+        world = GameWorld()
+        bot = cast(int, world.create_entity(PositionComponent(q=1, r=2), StatsComponent(health=30, speed=5, processor=5)))
+        drone = cast(int, world.create_entity(TurnComponent(turn_counter=7, ready=True)))
+
+        snapshot = world.snapshot()
+
+        position = cast(PositionComponent, world.component_for_entity(bot, PositionComponent))
+        position.q = 99
+        world.delete_entity(drone, immediate=True)
+
+        world.restore(snapshot)
+
+        restored = cast(PositionComponent, world.component_for_entity(bot, PositionComponent))
+        assert (restored.q, restored.r) == (1, 2)
+        assert restored is not position
+        turn = cast(TurnComponent, world.component_for_entity(drone, TurnComponent))
+        assert turn.ready is True
+        assert turn.turn_counter == 7
+
+    def it_rewinds_entity_ids_and_drops_entities_created_later() -> None:
+        world = GameWorld()
+        world.create_entity(PositionComponent(q=0, r=0))
+        snapshot = world.snapshot()
+
+        late = cast(int, world.create_entity(PositionComponent(q=5, r=5)))
+        world.restore(snapshot)
+
+        assert [entity for entity, _ in world.get_component(PositionComponent)] == [1]
+        assert world.create_entity() == late
+
+    def it_shares_immutable_field_values_and_packs_integer_columns() -> None:
+        world = GameWorld()
+        target = HexCoord(3, -1)
+        for index in range(3):
+            world.create_entity(PositionComponent(q=index, r=0), MovementIntentComponent(target=target))
+
+        snapshot = world.snapshot()
+
+        columns = {column.component_type: column for column in snapshot.columns}
+        assert columns[PositionComponent].fields[0].typecode == "q"  # type: ignore[union-attr]
+        assert all(value is target for value in columns[MovementIntentComponent].fields[0])
+        assert snapshot.entity_count == 3
+
+    def it_excludes_entities_pending_deletion() -> None:
+        world = GameWorld()
+        doomed = cast(int, world.create_entity(PositionComponent(q=0, r=0)))
+        world.delete_entity(doomed)
+
+        assert world.snapshot().entity_count == 0
@@ -0,0 +1,121 @@
+"""Incremental world state hash specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+from typing import cast
+
+from hexa_core.engine.components import MovementIntentComponent, PositionComponent, StatsComponent, TurnComponent
+from hexa_core.engine.datatypes import HexCoord
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.script_runner import ScriptRunner
+from hexa_core.engine.simulation import HeadlessMatch
+from hexa_core.engine.state_hash import StateHash, component_key
+from hexa_core.engine.world import GameWorld
+
+SKIRMISH_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+    ]
+)
+
+
+def _skirmish(bots: int = 12) -> HeadlessMatch:
+    entities = [
+        LevelEntity(
+            name=f"bot-{index}",
+            components={
+                "Position": {"q": (index % 4) * 3, "r": (index // 4) * 3},
+                "Stats": {"health": 30, "speed": 100 + index * 7, "processor": 10},
+                "Script": {"path": "skirmish.hxc"},
+            },
+        )
+        for index in range(bots)
+    ]
+    level = LevelData(name="Skirmish", grid_size=LevelGridSize(width=20, height=20), tiles=[], entities=entities)
+    return HeadlessMatch(level, programs={"skirmish.hxc": ScriptRunner().compile(SKIRMISH_SCRIPT)}, max_ticks=50)
+
+
+def describe_state_hash() -> None:
+    def it_is_order_independent_and_self_inverse() -> None:
+        first, second = StateHash(), StateHash()
+        position, stats = PositionComponent(q=1, r=2), StatsComponent(health=5, speed=1, processor=1)
+
+        first.toggle(1, position)
+        first.toggle(2, stats)
+        second.toggle(2, stats)
+        second.toggle(1, position)
+
+        assert first.value == second.value != 0
+        first.toggle(1, position)
+        first.toggle(2, stats)
+        assert first.value == 0
+
+    def it_distinguishes_entities_and_ignores_untracked_components() -> None:
+        position = PositionComponent(q=1, r=2)
+
+        assert component_key(1, position) != component_key(2, position)
+        assert component_key(1, MovementIntentComponent(target=HexCoord(0, 0))) == 0
+
+    def it_gives_negative_coordinates_distinct_keys() -> None:
+        # hash(-1) == hash(-2) in CPython, so keys must not be built from hash().
+        keys = {component_key(1, PositionComponent(q=q, r=5)) for q in (-3, -2, -1, 0, 1)}
+        moved = StateHash()
+        moved.toggle(1, PositionComponent(q=-2, r=5))
+        before = moved.value
+        moved.toggle(1, PositionComponent(q=-2, r=5))
+        moved.toggle(1, PositionComponent(q=-1, r=5))
+
+        assert len(keys) == 5
+        assert moved.value != before
+        assert component_key(1, StatsComponent(health=2**70, speed=1, processor=1)) != component_key(1, StatsComponent(health=0, speed=1, processor=1))
+
+
+def describe_world_state_hash() -> None:
+    def it_tracks_structural_changes_through_the_command_buffer() -> None:
+        world = GameWorld()
+        state_hash = world.enable_state_hash()
+        entity = cast(int, world.create_entity(PositionComponent(q=0, r=0)))
+        world.rehash()
+
+        world.command_buffer.add_component(entity, PositionComponent(q=4, r=4))
+        world.command_buffer.add_component(entity, TurnComponent(turn_counter=7))
+        world.command_buffer.create_entity(StatsComponent(health=3, speed=1, processor=1))
+        world.apply_commands()
+        incremental = state_hash.value
+
+        assert incremental == world.rehash()
+
+        world.command_buffer.delete_entity(entity)
+        world.apply_commands()
+        assert state_hash.value == world.rehash() != incremental
+
+    def it_is_recomputed_on_restore() -> None:
+        world = GameWorld()
+        state_hash = world.enable_state_hash()
+        entity = cast(int, world.create_entity(PositionComponent(q=0, r=0)))
+        before = world.rehash()
+        snapshot = world.snapshot()
+
+        cast(PositionComponent, world.component_for_entity(entity, PositionComponent)).q = 9
+        world.restore(snapshot)
+
+        assert state_hash.value == before
+
+
+def describe_match_state_hash() -> None:
+    def it_matches_a_full_rehash_on_every_tick() -> None:
+        match = _skirmish()
+
+        while match.step():
+            incremental = match.state_hash.value
+            assert incremental == match.world.rehash()
+
+    def it_is_identical_across_deterministic_runs() -> None:
+        first, second = _skirmish().run(), _skirmish().run()
+
+        assert first.state_hash == second.state_hash != 0
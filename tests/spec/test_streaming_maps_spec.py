@@ -0,0 +1,119 @@
+"""Streaming JSON map loader specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from hexa_core.engine.maps import LevelEntity, MapLoader
+from hexa_core.engine.streaming_maps import CompactLevel, MapSchemaError, StreamingMapLoader
+
+MAP = {
+    "name": "Crossing",
+    "grid_size": {"width": 40, "height": 30},
+    "tiles": [{"type": ("plain", "water", "wall")[(q + r) % 3], "q": q, "r": r} for q in range(40) for r in range(30)],
+    "entities": [
+        {"name": "Scout", "components": {"Position": {"q": 0, "r": 0}, "Script": {"path": "scout.hxc"}}},
+        {"name": "Wall-" + "x" * 500},
+        # Literals, fractions and \u escapes (json.dumps escapes non-ASCII) split by small chunks.
+        {"name": "Dr\u00f6ne \U0001f916", "components": {"Flags": {"armed": True, "cloaked": False, "owner": None, "ratio": -1.5e-3}}},
+    ],
+}
+
+
+class CountingStream(io.StringIO):
+    """Counts ``read`` calls so specs can check how much of a map was consumed."""
+
+    def __init__(self: CountingStream, text: str) -> None:
+        super().__init__(text)
+        self.reads = 0
+
+    def read(self: CountingStream, size: int | None = -1, /) -> str:
+        self.reads += 1
+        return super().read(size)
+
+
+def _load(document: object, chunk_size: int = 64) -> CompactLevel:
+    return StreamingMapLoader(chunk_size).load_stream(io.StringIO(document if isinstance(document, str) else json.dumps(document)))
+
+
+def describe_streaming_map_loader() -> None:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 7, 64, 1 << 16])
+    def it_matches_map_loader_for_any_chunk_size(tmp_path: Path, chunk_size: int) -> None:
+        path = tmp_path / "crossing.json"
+        path.write_text(json.dumps(MAP, indent=1), encoding="utf-8")
+
+        level = StreamingMapLoader(chunk_size).load(path)
+
+        assert level.to_level() == MapLoader().load(path)
+        assert level.palette == ["plain", "water", "wall"]
+        assert (level.tile_types.typecode, level.tile_q.typecode, level.tile_count) == ("B", "i", 1200)
+
+    def it_accepts_fields_in_any_order_and_skips_unknown_ones() -> None:
+        document = '{"tiles": [ ], "version": {"major": [1, {"minor": 2}]}, "entities": [{"name": "Scout"}], "grid_size": {"width": 1, "height": 1}, "name": "Tiny"}'
+
+        level = _load(document, chunk_size=5)
+
+        assert level.name == "Tiny"
+        assert level.entities == [LevelEntity("Scout", {})]
+        assert level.tile_count == 0
+
+    def it_widens_tile_types_for_large_palettes() -> None:
+        tiles = [{"type": f"kind-{index}", "q": index, "r": 0} for index in range(300)]
+
+        level = _load({"name": "Many", "grid_size": {"width": 300, "height": 1}, "tiles": tiles})
+
+        assert level.tile_types.typecode == "H"
+        assert list(level.tiles())[-1] == ("kind-299", 299, 0)
+
+    def it_raises_for_missing_files(tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            StreamingMapLoader().load(tmp_path / "missing.json")
+
+
+def describe_schema_errors() -> None:
+    @pytest.mark.parametrize(
+        ("tile", "message"),
+        [
+            ({"type": "plain", "q": 0}, r"tiles\[1\] is missing 'r'"),
+            ({"type": "plain", "q": "0", "r": 0}, r"tiles\[1\]\.q must be an int, got str"),
+            ({"type": "plain", "q": True, "r": 0}, r"tiles\[1\]\.q must be an int, got bool"),
+            ({"type": 3, "q": 0, "r": 0}, r"tiles\[1\]\.type must be a str, got int"),
+            ({"type": "plain", "q": 2**40, "r": 0}, r"tiles\[1\] coordinates do not fit in 32 bits"),
+            (["plain", 0, 0], r"tiles\[1\] must be an object, got list"),
+        ],
+    )
+    def it_names_the_first_invalid_tile(tile: object, message: str) -> None:
+        tiles = [{"type": "plain", "q": 0, "r": 0}, tile, {"type": "plain", "q": 1, "r": 0}]
+
+        with pytest.raises(MapSchemaError, match=message):
+            _load({"name": "Bad", "grid_size": {"width": 2, "height": 1}, "tiles": tiles})
+
+    @pytest.mark.parametrize(
+        ("document", "message"),
+        [
+            ({"grid_size": {"width": 1, "height": 1}}, "Map is missing 'name'"),
+            ({"name": "Bad", "grid_size": {"width": 1}}, "grid_size is missing 'height'"),
+            ({"name": "Bad", "grid_size": {"width": 1, "height": 1}, "entities": [{"components": {}}]}, r"entities\[0\] is missing 'name'"),
+            ({"name": "Bad", "grid_size": {"width": 1, "height": 1}, "entities": [{"name": "x", "components": []}]}, r"entities\[0\]\.components must be an object, got list"),
+            ('{"name": "Bad", "tiles": [{"type": "plain" "q": 0}]}', r"Invalid JSON \(Expecting ',' delimiter\) at character 43"),
+            ('{"name": "Bad"} {}', "Unexpected data after the map at character 16"),
+            ('["not", "a", "map"]', "Expected '{' at character 0"),
+        ],
+    )
+    def it_rejects_malformed_documents(document: object, message: str) -> None:
+        with pytest.raises(MapSchemaError, match=message):
+            _load(document, chunk_size=8)
+
+    def it_fails_before_reading_the_rest_of_the_file() -> None:
+        tiles = [{"type": "plain", "q": index, "r": 0} for index in range(10_000)]
+        tiles[2] = {"type": "plain", "q": 2}
+        stream = CountingStream(json.dumps({"name": "Bad", "grid_size": {"width": 10_000, "height": 1}, "tiles": tiles}))
+
+        with pytest.raises(MapSchemaError, match=r"tiles\[2\] is missing 'r'"):
+            StreamingMapLoader(chunk_size=256).load_stream(stream)
+
+        assert stream.reads < 5
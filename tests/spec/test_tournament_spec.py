@@ -0,0 +1,122 @@
+"""Tournament runner specification tests."""
+
+# ruff: noqa: S101
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from hexa_core.engine.maps import LevelData, LevelEntity, LevelGridSize
+from hexa_core.engine.tournament import Tournament, assign_scripts, derive_seed, round_robin
+
+BRAWLER_SCRIPT = "\n".join(
+    [
+        'IF target_distance <= 1 GOTO "strike"',
+        'ACTION "move" target_q target_r',
+        "END_TURN",
+        'LABEL "strike"',
+        'ACTION "attack" target_id',
+        "END_TURN",
+    ]
+)
+IDLE_SCRIPT = "END_TURN"
+
+
+def _write_duel(tmp_path: Path) -> tuple[Path, Path, Path]:
+    def bot(name: str, q: int) -> dict[str, object]:
+        return {
+            "name": name,
+            "components": {
+                "Position": {"q": q, "r": 0},
+                "Stats": {"health": 60, "speed": 250, "processor": 10},
+                "Script": {"path": "placeholder.hxc"},
+            },
+        }
+
+    map_path = tmp_path / "duel.json"
+    map_path.write_text(
+        json.dumps({"name": "Duel", "grid_size": {"width": 15, "height": 15}, "entities": [bot("North", 0), bot("South", 4)]}),
+        encoding="utf-8",
+    )
+    brawler = tmp_path / "brawler.hxc"
+    brawler.write_text(BRAWLER_SCRIPT, encoding="utf-8")
+    idle = tmp_path / "idle.hxc"
+    idle.write_text(IDLE_SCRIPT, encoding="utf-8")
+    return map_path, brawler, idle
+
+
+def describe_round_robin() -> None:
+    def it_pairs_every_script_from_both_sides_on_every_map() -> None:
+        specs = round_robin(["a.json", "b.json"], ["x", "y", "z"])
+
+        assert len(specs) == 12
+        assert [spec.index for spec in specs] == list(range(12))
+        assert ("a.json", "x", "y") in {(spec.map_path, spec.player, spec.opponent) for spec in specs}
+        assert all(spec.player != spec.opponent for spec in specs)
+
+    def it_derives_stable_seeds_per_pairing() -> None:
+        first = round_robin(["a.json"], ["x", "y"], base_seed=3)
+        second = round_robin(["a.json"], ["x", "y"], base_seed=3)
+
+        assert [spec.seed for spec in first] == [spec.seed for spec in second]
+        assert first[0].seed != first[1].seed
+        assert derive_seed(3, "a.json", "x", "y") == first[0].seed
+        assert derive_seed(4, "a.json", "x", "y") != first[0].seed
+
+
+def describe_assign_scripts() -> None:
+    def it_gives_the_first_scripted_entity_the_player_script() -> None:
+        level = LevelData(
+            name="Trio",
+            grid_size=LevelGridSize(width=5, height=5),
+            tiles=[],
+            entities=[
+                LevelEntity(name="Wall", components={"Position": {"q": 0, "r": 0}}),
+                LevelEntity(name="One", components={"Script": {"path": "old.hxc"}}),
+                LevelEntity(name="Two", components={"Script": {"path": "old.hxc"}}),
+            ],
+        )
+
+        assigned = assign_scripts(level, "player.hxc", "opponent.hxc")
+
+        assert [entity.components.get("Script") for entity in assigned.entities] == [
+            None,
+            {"path": "player.hxc"},
+            {"path": "opponent.hxc"},
+        ]
+        assert level.entities[1].components["Script"] == {"path": "old.hxc"}
+
+
+def describe_tournament() -> None:
+    def it_scores_the_brawler_above_the_idle_bot(tmp_path: Path) -> None:
+        map_path, brawler, idle = _write_duel(tmp_path)
+
+        report = Tournament([map_path], [brawler, idle], workers=1, max_ticks=500).run()
+
+        assert [outcome.winning_script for outcome in report.outcomes] == [str(brawler), str(brawler)]
+        assert report.standings[str(brawler)].wins == 2
+        assert report.standings[str(idle)].losses == 2
+        assert report.matches_per_second > 0
+
+    def it_matches_serial_results_across_worker_processes(tmp_path: Path) -> None:
+        map_path, brawler, idle = _write_duel(tmp_path)
+
+        serial = Tournament([map_path], [brawler, idle], workers=1, max_ticks=500).run()
+        parallel = Tournament([map_path], [brawler, idle], workers=2, max_ticks=500).run()
+
+        def summarize(outcomes: list) -> list[tuple[object, ...]]:
+            return [(outcome.spec, outcome.winning_script, outcome.result.ticks) for outcome in outcomes]
+
+        assert summarize(parallel.outcomes) == summarize(serial.outcomes)
+        assert parallel.workers == 2
+
+    def it_reuses_a_caller_owned_pool_across_runs(tmp_path: Path) -> None:
+        map_path, brawler, idle = _write_duel(tmp_path)
+        tournament = Tournament([map_path], [brawler, idle], workers=2, max_ticks=500)
+
+        with tournament.executor() as executor:
+            first = tournament.run(executor)
+            second = tournament.run(executor)
+
+        assert [outcome.winning_script for outcome in first.outcomes] == [str(brawler), str(brawler)]
+        assert [outcome.result.ticks for outcome in second.outcomes] == [outcome.result.ticks for outcome in first.outcomes]